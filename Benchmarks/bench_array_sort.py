@@ -0,0 +1,66 @@
+"""
+Compara ``array_list.hybrid_sort`` (con ``sort_crit`` y con ``key=``) con
+``merge_sort``, ``quick_sort`` y ``shell_sort`` de ``array_list`` sobre
+entradas aleatorias, ordenadas, invertidas y con pocos valores distintos.
+
+``quick_sort`` usa el último elemento como pivote, así que con entradas
+ordenadas o invertidas la recursión llega al límite de Python; en ese caso
+se reporta ``RecursionError``.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_array_sort [num_elementos]
+"""
+
+import random
+import sys
+import time
+
+from DataStructures.List import array_list as al
+
+
+def make_inputs(n, seed=42):
+    rnd = random.Random(seed)
+    data = [rnd.uniform(0, 40) for _ in range(n)]
+    return (("aleatorio", data),
+            ("ordenado", sorted(data)),
+            ("invertido", sorted(data, reverse=True)),
+            ("pocos distintos", [rnd.randrange(5) for _ in range(n)]))
+
+
+def less(a, b):
+    return a < b
+
+
+def timed(sort, data):
+    lst = al.new_list()
+    for x in data:
+        al.add_last(lst, x)
+    start = time.perf_counter()
+    try:
+        sort(lst)
+    except RecursionError:
+        return None
+    elapsed = time.perf_counter() - start
+    assert lst["elements"] == sorted(data)
+    return elapsed
+
+
+def main(n=20000):
+    routines = (("hybrid_sort(sort_crit)", lambda lst: al.hybrid_sort(lst, less)),
+                ("hybrid_sort(key=)", lambda lst: al.hybrid_sort(lst, key=float)),
+                ("merge_sort", lambda lst: al.merge_sort(lst, less)),
+                ("quick_sort", lambda lst: al.quick_sort(lst, less)),
+                ("shell_sort", lambda lst: al.shell_sort(lst, less)))
+    inputs = make_inputs(n)
+    print(f"{'ordenamiento':<24}" + "".join(f"{name:>17}" for name, _ in inputs))
+    for name, sort in routines:
+        cells = []
+        for _, data in inputs:
+            elapsed = timed(sort, data)
+            cells.append("RecursionError" if elapsed is None else f"{elapsed:.3f} s")
+        print(f"{name:<24}" + "".join(f"{cell:>17}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,68 @@
+"""
+Compara la tabla ``map_linear_probing`` (un ``map_entry`` por posición) con
+``map_flat_probing`` (arreglos paralelos) y ``map_robin_hood``: memoria por
+entrada, número de búsquedas por segundo y sondeo promedio (``stats``), con
+llaves del estilo de los vértices del grafo (``"75009-10"``).
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_map_probing [num_llaves]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from DataStructures.Map import map_linear_probing as lp
+from DataStructures.Map import map_flat_probing as fp
+from DataStructures.Map import map_robin_hood as rh
+
+
+def make_keys(n):
+    return [f"{75000 + i // 7}-{i % 97}" for i in range(n)]
+
+
+def build(module, keys):
+    my_map = module.new_map(len(keys), 0.5)
+    for i, key in enumerate(keys):
+        my_map = module.put(my_map, key, i)
+    return my_map
+
+
+def measure_memory(module, keys):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    my_map = build(module, keys)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return my_map, (end - start) / len(keys)
+
+
+def measure_gets(module, my_map, keys, rounds=3):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for key in keys:
+            module.get(my_map, key)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(keys) / best
+
+
+def main(n=14000):
+    keys = make_keys(n)
+    missing = [key + "x" for key in keys]
+    print(f"{'tabla':<22}{'bytes/entrada':>15}{'gets/s (hit)':>16}"
+          f"{'gets/s (miss)':>16}{'sondeo prom.':>14}")
+    for name, module in (("map_linear_probing", lp), ("map_flat_probing", fp),
+                         ("map_robin_hood", rh)):
+        my_map, per_entry = measure_memory(module, keys)
+        hits = measure_gets(module, my_map, keys)
+        misses = measure_gets(module, my_map, missing)
+        probe = module.stats(my_map)['avg_probe_length']
+        print(f"{name:<22}{per_entry:>15.1f}{hits:>16,.0f}{misses:>16,.0f}"
+              f"{probe:>14.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 14000)
@@ -0,0 +1,89 @@
+"""
+Mide el costo de ``map_functions.next_prime`` y de crear mapas vacíos como
+los que crea ``vertex.new_vertex`` (``new_map(0, 0.5)``), comparando la
+versión actual (tabla precalculada + Miller-Rabin) con la búsqueda por
+división de prueba que se usaba antes.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_next_prime [num_mapas]
+"""
+
+import math
+import sys
+import time
+
+from DataStructures.Map import map_functions as mf
+from DataStructures.Map import map_linear_probing as lp
+
+
+def legacy_is_prime(n):
+    if n <= 1:
+        return False
+    if n <= 3:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    for i in range(5, int(math.sqrt(n) + 1), 6):
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+    return True
+
+
+def legacy_next_prime(n):
+    next_p = int(n)
+    while True:
+        next_p += 1
+        if legacy_is_prime(next_p):
+            return next_p
+
+
+def timed(func, *args, rounds=5):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def create_maps(sizes):
+    for num_elements in sizes:
+        lp.new_map(num_elements, 0.5)
+
+
+def doubling_sequence(prime_func):
+    # Capacidades que recorre un mapa que crece desde 1 hasta ~10**9
+    capacity = 1
+    while capacity < 10 ** 9:
+        capacity = prime_func(2 * capacity)
+
+
+def main(n=14000):
+    print(f"{'medición':<36}{'antes (s)':>12}{'ahora (s)':>12}")
+
+    for label, sizes in ((f"{n} x new_map(0, 0.5)", [0] * n),
+                         (f"{n} x new_map(0..999, 0.5)",
+                          [i % 1000 for i in range(n)])):
+        current = mf.next_prime
+        mf.next_prime = legacy_next_prime
+        try:
+            before = timed(create_maps, sizes)
+        finally:
+            mf.next_prime = current
+        after = timed(create_maps, sizes)
+        print(f"{label:<36}{before:>12.4f}{after:>12.4f}")
+
+    capacities = [int(i / 0.5) for i in range(0, n)]
+    before = timed(lambda: [legacy_next_prime(c) for c in capacities])
+    after = timed(lambda: [mf.next_prime(c) for c in capacities])
+    print(f"{f'next_prime de 0 a {2 * n}':<36}{before:>12.4f}{after:>12.4f}")
+
+    before = timed(doubling_sequence, legacy_next_prime)
+    after = timed(doubling_sequence, mf.next_prime)
+    print(f"{'rehash por duplicación hasta 1e9':<36}{before:>12.4f}{after:>12.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 14000)
@@ -0,0 +1,83 @@
+"""
+Memoria por elemento de los nodos con ``__slots__`` frente a los
+diccionarios que se usaban antes, en estructuras de un millón de elementos:
+
+- un BST armado con ``from_sorted`` (nodos ``bst_node``),
+- una ``single_linked_list`` llenada con ``add_last``,
+- un montículo de ``priority_queue`` llenado con ``insert``.
+
+La columna "dict" arma la misma cantidad de nodos como los diccionarios
+anteriores, enlazados igual, para comparar con la estructura actual.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_node_memory [num_elementos]
+"""
+
+import sys
+import tracemalloc
+
+from DataStructures.List import single_linked_list as sll
+from DataStructures.Priority_queue import priority_queue as pq
+from DataStructures.Tree import binary_search_tree as bst
+
+
+def measure(build, n):
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    structure = build(n)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return (end - start) / n
+
+
+def bst_slotted(n):
+    return bst.from_sorted((i, i) for i in range(n))
+
+
+def bst_dicts(n):
+    nodes = [{"key": i, "value": i, "size": 1, "left": None, "right": None,
+              "type": "BST"} for i in range(n)]
+    for i in range(1, n):
+        nodes[i - 1]["right"] = nodes[i]
+    return nodes[0] if nodes else None
+
+
+def sll_slotted(n):
+    lst = sll.new_list()
+    for i in range(n):
+        sll.add_last(lst, i)
+    return lst
+
+
+def sll_dicts(n):
+    first = None
+    for i in range(n - 1, -1, -1):
+        first = {"info": i, "next": first}
+    return first
+
+
+def heap_slotted(n):
+    heap = pq.new_heap()
+    for i in range(n):
+        pq.insert(heap, i, i)
+    return heap
+
+
+def heap_dicts(n):
+    return [{"key": i, "value": i} for i in range(n)]
+
+
+def main(n=1_000_000):
+    print(f"{'estructura':<22}{'dict (B/elem)':>16}{'slots (B/elem)':>16}")
+    for name, dicts, slotted in (("binary_search_tree", bst_dicts, bst_slotted),
+                                 ("single_linked_list", sll_dicts, sll_slotted),
+                                 ("priority_queue", heap_dicts, heap_slotted)):
+        before = measure(dicts, n)
+        after = measure(slotted, n)
+        print(f"{name:<22}{before:>16.1f}{after:>16.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,52 @@
+"""
+Mide el costo por operación de ``enqueue`` y ``dequeue`` de ``queue`` con
+cada estructura: ``RING_BUFFER`` (buffer circular, la de por defecto),
+``SINGLE_LINKED`` y ``ARRAY_LIST``.
+
+Se encolan ``n`` elementos y luego se desencolan todos, para varios ``n``.
+Con el buffer circular el tiempo por operación se mantiene constante al
+crecer ``n``; con ``ARRAY_LIST`` cada ``dequeue`` corre todos los
+elementos, así que solo se mide hasta ``ARRAY_LIST_LIMIT`` elementos.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_queue [n_max]
+"""
+
+import sys
+import time
+
+from DataStructures.Queue import queue
+
+ARRAY_LIST_LIMIT = 100_000
+
+
+def per_operation(module, n):
+    my_queue = queue.new_queue(module=module)
+    start = time.perf_counter()
+    for i in range(n):
+        queue.enqueue(my_queue, i)
+    middle = time.perf_counter()
+    for _ in range(n):
+        queue.dequeue(my_queue)
+    end = time.perf_counter()
+    return (middle - start) / n * 1e9, (end - middle) / n * 1e9
+
+
+def main(n_max=1_000_000):
+    sizes = []
+    n = 1000
+    while n <= n_max:
+        sizes.append(n)
+        n *= 10
+    print(f"{'estructura':<15}{'n':>10}{'enqueue (ns/op)':>18}{'dequeue (ns/op)':>18}")
+    for module in ("RING_BUFFER", "SINGLE_LINKED", "ARRAY_LIST"):
+        for n in sizes:
+            if module == "ARRAY_LIST" and n > ARRAY_LIST_LIMIT:
+                continue
+            enq, deq = per_operation(module, n)
+            print(f"{module:<15}{n:>10}{enq:>18.0f}{deq:>18.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
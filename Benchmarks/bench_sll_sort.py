@@ -0,0 +1,93 @@
+"""
+Compara el ``merge_sort`` de ``single_linked_list`` (de abajo hacia arriba,
+reenlazando nodos) con los demás ordenamientos de la lista y con el merge
+sort anterior, que copiaba cada mitad en una sublista nueva.
+
+Los registros imitan las rutas de bus del laboratorio y se ordenan por
+``Distance``. Los ordenamientos que acceden por posición (``get_element``
+cuesta O(n)) se miden con menos registros, porque con 100k no terminan en
+un tiempo razonable.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_sll_sort [num_registros]
+"""
+
+import random
+import sys
+import time
+
+from DataStructures.List import single_linked_list as sll
+
+
+def make_records(n, seed=42):
+    rnd = random.Random(seed)
+    return [{"ServiceNo": str(rnd.randrange(1, 400)),
+             "Direction": rnd.choice("12"),
+             "BusStopCode": str(rnd.randrange(10000, 99999)),
+             "Distance": round(rnd.uniform(0, 40), 1)}
+            for _ in range(n)]
+
+
+def by_distance(record_1, record_2):
+    return record_1["Distance"] < record_2["Distance"]
+
+
+def legacy_merge_sort(lst, sort_crit):
+    # Merge sort anterior: copia cada mitad con sub_list y mezcla
+    # escribiendo sobre los nodos de la lista original.
+    list_size = sll.size(lst)
+    if list_size <= 1:
+        return lst
+    mid = list_size // 2
+    left_lt = sll.sub_list(lst, 1, mid)
+    right_lt = sll.sub_list(lst, mid + 1, list_size - mid)
+    legacy_merge_sort(left_lt, sort_crit)
+    legacy_merge_sort(right_lt, sort_crit)
+    target = lst["first"]
+    left = left_lt["first"]
+    right = right_lt["first"]
+    while left is not None and right is not None:
+        if sort_crit(right.info, left.info):
+            target.info = right.info
+            right = right.next
+        else:
+            target.info = left.info
+            left = left.next
+        target = target.next
+    rest = left if left is not None else right
+    while rest is not None:
+        target.info = rest.info
+        rest = rest.next
+        target = target.next
+    return lst
+
+
+def timed(sort, records):
+    lst = sll.new_list()
+    for record in records:
+        sll.add_last(lst, record)
+    start = time.perf_counter()
+    sort(lst, by_distance)
+    elapsed = time.perf_counter() - start
+    result = [r["Distance"] for r in sll.iterator(lst)]
+    assert result == sorted(result)
+    return elapsed
+
+
+def main(n=100_000):
+    small = min(n, 1000)
+    routines = (("merge_sort (reenlaza)", sll.merge_sort, n),
+                ("merge_sort anterior", legacy_merge_sort, n),
+                ("insertion_sort", sll.insertion_sort, small * 5),
+                ("shell_sort", sll.shell_sort, small),
+                ("quick_sort", sll.quick_sort, small),
+                ("selection_sort", sll.selection_sort, small // 4))
+    print(f"{'ordenamiento':<24}{'registros':>10}{'segundos':>12}")
+    for name, sort, size in routines:
+        elapsed = timed(sort, make_records(size))
+        print(f"{name:<24}{size:>10}{elapsed:>12.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,49 @@
+"""
+Mide el costo por operación de ``push`` y ``pop`` de ``stack`` con cada
+estructura: ``ARRAY_LIST`` (la de por defecto) y ``SINGLE_LINKED``.
+
+En ``SINGLE_LINKED`` cada ``pop`` recorre la cadena para encontrar el nuevo
+tope, así que solo se mide hasta ``LINKED_LIMIT`` elementos.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_stack [n_max]
+"""
+
+import sys
+import time
+
+from DataStructures.Stack import stack
+
+LINKED_LIMIT = 10_000
+
+
+def per_operation(module, n):
+    my_stack = stack.new_stack(module=module)
+    start = time.perf_counter()
+    for i in range(n):
+        stack.push(my_stack, i)
+    middle = time.perf_counter()
+    for _ in range(n):
+        stack.pop(my_stack)
+    end = time.perf_counter()
+    return (middle - start) / n * 1e9, (end - middle) / n * 1e9
+
+
+def main(n_max=1_000_000):
+    sizes = []
+    n = 1000
+    while n <= n_max:
+        sizes.append(n)
+        n *= 10
+    print(f"{'estructura':<22}{'n':>10}{'push (ns/op)':>15}{'pop (ns/op)':>15}")
+    for module in ("ARRAY_LIST", "SINGLE_LINKED"):
+        for n in sizes:
+            if module == "SINGLE_LINKED" and n > LINKED_LIMIT:
+                continue
+            push, pop = per_operation(module, n)
+            print(f"{module:<22}{n:>10}{push:>15.0f}{pop:>15.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
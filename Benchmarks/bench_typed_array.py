@@ -0,0 +1,94 @@
+"""
+Compara un ``array_list`` de flotantes común (lista de Python) con uno
+creado con ``typecode='d'`` (``array.array``):
+
+- memoria por elemento al llenar la lista con ``add_last``,
+- tiempo de ``sum_elements``, ``min_element``, ``argmin`` y ``prefix_sums``,
+  y de un recorrido con un ciclo de Python que busca el mínimo,
+- tiempo de entregar los números como bytes (por ejemplo para escribirlos
+  en un archivo o pasarlos a ``numpy.frombuffer``): la lista común se
+  tiene que convertir, la tipada se entrega con ``buffer`` sin copiar.
+
+En los recorridos la lista tipada no es más rápida (cada lectura crea un
+``float``); su ventaja en tiempo está en la entrega por ``buffer``.
+
+Los valores imitan las distancias de las rutas de bus del laboratorio.
+
+Uso, desde la raíz del repositorio::
+
+    python -m Benchmarks.bench_typed_array [num_elementos]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from DataStructures.List import array_list as al
+
+
+def build(values, typecode):
+    lst = al.new_list(typecode=typecode)
+    for value in values:
+        al.add_last(lst, value)
+    return lst
+
+
+def measure_memory(n, typecode, seed=42):
+    # Cada valor es un flotante nuevo, como los que salen de leer el CSV:
+    # en la lista común cada uno queda vivo como objeto, en el array solo
+    # se guardan sus 8 bytes.
+    rnd = random.Random(seed)
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    lst = build((rnd.uniform(0, 40) for _ in range(n)), typecode)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lst
+    return (end - start) / n
+
+
+def python_loop_min(lst):
+    best = None
+    for value in al.iterator(lst):
+        if best is None or value < best:
+            best = value
+    return best
+
+
+def to_bytes(lst):
+    if lst["typecode"] is None:
+        return array("d", lst["elements"]).tobytes()
+    return al.buffer(lst).cast("B")
+
+
+def timed(func, lst, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(lst)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(n=1_000_000):
+    print(f"{'':<22}{'lista':>12}{'typecode d':>12}")
+    plain_mem = measure_memory(n, None)
+    typed_mem = measure_memory(n, "d")
+    rnd = random.Random(42)
+    values = [rnd.uniform(0, 40) for _ in range(n)]
+    print(f"{'bytes/elemento':<22}{plain_mem:>12.1f}{typed_mem:>12.1f}")
+    plain = build(values, None)
+    typed = build(values, "d")
+    for name, func in (("sum_elements (ms)", al.sum_elements),
+                       ("min_element (ms)", al.min_element),
+                       ("argmin (ms)", al.argmin),
+                       ("prefix_sums (ms)", al.prefix_sums),
+                       ("ciclo Python (ms)", python_loop_min),
+                       ("entrega bytes (ms)", to_bytes)):
+        print(f"{name:<22}{timed(func, plain):>12.3f}{timed(func, typed):>12.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -112,3 +112,22 @@ def test_add_edge():
     G.add_edge(some_graph, 1, 3, 3.0)
 
     assert G.size(some_graph) == 3
+
+
+@handle_not_implemented
+def test_remove_vertex():
+    empty_graph, some_graph = setup_tests()
+
+    assert G.remove_vertex(empty_graph, 1) is None
+
+    G.insert_vertex(some_graph, 3, {"name": "C"})
+    G.add_edge(some_graph, 3, 1, 2.0)
+    G.add_edge(some_graph, 3, 2, 2.0)
+    assert G.size(some_graph) == 4
+
+    G.remove_vertex(some_graph, 1)
+    assert G.order(some_graph) == 2
+    # Se van el arco 1->2 y los arcos 2->1 y 3->1
+    assert G.size(some_graph) == 1
+    assert G.degree(some_graph, 2) == 0
+    assert G.degree(some_graph, 3) == 1
@@ -85,12 +85,13 @@ def remove_vertex(my_graph, key_u):
     my_graph['num_edges'] -= out_count
 
     # 3) Eliminar todas las aristas entrantes hacia key_u
-    #    Recorremos UNA VEZ la lista de claves restantes
-    for other_key in map.keys(my_graph['vertices']):
-        other_v = map.get(my_graph['vertices'], other_key)
-        removed = map.remove(other_v['adjacents'], key_u)
-        if removed is not None:
-            my_graph['num_edges'] -= 1
+    #    Recorremos UNA VEZ la tabla de vértices restantes
+    for _, other_v in map.iter_items(my_graph['vertices']):
+        adjacents = other_v['adjacents']
+        # Una sola búsqueda por vértice: remove no hace nada si no está
+        before = map.size(adjacents)
+        map.remove(adjacents, key_u)
+        my_graph['num_edges'] -= before - map.size(adjacents)
 
     return my_graph
 
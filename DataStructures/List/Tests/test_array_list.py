@@ -0,0 +1,108 @@
+import random
+
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests(elements):
+    my_list = lt.new_list()
+    for element in elements:
+        lt.add_last(my_list, element)
+    return my_list
+
+
+def by_distance(record_1, record_2):
+    return record_1["Distance"] < record_2["Distance"]
+
+
+@handle_not_implemented
+def test_hybrid_sort():
+    rnd = random.Random(9)
+    records = [{"Distance": rnd.randrange(50), "seq": i} for i in range(500)]
+    expected = sorted(records, key=lambda r: r["Distance"])
+    inputs = (records, expected, expected[::-1],
+              [{"Distance": i % 3, "seq": i} for i in range(500)])
+    for case in inputs:
+        ordered = sorted(case, key=lambda r: r["Distance"])
+        # Con sort_crit: tramos, inserción binaria y mezclas (estable)
+        my_list = lt.hybrid_sort(setup_tests(case), by_distance)
+        assert my_list["elements"] == ordered
+        # Con key: se delega al ordenamiento de Python
+        my_list = lt.hybrid_sort(setup_tests(case), key=lambda r: r["Distance"])
+        assert my_list["elements"] == ordered
+    assert lt.hybrid_sort(setup_tests([]), by_distance)["size"] == 0
+
+
+@handle_not_implemented
+def test_iterator():
+    my_list = setup_tests([3, 1, 2])
+    assert list(lt.iterator(my_list)) == [3, 1, 2]
+
+
+def less(a, b):
+    return a < b
+
+
+@handle_not_implemented
+def test_typed_list():
+    # Una lista con typecode guarda los números en un array.array
+    rnd = random.Random(5)
+    values = [round(rnd.uniform(0, 40), 1) for _ in range(300)]
+    my_list = lt.new_list(typecode="d")
+    for value in values:
+        lt.add_last(my_list, value)
+    lt.add_first(my_list, 7.5)
+    assert lt.remove_first(my_list) == 7.5
+    assert my_list["elements"].typecode == "d"
+    assert lt.size(my_list) == 300
+    assert lt.get_element(my_list, 3) == values[3]
+
+    assert lt.sum_elements(my_list) == sum(values)
+    assert lt.min_element(my_list) == min(values)
+    assert lt.argmin(my_list) == values.index(min(values))
+    sums = lt.prefix_sums(my_list)
+    assert sums["typecode"] == "d" and lt.size(sums) == 300
+    assert lt.last_element(sums) == sum(values)
+
+    view = lt.buffer(my_list)
+    assert view.format == "d" and view.nbytes == 300 * 8
+    raised = False
+    try:
+        lt.add_last(my_list, 1.0)
+    except BufferError:
+        raised = True
+    assert raised
+    view.release()
+
+    # La sublista conserva el tipo de la lista
+    sub = lt.sub_list(my_list, 10, 20)
+    assert sub["typecode"] == "d" and sub["type"] == "ARRAY_LIST"
+    assert sub["cmpfunction"] is my_list["cmpfunction"]
+    assert lt.buffer(sub).nbytes == 20 * 8
+    assert lt.prefix_sums(sub)["elements"].typecode == "d"
+
+    for sort in (lambda l: lt.hybrid_sort(l, less), lambda l: lt.hybrid_sort(l),
+                 lambda l: lt.merge_sort(l, less), lambda l: lt.shell_sort(l, less)):
+        typed = lt.new_list(typecode="d")
+        for value in values:
+            lt.add_last(typed, value)
+        sort(typed)
+        assert list(typed["elements"]) == sorted(values)
+        assert typed["elements"].typecode == "d"
+
+
+@handle_not_implemented
+def test_numeric_helpers_on_plain_list():
+    empty = lt.new_list()
+    assert lt.sum_elements(empty) == 0
+    assert lt.min_element(empty) is None
+    assert lt.argmin(empty) == -1
+    my_list = setup_tests([4, 2, 9, 2])
+    assert lt.argmin(my_list) == 1
+    assert lt.prefix_sums(my_list)["elements"] == [4, 6, 15, 17]
+    raised = False
+    try:
+        lt.buffer(my_list)
+    except TypeError:
+        raised = True
+    assert raised
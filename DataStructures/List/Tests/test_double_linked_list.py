@@ -0,0 +1,149 @@
+import random
+
+from DataStructures.List import double_linked_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_list = lt.new_list()
+    some_list = lt.new_list()
+    for i in range(1, 6):
+        lt.add_last(some_list, i * 10)
+    return empty_list, some_list
+
+
+def check_links(my_list):
+    # Los enlaces next y prev describen la misma cadena
+    forward = list(lt.iterator(my_list))
+    assert list(lt.reverse_iterator(my_list)) == forward[::-1]
+    assert len(forward) == lt.size(my_list)
+    if forward:
+        assert my_list["first"].prev is None
+        assert my_list["last"].next is None
+    else:
+        assert my_list["first"] is None and my_list["last"] is None
+    return forward
+
+
+@handle_not_implemented
+def test_add_remove_keep_links_consistent():
+    empty_list, some_list = setup_tests()
+    assert lt.remove_last(empty_list) is None
+    assert lt.remove_first(empty_list) is None
+    check_links(empty_list)
+
+    lt.add_first(some_list, 0)
+    lt.insert_element(some_list, 5, 2)
+    lt.insert_element(some_list, 60, 8)
+    assert check_links(some_list) == [0, 5, 10, 20, 30, 40, 50, 60]
+
+    lt.delete_element(some_list, 8)
+    lt.delete_element(some_list, 2)
+    assert lt.remove_first(some_list) == 0
+    assert lt.remove_last(some_list) == 50
+    assert check_links(some_list) == [10, 20, 30, 40]
+    assert lt.get_element(some_list, 1) == 10
+    assert lt.get_element(some_list, 4) == 40
+    assert lt.get_element(some_list, 5) is None
+
+    lt.change_info(some_list, 3, 33)
+    lt.exchange(some_list, 1, 4)
+    assert check_links(some_list) == [40, 20, 33, 10]
+    assert list(lt.iterator(lt.sub_list(some_list, 2, 2))) == [20, 33]
+
+
+@handle_not_implemented
+def test_node_handles():
+    # Uso como caché LRU: mover al final el nodo usado y sacar el primero
+    my_list = lt.new_list()
+    nodes = {key: lt.add_last_node(my_list, key) for key in "abcd"}
+    lt.move_to_last(my_list, nodes["a"])
+    lt.move_to_last(my_list, nodes["c"])
+    lt.move_to_last(my_list, nodes["c"])
+    assert check_links(my_list) == ["b", "d", "a", "c"]
+
+    assert lt.remove_node(my_list, nodes["d"]) == "d"
+    assert lt.remove_node(my_list, nodes["b"]) == "b"
+    assert lt.remove_node(my_list, nodes["c"]) == "c"
+    assert check_links(my_list) == ["a"]
+    node = lt.add_first_node(my_list, "z")
+    assert lt.first_node(my_list) is node
+    assert lt.last_node(my_list) is nodes["a"]
+
+
+@handle_not_implemented
+def test_sorts():
+    rnd = random.Random(3)
+    records = [{"Distance": rnd.randrange(20), "seq": i} for i in range(200)]
+    expected = sorted(records, key=lambda r: r["Distance"])
+
+    def by_distance(a, b):
+        return a["Distance"] < b["Distance"]
+
+    for sort in (lt.merge_sort, lt.insertion_sort):
+        my_list = lt.new_list()
+        for record in records:
+            lt.add_last(my_list, record)
+        sort(my_list, by_distance)
+        # Ambos ordenamientos son estables
+        assert check_links(my_list) == expected
+
+    for sort in (lt.selection_sort, lt.quick_sort, lt.shell_sort):
+        my_list = lt.new_list()
+        for record in records[:60]:
+            lt.add_last(my_list, record)
+        sort(my_list, by_distance)
+        assert [r["Distance"] for r in check_links(my_list)] == \
+            sorted(r["Distance"] for r in records[:60])
+
+
+@handle_not_implemented
+def test_stale_node_handles_raise():
+    # Un nodo ya eliminado no se puede volver a usar: la lista no cambia
+    my_list = lt.new_list()
+    nodes = [lt.add_last_node(my_list, i) for i in range(5)]
+    assert lt.remove_node(my_list, nodes[2]) == 2
+    for operation in (lt.remove_node, lt.move_to_last):
+        raised = False
+        try:
+            operation(my_list, nodes[2])
+        except Exception:
+            raised = True
+        assert raised
+        assert check_links(my_list) == [0, 1, 3, 4]
+
+    # También con los extremos y con la lista vacía
+    lt.remove_node(my_list, nodes[0])
+    lt.remove_node(my_list, nodes[4])
+    assert check_links(my_list) == [1, 3]
+    lt.remove_node(my_list, nodes[1])
+    lt.remove_node(my_list, nodes[3])
+    raised = False
+    try:
+        lt.remove_node(my_list, nodes[3])
+    except Exception:
+        raised = True
+    assert raised
+    assert check_links(my_list) == []
+
+
+@handle_not_implemented
+def test_foreign_node_raises():
+    # Un nodo de otra lista no se puede usar: ninguna de las dos cambia
+    my_list = lt.new_list()
+    other = lt.new_list()
+    for i in range(3):
+        lt.add_last_node(my_list, i)
+    foreign = [lt.add_last_node(other, i) for i in range(3)]
+    for node in foreign:
+        for operation in (lt.remove_node, lt.move_to_last):
+            raised = False
+            try:
+                operation(my_list, node)
+            except ValueError:
+                raised = True
+            assert raised
+    assert check_links(my_list) == [0, 1, 2]
+    assert check_links(other) == [0, 1, 2]
+    assert lt.remove_node(other, foreign[1]) == 1
+    assert check_links(other) == [0, 2]
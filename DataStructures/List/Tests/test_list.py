@@ -0,0 +1,74 @@
+import copy
+import pickle
+
+from DataStructures.List import list as lt
+from DataStructures.List import array_list
+from DataStructures.List import single_linked_list
+from DataStructures.List import double_linked_list
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_list_binds_engine():
+    # La lista guarda el nombre de su estructura y se despacha a su módulo
+    for datastructure, module in (("ARRAY_LIST", array_list),
+                                  ("SINGLE_LINKED", single_linked_list),
+                                  ("DOUBLE_LINKED", double_linked_list)):
+        my_list = lt.new_list(datastructure)
+        assert my_list["datastructure"] == datastructure
+        assert lt.engine(my_list) is module
+        assert my_list["ops"].add_last is module.add_last
+        assert lt.is_empty(my_list) is True
+
+
+@handle_not_implemented
+def test_dispatch():
+    for datastructure in ("ARRAY_LIST", "SINGLE_LINKED", "DOUBLE_LINKED"):
+        my_list = lt.new_list(datastructure)
+        for i in range(1, 6):
+            lt.add_last(my_list, i)
+        lt.add_first(my_list, 0)
+        assert lt.size(my_list) == 6
+        assert lt.first_element(my_list) == 0
+        assert lt.last_element(my_list) == 5
+        assert list(lt.iterator(my_list)) == [0, 1, 2, 3, 4, 5]
+        assert lt.remove_first(my_list) == 0
+        assert lt.remove_last(my_list) == 5
+        assert lt.is_present(my_list, 3) >= 0
+        assert lt.is_present(my_list, 42) == -1
+        sub = lt.sub_list(my_list, 1, 2)
+        assert sub["datastructure"] == my_list["datastructure"]
+        assert lt.size(sub) == 2
+
+
+@handle_not_implemented
+def test_unknown_engine_and_register():
+    raised = False
+    try:
+        lt.new_list("NO_EXISTE")
+    except Exception:
+        raised = True
+    assert raised
+
+    lt.register_engine("OTRA_LISTA", array_list)
+    try:
+        my_list = lt.new_list("OTRA_LISTA")
+        lt.addLast(my_list, "a")
+        assert lt.getElement(my_list, 0) == "a"
+    finally:
+        del lt._ENGINES["OTRA_LISTA"]
+        del lt._OPS["OTRA_LISTA"]
+
+
+@handle_not_implemented
+def test_lists_can_be_copied_and_pickled():
+    for datastructure in ("ARRAY_LIST", "SINGLE_LINKED", "DOUBLE_LINKED"):
+        my_list = lt.new_list(datastructure)
+        for i in range(3):
+            lt.add_last(my_list, i)
+        for clone in (copy.deepcopy(my_list), pickle.loads(pickle.dumps(my_list))):
+            # Las funciones ligadas se copian por referencia
+            assert clone["ops"].add_last is my_list["ops"].add_last
+            lt.add_last(clone, 3)
+            assert list(lt.iterator(clone)) == [0, 1, 2, 3]
+        assert lt.size(my_list) == 3
@@ -0,0 +1,121 @@
+import tracemalloc
+
+from DataStructures.List import single_linked_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_list = lt.new_list()
+    some_list = lt.new_list()
+    for i in range(1, 6):
+        lt.add_last(some_list, i * 10)
+    return empty_list, some_list
+
+
+@handle_not_implemented
+def test_add_remove_keep_nodes_consistent():
+    _, some_list = setup_tests()
+    lt.add_first(some_list, 0)
+    lt.insert_element(some_list, 5, 2)
+    lt.insert_element(some_list, 60, 8)
+    assert list(lt.iterator(some_list)) == [0, 5, 10, 20, 30, 40, 50, 60]
+    assert lt.last_element(some_list) == 60
+
+    lt.delete_element(some_list, 8)
+    assert lt.last_element(some_list) == 50
+    lt.add_last(some_list, 70)
+    assert lt.remove_first(some_list) == 0
+    assert lt.remove_last(some_list) == 70
+    assert list(lt.iterator(some_list)) == [5, 10, 20, 30, 40, 50]
+    assert lt.size(some_list) == 6
+    assert lt.get_element(some_list, 3) == 20
+
+
+@handle_not_implemented
+def test_sub_list():
+    empty_list, some_list = setup_tests()
+    sub = lt.sub_list(some_list, 2, 3)
+    assert list(lt.iterator(sub)) == [20, 30, 40]
+    assert lt.size(sub) == 3
+    assert lt.size(lt.sub_list(empty_list, 1, 0)) == 0
+
+
+@handle_not_implemented
+def test_merge_sort():
+    empty_list, some_list = setup_tests()
+    for x in (35, 5, 50, 15):
+        lt.add_first(some_list, x)
+    lt.merge_sort(some_list, lambda a, b: a < b)
+    assert list(lt.iterator(some_list)) == [5, 10, 15, 20, 30, 35, 40, 50, 50]
+    lt.merge_sort(empty_list, lambda a, b: a < b)
+    assert lt.size(empty_list) == 0
+
+
+@handle_not_implemented
+def test_merge_sort_stable_relinks_nodes():
+    import random
+    rnd = random.Random(5)
+    records = [{"ServiceNo": rnd.randrange(20), "seq": i} for i in range(1001)]
+    my_list = lt.new_list()
+    for record in records:
+        lt.add_last(my_list, record)
+    nodes = set()
+    node = my_list["first"]
+    while node is not None:
+        nodes.add(id(node))
+        node = node.next
+
+    lt.merge_sort(my_list, lambda a, b: a["ServiceNo"] < b["ServiceNo"])
+    result = list(lt.iterator(my_list))
+    assert result == sorted(records, key=lambda r: r["ServiceNo"])
+    assert lt.last_element(my_list) is result[-1]
+    assert lt.size(my_list) == 1001
+    # Se reutilizan los mismos nodos, solo cambian los enlaces
+    node = my_list["first"]
+    while node is not None:
+        assert id(node) in nodes
+        node = node.next
+
+
+@handle_not_implemented
+def test_memory_per_element():
+    # Cada elemento cuesta solo su nodo: sin la lista de Python paralela
+    # que guardaba una segunda referencia a cada elemento.
+    n = 20000
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    my_list = lt.new_list()
+    for _ in range(n):
+        lt.add_last(my_list, None)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert "elements" not in my_list
+    assert (end - start) / n <= 56
+
+
+@handle_not_implemented
+def test_cursor():
+    _, some_list = setup_tests()
+    cursor = lt.new_cursor(some_list)
+    # Se borran los múltiplos de 20 y se duplica el resto en un recorrido
+    while lt.cursor_has_next(cursor):
+        element = lt.cursor_next(cursor)
+        if element % 20 == 0:
+            lt.cursor_remove(cursor)
+        else:
+            lt.cursor_set(cursor, element * 2)
+    assert list(lt.iterator(some_list)) == [20, 60, 100]
+    assert lt.size(some_list) == 3
+    assert lt.cursor_next(cursor) is None
+
+    # Borrar el primero y el último deja la lista consistente
+    cursor = lt.new_cursor(some_list)
+    lt.cursor_next(cursor)
+    lt.cursor_remove(cursor)
+    lt.cursor_next(cursor)
+    lt.cursor_next(cursor)
+    lt.cursor_remove(cursor)
+    assert list(lt.iterator(some_list)) == [60]
+    assert lt.first_element(some_list) == lt.last_element(some_list) == 60
+    lt.add_last(some_list, 70)
+    assert list(lt.iterator(some_list)) == [60, 70]
@@ -6,28 +6,40 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from DataStructures.Utils import config
 from DataStructures.Utils import error as error
+from array import array
+from itertools import accumulate
 import csv
 assert config
 from typing import Callable
 from typing import Any
 
-def new_list(cmpfunction=None, module=None, key=None, filename=None, delim=None):
+def new_list(cmpfunction=None, module=None, key=None, filename=None, delim=None,
+             typecode=None):
     """Crea una lista vacía.
 
     Args:
         cmpfunction: Función de comparación para los elementos de la lista
+        typecode: Si se da (por ejemplo ``'d'`` para flotantes o ``'q'``
+            para enteros de 64 bits), los elementos se guardan en un
+            ``array.array`` de ese tipo en lugar de una lista de Python:
+            cada elemento ocupa solo sus bytes, sin un objeto por número.
+            Sirve para listas de distancias, pesos, etc., y habilita
+            :func:`buffer`. Ahorra memoria, pero no acelera los recorridos
+            en Python: la ganancia en velocidad viene de entregar
+            ``buffer(lst)`` sin copiarlo.
     Returns:
         Un diccionario que representa la estructura de datos de una lista
 
     Raises:
 
     """
-    newlist = {'elements': [],
+    newlist = {'elements': [] if typecode is None else array(typecode),
                'size': 0,
                'type': 'ARRAY_LIST',
                'cmpfunction': cmpfunction,
                'key': key,
-               'datastructure': module
+               'datastructure': module,
+               'typecode': typecode
                }
 
     if(cmpfunction is None):
@@ -46,6 +58,14 @@ def new_list(cmpfunction=None, module=None, key=None, filename=None, delim=None)
 def get_element(my_list, index):
     return my_list["elements"][index]
 
+def iterator(my_list):
+    """
+    Recorre los elementos de la lista en orden, sin copiarlos.
+    """
+    elements = my_list["elements"]
+    for i in range(my_list["size"]):
+        yield elements[i]
+
 def is_present(my_list, element, cmp_function):
     
     size = my_list["size"]
@@ -171,7 +191,11 @@ def sub_list(my_list, pos_i, num_elements):
     pos_f = pos_i + num_elements
     elements = my_list["elements"]
     sublist = elements[pos_i:pos_f]
-    return {'elements': sublist,'size': len(sublist)}
+    return {'elements': sublist,
+            'size': len(sublist),
+            'type': my_list.get('type', 'ARRAY_LIST'),
+            'cmpfunction': my_list.get('cmpfunction'),
+            'typecode': my_list.get('typecode')}
 
 def update(lt: dict, pos: int, element: Any) -> None:
     """update updates an element in a specific position in the array list.
@@ -333,3 +357,240 @@ def shell_sort(lst, sort_crit):
         
     return lst
 
+
+
+# Tramo mínimo del ordenamiento híbrido: los tramos más cortos se
+# completan con inserción binaria antes de mezclar.
+_MIN_RUN = 32
+
+
+def hybrid_sort(lst, sort_crit=None, key=None):
+    """ Ordena la lista con un ordenamiento híbrido al estilo Timsort.
+
+    - Si se da ``key`` (o no se da ningún criterio) se usa el ordenamiento
+      de Python sobre ``lst["elements"]``, comparando ``key(elemento)``.
+    - Si se da ``sort_crit``, la lista se recorre buscando tramos ya
+      ordenados (los descendentes se invierten), los tramos cortos se
+      completan con inserción binaria hasta ``_MIN_RUN`` elementos, y los
+      tramos se mezclan de a pares usando un único arreglo auxiliar del
+      tamaño de la mitad de la lista.
+
+    En ambos casos el ordenamiento es estable y O(n log n); sobre una
+    lista ya ordenada u ordenada al revés es O(n).
+
+    Args:
+        lst: La lista a ordenar
+        sort_crit: Función que retorna True si el primer elemento debe ir
+            antes que el segundo
+        key: Función que calcula la llave de comparación de cada elemento
+    Returns:
+        La misma lista, ordenada
+    """
+    n = lst["size"]
+    elements = lst["elements"]
+    if sort_crit is None:
+        if isinstance(elements, array):
+            elements[:n] = array(elements.typecode, sorted(elements[:n], key=key))
+        elif len(elements) == n:
+            elements.sort(key=key)
+        else:
+            elements[:n] = sorted(elements[:n], key=key)
+        return lst
+    if key is not None:
+        crit = sort_crit
+        sort_crit = lambda a, b: crit(key(a), key(b))
+    if n < 2:
+        return lst
+
+    min_run = _min_run_length(n)
+    # Copia del mismo tipo que elements (lista o array), de modo que las
+    # asignaciones por tajadas entre los dos funcionen en ambos casos
+    buffer = elements[:n // 2 + 1]
+    runs = []
+    lo = 0
+    while lo < n:
+        run_len = _count_run(elements, lo, n, sort_crit)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(elements, lo, lo + forced, lo + run_len,
+                                   sort_crit)
+            run_len = forced
+        runs.append((lo, run_len))
+        _collapse_runs(elements, runs, buffer, sort_crit)
+        lo += run_len
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(elements, runs, i, buffer, sort_crit)
+    return lst
+
+
+def _min_run_length(n):
+    # Entre _MIN_RUN/2 y _MIN_RUN, de modo que n / min_run sea una potencia
+    # de 2 o un poco menos y las mezclas queden balanceadas.
+    r = 0
+    while n >= _MIN_RUN:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(elements, lo, hi, sort_crit):
+    """ Largo del tramo ordenado que empieza en lo. Un tramo estrictamente
+    descendente se invierte para dejarlo ascendente."""
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if sort_crit(elements[run_hi], elements[lo]):
+        while run_hi < hi and sort_crit(elements[run_hi], elements[run_hi - 1]):
+            run_hi += 1
+        elements[lo:run_hi] = elements[lo:run_hi][::-1]
+    else:
+        while run_hi < hi and not sort_crit(elements[run_hi], elements[run_hi - 1]):
+            run_hi += 1
+    return run_hi - lo
+
+
+def _binary_insertion_sort(elements, lo, hi, start, sort_crit):
+    """ Ordena elements[lo:hi] sabiendo que elements[lo:start] ya está
+    ordenado. Cada elemento se ubica con búsqueda binaria después de los
+    que son equivalentes, para mantener la estabilidad."""
+    for i in range(start, hi):
+        pivot = elements[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if sort_crit(pivot, elements[mid]):
+                right = mid
+            else:
+                left = mid + 1
+        elements[left + 1:i + 1] = elements[left:i]
+        elements[left] = pivot
+
+
+def _collapse_runs(elements, runs, buffer, sort_crit):
+    """ Mezcla tramos de la pila hasta que sus largos decrezcan al menos
+    como la sucesión de Fibonacci, lo que acota la profundidad de la pila
+    y mantiene las mezclas balanceadas."""
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+           (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _merge_at(elements, runs, i, buffer, sort_crit)
+
+
+def _merge_at(elements, runs, i, buffer, sort_crit):
+    """ Mezcla los tramos consecutivos runs[i] y runs[i + 1]. Se copia al
+    arreglo auxiliar el más corto de los dos."""
+    lo, len_a = runs[i]
+    _, len_b = runs[i + 1]
+    runs[i] = (lo, len_a + len_b)
+    del runs[i + 1]
+    mid = lo + len_a
+    hi = mid + len_b
+    # Si el último de la izquierda no va después del primero de la derecha
+    # los tramos ya están en orden
+    if not sort_crit(elements[mid], elements[mid - 1]):
+        return
+    if len_a <= len_b:
+        buffer[:len_a] = elements[lo:mid]
+        a, b, k = 0, mid, lo
+        while a < len_a and b < hi:
+            if sort_crit(elements[b], buffer[a]):
+                elements[k] = elements[b]
+                b += 1
+            else:
+                elements[k] = buffer[a]
+                a += 1
+            k += 1
+        elements[k:k + len_a - a] = buffer[a:len_a]
+    else:
+        buffer[:len_b] = elements[mid:hi]
+        a, b, k = mid - 1, len_b - 1, hi - 1
+        while a >= lo and b >= 0:
+            if sort_crit(buffer[b], elements[a]):
+                elements[k] = elements[a]
+                a -= 1
+            else:
+                elements[k] = buffer[b]
+                b -= 1
+            k -= 1
+        elements[lo:lo + b + 1] = buffer[:b + 1]
+
+
+# ---------------------------------------------------------------------------
+# Operaciones numéricas. Recorren los elementos con las funciones de Python
+# implementadas en C (sum, min, accumulate), sin un llamado por elemento, y
+# funcionan con cualquier lista de números. Con ``typecode`` la lista ocupa
+# unas 4 veces menos memoria, pero leer cada elemento del array crea un
+# flotante, así que estos recorridos son algo más lentos que sobre una
+# lista común; para cálculos pesados conviene entregar ``buffer(lst)`` a
+# una biblioteca numérica.
+# ---------------------------------------------------------------------------
+
+def sum_elements(my_list):
+    """
+    Retorna la suma de los elementos de la lista (0 si está vacía).
+    """
+    return sum(my_list["elements"])
+
+
+def min_element(my_list):
+    """
+    Retorna el menor elemento de la lista, o None si está vacía.
+    """
+    if my_list["size"] == 0:
+        return None
+    return min(my_list["elements"])
+
+
+def argmin(my_list):
+    """
+    Retorna la posición del menor elemento de la lista (la primera si hay
+    empates), o -1 si está vacía.
+    """
+    if my_list["size"] == 0:
+        return -1
+    elements = my_list["elements"]
+    return min(range(my_list["size"]), key=elements.__getitem__)
+
+
+def prefix_sums(my_list):
+    """
+    Retorna una lista nueva, del mismo tipo, en la que la posición i tiene
+    la suma de los elementos 0..i de my_list.
+    """
+    typecode = my_list.get("typecode")
+    sums = new_list(my_list.get("cmpfunction"), typecode=typecode)
+    if typecode is None:
+        sums["elements"] = list(accumulate(my_list["elements"]))
+    else:
+        sums["elements"] = array(typecode, accumulate(my_list["elements"]))
+    sums["size"] = my_list["size"]
+    return sums
+
+
+def buffer(my_list):
+    """
+    Retorna un ``memoryview`` sobre los elementos de una lista creada con
+    ``typecode``, para entregarlos sin copiarlos a código que use el
+    protocolo de buffer (``struct``, ``numpy.frombuffer``, archivos...).
+    Es la forma rápida de procesar una lista numérica: ``sum_elements``,
+    ``argmin`` y demás no son más rápidas con ``typecode``, porque leer
+    cada elemento del array crea un objeto ``float``.
+
+    Mientras exista el ``memoryview`` la lista no puede cambiar de tamaño:
+    ``add_last`` y demás lanzan ``BufferError``. Se puede liberar con
+    ``release()`` o usándolo en un bloque ``with``.
+
+    Raises:
+        TypeError: Si la lista no se creó con ``typecode``
+    """
+    if my_list.get("typecode") is None:
+        raise TypeError("arraylist->buffer: la lista no se creó con typecode")
+    return memoryview(my_list["elements"])
@@ -0,0 +1,576 @@
+import sys
+import os
+
+# Agrega el directorio raíz del proyecto al PYTHONPATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from DataStructures.Utils import config
+from DataStructures.Utils import error as error
+from DataStructures.Utils.slotted import Slotted
+import csv
+assert config
+from typing import Callable
+
+"""
+  Lista doblemente encadenada.
+
+  Ofrece las mismas funciones que ``single_linked_list`` (las posiciones
+  empiezan en 1), pero cada nodo conoce también a su anterior:
+
+  - ``remove_last`` cuesta O(1), sin recorrer la cadena.
+  - ``get_element``, ``insert_element``, ``delete_element`` y
+    ``change_info`` llegan a la posición desde el extremo más cercano.
+  - ``reverse_iterator`` recorre la lista del último al primero.
+  - ``add_first_node`` y ``add_last_node`` retornan el nodo creado; con ese
+    nodo, ``remove_node`` y ``move_to_last`` cuestan O(1). Es lo que
+    necesitan un caché LRU (un mapa de llave a nodo más la lista en orden de
+    uso) o una cola de dos extremos.
+"""
+
+
+class DoubleNode(Slotted):
+    """
+    Nodo de la lista doblemente encadenada. Sus campos se leen como
+    atributos (``node.next``) o como en un diccionario (``node["next"]``).
+    ``owner`` es la lista donde está enlazado el nodo, o ``None`` si no está
+    en ninguna.
+    """
+
+    __slots__ = ("info", "prev", "next", "owner")
+
+    def __init__(self, element):
+        self.info = element
+        self.prev = None
+        self.next = None
+        self.owner = None
+
+
+def new_double_node(element):
+    """
+    Estructura que contiene la información a guardar en una lista
+    doblemente encadenada
+    """
+    return DoubleNode(element)
+
+
+def new_list(cmpfunction=None, module='DOUBLE_LINKED', key=None, filename=None, delim=','):
+    newlist = {
+        'first': None,
+        'last': None,
+        'size': 0,
+        'key': key,
+        'type': 'DOUBLE_LINKED',
+        'datastructure': module
+    }
+
+    if cmpfunction is None:
+        newlist['cmpfunction'] = defaultfunction
+    else:
+        newlist['cmpfunction'] = cmpfunction
+
+    if filename is not None:
+        try:
+            with open(filename, encoding="utf-8") as file:
+                for line in csv.DictReader(file, delimiter=delim):
+                    add_last(newlist, line)
+        except Exception as e:
+            error.reraise(e, 'Error al leer el archivo CSV en new_list: ')
+
+    return newlist
+
+
+def _node_at(my_list, pos):
+    # Nodo de la posición pos (desde 1), recorriendo desde el extremo más
+    # cercano. Retorna None si la posición no existe.
+    list_size = my_list['size']
+    if pos < 1 or pos > list_size:
+        return None
+    if pos <= list_size // 2 + 1:
+        node = my_list['first']
+        for _ in range(pos - 1):
+            node = node.next
+    else:
+        node = my_list['last']
+        for _ in range(list_size - pos):
+            node = node.prev
+    return node
+
+
+def get_element(my_list, pos):
+    """
+    Retorna el elemento en la posición pos (empezando en 1), o None si la
+    posición no existe.
+    """
+    node = _node_at(my_list, pos)
+    if node is None:
+        return None
+    return node.info
+
+
+def iterator(my_list):
+    """
+    Recorre los elementos de la lista del primero al último.
+    """
+    node = my_list['first']
+    while node is not None:
+        yield node.info
+        node = node.next
+
+
+def reverse_iterator(my_list):
+    """
+    Recorre los elementos de la lista del último al primero.
+    """
+    node = my_list['last']
+    while node is not None:
+        yield node.info
+        node = node.prev
+
+
+def is_present(my_list, element, cmp_function):
+    """
+    Retorna la posición (desde 0) del primer elemento igual a element según
+    cmp_function, o -1 si no está, como en ``single_linked_list``.
+    """
+    count = 0
+    node = my_list['first']
+    while node is not None:
+        if cmp_function(element, node.info) == 0:
+            return count
+        node = node.next
+        count += 1
+    return -1
+
+
+def size(my_list):
+    return my_list['size']
+
+
+def is_empty(my_list):
+    """
+    Retorna True si la lista está vacía
+    """
+    return my_list['size'] == 0
+
+
+def first_element(my_list):
+    if my_list['first'] is not None:
+        return my_list['first'].info
+    return None
+
+
+def last_element(my_list):
+    """ Retorna el último elemento de la lista sin eliminarlo, o None si la
+    lista está vacía.
+    """
+    if my_list['last'] is not None:
+        return my_list['last'].info
+    return None
+
+
+def first_node(my_list):
+    """ Retorna el primer nodo de la lista, o None si está vacía."""
+    return my_list['first']
+
+
+def last_node(my_list):
+    """ Retorna el último nodo de la lista, o None si está vacía."""
+    return my_list['last']
+
+
+def _link_after(my_list, prev, node):
+    # Enlaza node después de prev (al inicio si prev es None)
+    following = my_list['first'] if prev is None else prev.next
+    node.prev = prev
+    node.next = following
+    node.owner = my_list
+    if prev is None:
+        my_list['first'] = node
+    else:
+        prev.next = node
+    if following is None:
+        my_list['last'] = node
+    else:
+        following.prev = node
+    my_list['size'] += 1
+    return node
+
+
+def _unlink(my_list, node):
+    # Saca node de la cadena en O(1). Un nodo de otra lista, o uno ya
+    # eliminado, dañaría los enlaces y el tamaño de my_list.
+    if node.owner is not my_list:
+        raise ValueError('doublelinkedlist: el nodo no pertenece a la lista')
+    if node.prev is None:
+        my_list['first'] = node.next
+    else:
+        node.prev.next = node.next
+    if node.next is None:
+        my_list['last'] = node.prev
+    else:
+        node.next.prev = node.prev
+    node.prev = None
+    node.next = None
+    node.owner = None
+    my_list['size'] -= 1
+    return node.info
+
+
+def add_first(my_list, element):
+    """
+    Agrega un elemento al inicio de la lista
+    """
+    _link_after(my_list, None, new_double_node(element))
+    return my_list
+
+
+def add_last(my_list, element):
+    """
+    Añade un elemento al final de la lista
+    """
+    _link_after(my_list, my_list['last'], new_double_node(element))
+    return my_list
+
+
+def add_first_node(my_list, element):
+    """ Agrega un elemento al inicio de la lista y retorna su nodo.
+
+    Args:
+        my_list: La lista
+        element: El elemento a agregar
+    Returns:
+        El nodo creado, para usarlo después con remove_node o move_to_last
+    """
+    return _link_after(my_list, None, new_double_node(element))
+
+
+def add_last_node(my_list, element):
+    """ Agrega un elemento al final de la lista y retorna su nodo.
+
+    Args:
+        my_list: La lista
+        element: El elemento a agregar
+    Returns:
+        El nodo creado, para usarlo después con remove_node o move_to_last
+    """
+    return _link_after(my_list, my_list['last'], new_double_node(element))
+
+
+def remove_node(my_list, node):
+    """ Elimina de la lista un nodo dado en O(1).
+
+    Args:
+        my_list: La lista
+        node: Un nodo que pertenece a my_list
+    Returns:
+        El elemento del nodo eliminado
+    Raises:
+        ValueError: Si el nodo no está en my_list
+    """
+    try:
+        return _unlink(my_list, node)
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->removeNode: ')
+
+
+def move_to_last(my_list, node):
+    """ Mueve un nodo de la lista a la última posición en O(1).
+
+    Args:
+        my_list: La lista
+        node: Un nodo que pertenece a my_list
+    Returns:
+        La lista
+    Raises:
+        ValueError: Si el nodo no está en my_list
+    """
+    try:
+        if node is not my_list['last']:
+            _unlink(my_list, node)
+            _link_after(my_list, my_list['last'], node)
+        return my_list
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->moveToLast: ')
+
+
+def remove_first(my_list):
+    """ Remueve el primer elemento de la lista y lo retorna. Si la lista es
+    vacía se retorna None.
+    """
+    if my_list['first'] is None:
+        return None
+    return _unlink(my_list, my_list['first'])
+
+
+def remove_last(my_list):
+    """ Remueve el último elemento de la lista y lo retorna, en O(1). Si la
+    lista es vacía se retorna None.
+    """
+    if my_list['last'] is None:
+        return None
+    return _unlink(my_list, my_list['last'])
+
+
+def insert_element(my_list, element, pos):
+    """ Inserta el elemento element en la posición pos de la lista.
+
+    Args:
+        my_list: La lista en la que se va a insertar el elemento
+        element: El elemento a insertar
+        pos: posición en la que se va a insertar el elemento,
+        0 < pos <= size(my_list) + 1
+
+    Raises:
+        Exception
+    """
+    try:
+        if pos <= 1:
+            prev = None
+        elif pos > my_list['size']:
+            prev = my_list['last']
+        else:
+            prev = _node_at(my_list, pos - 1)
+        _link_after(my_list, prev, new_double_node(element))
+        return my_list
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->insertElement: ')
+
+
+def delete_element(my_list, pos):
+    """ Elimina el elemento en la posición pos de la lista.
+
+    Args:
+        my_list: La lista a retornar
+        pos: Posición del elemento a eliminar.
+
+    Raises:
+        Exception
+    """
+    try:
+        node = _node_at(my_list, pos)
+        if node is not None:
+            _unlink(my_list, node)
+        return my_list
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->deleteElement: ')
+
+
+def change_info(my_list, pos, newinfo):
+    """ Cambia la información contenida en el nodo de la posición pos.
+
+    Raises:
+        Exception
+    """
+    try:
+        _node_at(my_list, pos).info = newinfo
+        return my_list
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->changeInfo: ')
+
+
+def exchange(my_list, pos1, pos2):
+    """ Intercambia la información en las posiciones pos1 y pos2 de la lista.
+
+    Raises:
+        Exception
+    """
+    try:
+        node1 = _node_at(my_list, pos1)
+        node2 = _node_at(my_list, pos2)
+        node1.info, node2.info = node2.info, node1.info
+        return my_list
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->exchange: ')
+
+
+def sub_list(my_list, pos, numelem):
+    """ Retorna una lista nueva con numelem elementos copiados desde la
+    posición pos.
+
+    Raises:
+        Exception
+    """
+    try:
+        sublst = new_list(my_list.get('cmpfunction'))
+        node = _node_at(my_list, pos)
+        while numelem > 0 and node is not None:
+            add_last(sublst, node.info)
+            node = node.next
+            numelem -= 1
+        return sublst
+    except Exception as exp:
+        error.reraise(exp, 'doublelinkedlist->subList: ')
+
+
+def defaultfunction(id1, id2):
+    if id1 > id2:
+        return 1
+    elif id1 < id2:
+        return -1
+    return 0
+
+
+def default_sort_criteria(element_1, element_2):
+    is_sorted = defaultfunction(element_1, element_2)
+    return is_sorted
+
+
+def merge_sort(lst: dict, sort_crit: Callable) -> dict:
+    """ Ordena la lista con merge sort de abajo hacia arriba.
+
+    Como en ``single_linked_list``, las mezclas solo cambian los enlaces
+    next; al final se recorre la cadena una vez para rehacer los enlaces
+    prev. Es O(n log n), usa memoria extra O(1) y es estable.
+
+    Args:
+        lst: La lista a ordenar
+        sort_crit: Función que retorna True si el primer elemento debe ir
+            antes que el segundo
+    Returns:
+        La misma lista, ordenada
+    """
+    list_size = size(lst)
+    if list_size <= 1:
+        return lst
+
+    head = lst['first']
+    width = 1
+    while width < list_size:
+        sentinel = DoubleNode(None)
+        tail = sentinel
+        current = head
+        while current is not None:
+            left = current
+            right = _split(left, width)
+            current = _split(right, width)
+            tail.next, tail = _merge(left, right, sort_crit)
+        head = sentinel.next
+        width *= 2
+
+    prev = None
+    node = head
+    while node is not None:
+        node.prev = prev
+        prev = node
+        node = node.next
+    lst['first'] = head
+    lst['last'] = prev
+    return lst
+
+
+def _split(node, count):
+    """ Corta la cadena después de count nodos y retorna el resto."""
+    while count > 1 and node is not None:
+        node = node.next
+        count -= 1
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge(left, right, sort_crit):
+    """ Mezcla dos cadenas ordenadas (solo por next) y retorna
+    (primero, último)."""
+    sentinel = DoubleNode(None)
+    tail = sentinel
+    while left is not None and right is not None:
+        if sort_crit(right.info, left.info):
+            tail.next = right
+            right = right.next
+        else:
+            tail.next = left
+            left = left.next
+        tail = tail.next
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return sentinel.next, tail
+
+
+def insertion_sort(lst, sort_crit):
+    """ Ordena la lista moviendo cada nodo hacia atrás hasta su lugar.
+    Es estable.
+    """
+    node = lst['first'].next if lst['first'] is not None else None
+    while node is not None:
+        following = node.next
+        target = node.prev
+        while target is not None and sort_crit(node.info, target.info):
+            target = target.prev
+        if target is not node.prev:
+            _unlink(lst, node)
+            _link_after(lst, target, node)
+        node = following
+    return lst
+
+
+def selection_sort(lst, sort_criteria: Callable) -> dict:
+    list_size = size(lst)
+    # Las posiciones de la lista empiezan en 1
+    pos1 = 1
+    while pos1 <= list_size:
+        minimum = pos1
+        pos2 = pos1 + 1
+        while pos2 <= list_size:
+            if sort_criteria(get_element(lst, pos2),
+                             get_element(lst, minimum)):
+                minimum = pos2
+            pos2 += 1
+        exchange(lst, pos1, minimum)
+        pos1 += 1
+    return lst
+
+
+def partition(lst, lo, hi, sort_crit):
+    """
+    Función que va dejando el pivot en su lugar, mientras mueve
+    elementos menores a la izquierda del pivot y elementos mayores a
+    la derecha del pivot
+    """
+    follower = leader = lo
+    while leader < hi:
+        if sort_crit(get_element(lst, leader), get_element(lst, hi)):
+            exchange(lst, follower, leader)
+            follower += 1
+        leader += 1
+    exchange(lst, follower, hi)
+    return follower
+
+
+def sort(lst, lo, hi, sort_crit):
+    """
+    Se localiza el pivot, utilizando la funcion de particion.
+    Luego se hace la recursión con los elementos a la izquierda del pivot
+    y los elementos a la derecha del pivot
+    """
+    if lo >= hi:
+        return
+    pivot = partition(lst, lo, hi, sort_crit)
+    sort(lst, lo, pivot - 1, sort_crit)
+    sort(lst, pivot + 1, hi, sort_crit)
+
+
+def quick_sort(lst, sort_crit):
+    if size(lst) <= 1:
+        return lst
+    sort(lst, 1, size(lst), sort_crit)  # Las posiciones empiezan en 1
+    return lst
+
+
+def shell_sort(lst, sort_crit):
+    n = size(lst)
+    h = 1
+    while h < n / 3:
+        h = 3 * h + 1
+    while h >= 1:
+        for i in range(h, n):
+            j = i
+            # get_element y exchange usan posiciones desde 1
+            while (j >= h) and sort_crit(get_element(lst, j + 1),
+                                         get_element(lst, j - h + 1)):
+                exchange(lst, j + 1, j - h + 1)
+                j -= h
+        h //= 3
+    return lst
@@ -25,8 +25,10 @@
  """
 
 from DataStructures.Utils import config
-import importlib
 from DataStructures.Utils import error as error
+from DataStructures.List import array_list
+from DataStructures.List import single_linked_list
+from DataStructures.List import double_linked_list
 assert config
 
 
@@ -34,8 +36,60 @@ assert config
   Este módulo implementa el tipo abstracto de datos (TAD) lista.
   Se puede implementar sobre una estructura de datos encadenada de forma
   sencilla, doble o como un arreglo
+
+  Las estructuras disponibles se registran una sola vez, al importar el
+  módulo, en ``_ENGINES``; para cada una se arma un :class:`ListOps` con
+  referencias a sus funciones. :func:`new_list` guarda en
+  ``lst['datastructure']`` el nombre de la estructura y en ``lst['ops']``
+  su ``ListOps``, y cada función del TAD llama ``lst['ops'].add_last(...)``
+  directamente, sin buscar el módulo. Las funciones se guardan por
+  referencia, así que la lista se puede copiar con ``copy.deepcopy`` o
+  guardar con ``pickle``. Las listas que se usan con este módulo se deben
+  crear con :func:`new_list`.
+
+  Se pueden agregar estructuras nuevas con :func:`register_engine`.
 """
 
+_OPERATIONS = ('add_first', 'add_last', 'is_empty', 'size', 'first_element',
+               'last_element', 'get_element', 'delete_element',
+               'remove_first', 'remove_last', 'insert_element', 'is_present',
+               'exchange', 'change_info', 'sub_list', 'iterator')
+
+
+class ListOps:
+    """
+    Funciones de una estructura de datos, ligadas una vez al registrarla.
+    Cada lista guarda el ``ListOps`` de su estructura en ``lst['ops']``.
+    """
+
+    __slots__ = _OPERATIONS
+
+    def __init__(self, module):
+        for name in _OPERATIONS:
+            setattr(self, name, getattr(module, name, None))
+
+
+_ENGINES = {}
+_OPS = {}
+
+
+def register_engine(datastructure, module):
+    """Registra una estructura de datos para implementar listas.
+
+    Args:
+        datastructure: Nombre con el que se pide la estructura en
+        :func:`new_list`, por ejemplo ``"DOUBLE_LINKED"``.
+        module: Módulo con las funciones de la lista (``new_list``,
+        ``add_last``, ``get_element``...).
+    """
+    _ENGINES[datastructure] = module
+    _OPS[datastructure] = ListOps(module)
+
+
+register_engine("ARRAY_LIST", array_list)
+register_engine("SINGLE_LINKED", single_linked_list)
+register_engine("DOUBLE_LINKED", double_linked_list)
+
 
 def new_list(datastructure='SINGLE_LINKED',
             cmpfunction=None,
@@ -71,13 +125,15 @@ def new_list(datastructure='SINGLE_LINKED',
     """
     try:
         module = list_selector(datastructure)
-        lst = module.newList(
+        lst = module.new_list(
             cmpfunction,
-            module,
+            datastructure,
             key,
             filename,
             delimiter
         )
+        lst['datastructure'] = datastructure
+        lst['ops'] = _OPS[datastructure]
         return lst
     except Exception as exp:
         error.reraise(exp, 'TADList->newList: ')
@@ -101,7 +157,7 @@ def add_first(lst, element):
         Exception
     """
     try:
-        lst['datastructure'].add_first(lst, element)
+        lst['ops'].add_first(lst, element)
     except Exception as exp:
         error.reraise(exp, 'TADList->addFirst: ')
 
@@ -120,7 +176,7 @@ def add_last(lst, element):
         Exception
     """
     try:
-        lst['datastructure'].addlast(lst, element)
+        lst['ops'].add_last(lst, element)
     except Exception as exp:
         error.reraise(exp, 'TADList->addLast: ')
 
@@ -135,7 +191,7 @@ def is_empty(lst):
         Exception
     """
     try:
-        return lst['datastructure'].is_empty(lst)
+        return lst['ops'].is_empty(lst)
     except Exception as exp:
         error.reraise(exp, 'TADList->isEmpty: ')
 
@@ -150,7 +206,7 @@ def size(lst):
         Exception
     """
     try:
-        return lst['datastructure'].size(lst)
+        return lst['ops'].size(lst)
     except Exception as exp:
         error.reraise(exp, 'TADList->size: ')
 
@@ -166,7 +222,7 @@ def first_element(lst):
         Exception
     """
     try:
-        return lst['datastructure'].first_element(lst)
+        return lst['ops'].first_element(lst)
     except Exception as exp:
         error.reraise(exp, 'TADList->firstElement: ')
 
@@ -182,7 +238,7 @@ def last_element(lst):
         Exception
     """
     try:
-        return lst['datastructure'].last_element(lst)
+        return lst['ops'].last_element(lst)
     except Exception as exp:
         error.reraise(exp, 'TADList->LastElement: ')
 
@@ -203,7 +259,7 @@ def get_element(lst, pos):
         Exception
     """
     try:
-        return lst['datastructure'].getElement(lst, pos)
+        return lst['ops'].get_element(lst, pos)
     except Exception as exp:
         error.reraise(exp, 'List->getElement: ')
 
@@ -224,7 +280,7 @@ def delete_element(lst, pos):
         Exception
     """
     try:
-        lst['datastructure'].delete_element(lst, pos)
+        lst['ops'].delete_element(lst, pos)
     except Exception as exp:
         error.reraise(exp, 'TADList->deleteElement: ')
 
@@ -245,7 +301,7 @@ def remove_first(lst):
         Exception
     """
     try:
-        return lst['datastructure'].remove_first(lst)
+        return lst['ops'].remove_first(lst)
     except Exception as exp:
         error.reraise(exp, 'TADList->removeFirst: ')
 
@@ -266,7 +322,7 @@ def remove_last(lst):
         Exception
     """
     try:
-        return lst['datastructure'].remove_last(lst)
+        return lst['ops'].remove_last(lst)
     except Exception as exp:
         error.reraise(exp, 'TADList->removeLast: ')
 
@@ -288,7 +344,7 @@ def insert_element(lst, element, pos):
         Exception
     """
     try:
-        lst['datastructure'].insert_element(lst, element, pos)
+        lst['ops'].insert_element(lst, element, pos)
     except Exception as exp:
         error.reraise(exp, 'TADList->insertElement: ')
 
@@ -310,7 +366,8 @@ def is_present(lst, element):
         Exception
     """
     try:
-        return lst['datastructure'].is_present(lst, element)
+        return lst['ops'].is_present(lst, element,
+                                               lst['cmpfunction'])
     except Exception as exp:
         error.reraise(exp, 'TADList->isPresent: ')
 
@@ -327,7 +384,7 @@ def exchange(lst, pos1, pos2):
         Exception
     """
     try:
-        lst['datastructure'].exchange(lst, pos1, pos2)
+        lst['ops'].exchange(lst, pos1, pos2)
     except Exception as exp:
         error.reraise(exp, 'List->exchange: ')
 
@@ -346,7 +403,7 @@ def change_info(lst, pos, element):
         Exception
     """
     try:
-        lst['datastructure'].change_info(lst, pos, element)
+        lst['ops'].change_info(lst, pos, element)
     except Exception as exp:
         error.reraise(exp, 'List->changeInfo: ')
 
@@ -367,7 +424,10 @@ def sub_list(lst, pos, numelem):
         Exception
     """
     try:
-        return lst['datastructure'].sub_list(lst, pos, numelem)
+        sub = lst['ops'].sub_list(lst, pos, numelem)
+        sub['datastructure'] = lst['datastructure']
+        sub['ops'] = lst['ops']
+        return sub
     except Exception as exp:
         error.reraise(exp, 'List->subList: ')
 
@@ -381,33 +441,47 @@ def iterator(lst):
         Exception
     """
     try:
-        return lst['datastructure'].iterator(lst)
+        return lst['ops'].iterator(lst)
     except Exception as exp:
         error.reraise(exp, 'List->Iterator: ')
 
 
-"""
-Selector dinámico de la estructura de datos solicitada
-"""
-
-switch_module = {
-    "ARRAY_LIST": ".arraylist",
-    "SINGLE_LINKED": ".singlelinkedlist",
-    "DOUBLE_LINKED": ".doublelinkedlist"
-}
-
-
 def list_selector(datastructure):
     """
-    Carga dinámicamente el import de la estructura de datos
+    Retorna el módulo registrado para la estructura de datos
     seleccionada
     """
-    ds = switch_module.get(datastructure)
+    module = _ENGINES.get(datastructure)
 
-    if ds is None:
+    if module is None:
         raise Exception(
-           f"Tipo de estructura de datos no soportada. Solo se soportan: {', '.join(switch_module.keys())}"
+           f"Tipo de estructura de datos no soportada. Solo se soportan: {', '.join(_ENGINES.keys())}"
         )
-
-    module = importlib.import_module(ds, package="DISClib.DataStructures")
     return module
+
+
+def engine(lst):
+    """
+    Retorna el módulo que implementa la lista ``lst``. En ciclos que hacen
+    muchas operaciones sobre la misma lista se puede guardar el módulo en
+    una variable y llamar sus funciones directamente.
+    """
+    return _ENGINES[lst['datastructure']]
+
+
+# Nombres de las versiones anteriores del TAD, que todavía usan ``heap``,
+# ``indexheap`` y otros módulos.
+newList = new_list
+addFirst = add_first
+addLast = add_last
+isEmpty = is_empty
+firstElement = first_element
+lastElement = last_element
+getElement = get_element
+deleteElement = delete_element
+removeFirst = remove_first
+removeLast = remove_last
+insertElement = insert_element
+isPresent = is_present
+changeInfo = change_info
+subList = sub_list
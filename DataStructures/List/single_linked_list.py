@@ -6,6 +6,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from DataStructures.Utils import config
 from DataStructures.Utils import error as error
+from DataStructures.Utils.slotted import Slotted
 import csv
 assert config
 from typing import Callable
@@ -18,8 +19,7 @@ def new_list(cmpfunction=None, module='SINGLE_LINKED', key=None, filename=None,
         'size': 0,
         'key': key,
         'type': 'SINGLE_LINKED',
-        'datastructure': module,
-        'elements': list()
+        'datastructure': module
     }
 
     if cmpfunction is None:
@@ -38,16 +38,116 @@ def new_list(cmpfunction=None, module='SINGLE_LINKED', key=None, filename=None,
     return newlist
 
 def get_element(my_list, pos):
+    """
+    Retorna el elemento en la posición pos (empezando en 1) recorriendo los
+    nodos desde el primero.
+    """
     searchpos = 1
     node = my_list["first"]
-    while searchpos < pos:
-        node = node["next"]
+    while searchpos < pos and node is not None:
+        node = node.next
         searchpos += 1
 
     if node is None:
         return None  # Evitar errores
 
-    return node["info"]
+    return node.info
+
+
+def iterator(my_list):
+    """
+    Recorre los elementos de la lista en orden, siguiendo los nodos.
+    """
+    node = my_list["first"]
+    while node is not None:
+        yield node.info
+        node = node.next
+
+
+def new_cursor(my_list):
+    """ Crea un cursor para recorrer la lista y modificarla durante el
+    recorrido.
+
+    El cursor empieza antes del primer elemento; cada llamado a
+    cursor_next avanza un nodo, y cursor_set y cursor_remove actúan sobre
+    el último elemento retornado. Todas las operaciones son O(1).
+
+    Args:
+        my_list: La lista a recorrer
+    Returns:
+        El cursor
+    """
+    return {'list': my_list, 'prev': None, 'current': None}
+
+
+def _cursor_following(cursor):
+    # Nodo que sigue a la posición del cursor
+    if cursor['current'] is not None:
+        return cursor['current'].next
+    if cursor['prev'] is not None:
+        return cursor['prev'].next
+    return cursor['list']['first']
+
+
+def cursor_has_next(cursor):
+    """ Informa si quedan elementos por recorrer después del cursor."""
+    return _cursor_following(cursor) is not None
+
+
+def cursor_next(cursor):
+    """ Avanza el cursor al siguiente elemento y lo retorna.
+
+    Args:
+        cursor: El cursor
+    Returns:
+        El siguiente elemento, o None si el cursor llegó al final
+    """
+    following = _cursor_following(cursor)
+    if following is None:
+        return None
+    if cursor['current'] is not None:
+        cursor['prev'] = cursor['current']
+    cursor['current'] = following
+    return following.info
+
+
+def cursor_set(cursor, element):
+    """ Reemplaza el último elemento retornado por cursor_next.
+
+    Raises:
+        Exception: Si el cursor no está sobre un elemento
+    """
+    if cursor['current'] is None:
+        raise Exception('singlelinkedlist->cursor_set: el cursor no está sobre un elemento')
+    cursor['current'].info = element
+    return cursor
+
+
+def cursor_remove(cursor):
+    """ Elimina de la lista el último elemento retornado por cursor_next.
+
+    El cursor queda entre el elemento anterior y el siguiente, de modo que
+    cursor_next continúa el recorrido normalmente.
+
+    Returns:
+        El elemento eliminado
+    Raises:
+        Exception: Si el cursor no está sobre un elemento
+    """
+    node = cursor['current']
+    if node is None:
+        raise Exception('singlelinkedlist->cursor_remove: el cursor no está sobre un elemento')
+    my_list = cursor['list']
+    prev = cursor['prev']
+    if prev is None:
+        my_list['first'] = node.next
+    else:
+        prev.next = node.next
+    if my_list['last'] is node:
+        my_list['last'] = prev
+    my_list['size'] -= 1
+    cursor['current'] = None
+    return node.info
 
 
 def is_present(my_list, element, cmp_function):
@@ -55,10 +155,10 @@ def is_present(my_list, element, cmp_function):
     temp = my_list["first"]
     count = 0
     while not is_in_array and temp is not None:
-        if cmp_function(element, temp["info"]) == 0:
+        if cmp_function(element, temp.info) == 0:
             is_in_array = True
         else:
-            temp = temp["next"]
+            temp = temp.next
             count += 1
     
     if not is_in_array:
@@ -71,7 +171,8 @@ def add_first (my_list, element):
     """
     
     #Creamos un nuevo nodo.
-    new_node = {"info": element, "next": my_list["first"]}
+    new_node = new_single_node(element)
+    new_node.next = my_list["first"]
     
     #Si la lista es vacia, updateamos ambos el último y el primero
     if my_list["size"] == 0:
@@ -87,24 +188,18 @@ def add_first (my_list, element):
     
 def add_last(list, element):
     """
-    Añade un elemento al final de la lista y actualiza la lista de elementos
+    Añade un elemento al final de la lista
     """
-    newnode = {'info': element, 'next': None}
+    newnode = new_single_node(element)
     
     if list['first'] is None:
         list['first'] = newnode
         list['last'] = newnode
     else:
-        list['last']['next'] = newnode
+        list['last'].next = newnode
         list['last'] = newnode
 
     list['size'] += 1
-    
-    # Asegurarnos que elements es una lista antes de hacer append
-    if not isinstance(list.get('elements'), type([])):
-        list['elements'] = []
-    list['elements'].append(element)
-    
     return list
     
     
@@ -113,12 +208,12 @@ def size (my_list):
 
 def first_element(my_list):
     if my_list["size"] > 0:
-        return my_list["first"]["info"]
+        return my_list["first"].info
     return None
 
 def get_last_element(my_list):
     if my_list["size"]> 0:
-        return my_list["last"]["info"]
+        return my_list["last"].info
     
 def is_empty(my_list):
     """
@@ -138,7 +233,7 @@ def last_element(my_list):
     """
     try:
         if my_list['last'] is not None:
-            return my_list['last']['info']
+            return my_list['last'].info
         return None
     except Exception as exp:
         error.reraise(exp, 'singlelinkedlist->lastElement: ')
@@ -156,25 +251,37 @@ def remove_first(my_list):
     """
     try:
         if my_list['first'] is not None:
-            temp = my_list['first']['next']
+            temp = my_list['first'].next
             node = my_list['first']
             my_list['first'] = temp
             my_list['size'] -= 1
             if (my_list['size'] == 0):
                 my_list['last'] = my_list['first']
-            return node['info']
+            return node.info
         else:
             return None
     except Exception as exp:
         error.reraise(exp, 'singlelinkedlist->removeFirst: ')
         
         
+class SingleNode(Slotted):
+    """
+    Nodo de la lista encadenada. Sus campos se leen como atributos
+    (``node.next``) o como en un diccionario (``node["next"]``).
+    """
+
+    __slots__ = ("info", "next")
+
+    def __init__(self, element):
+        self.info = element
+        self.next = None
+
+
 def new_single_node(element):
     """
     Estructura que contiene la información a guardar en una lista encadenada
     """
-    node = {'info': element, 'next': None}
-    return(node)
+    return SingleNode(element)
 
 def insert_element(my_list, element, pos):
     """ Inserta el elemento element en la posición pos de la lista.
@@ -198,7 +305,7 @@ def insert_element(my_list, element, pos):
             my_list['last'] = new_node
 
         elif ((my_list['size'] > 0) and (pos == 1)):
-            new_node['next'] = my_list['first']
+            new_node.next = my_list['first']
             my_list['first'] = new_node
 
         else:
@@ -207,10 +314,12 @@ def insert_element(my_list, element, pos):
             current = my_list['first']
             while cont < pos:
                 prev = current
-                current = current['next']
+                current = current.next
                 cont += 1
-            new_node['next'] = current
-            prev['next'] = new_node
+            new_node.next = current
+            prev.next = new_node
+            if current is None:
+                my_list['last'] = new_node
 
         my_list['size'] += 1
         return my_list
@@ -238,13 +347,13 @@ def remove_last(my_list):
                 my_list['first'] = None
             else:
                 temp = my_list['first']
-                while temp['next'] != my_list['last']:
-                    temp = temp['next']
+                while temp.next != my_list['last']:
+                    temp = temp.next
                 node = my_list['last']
                 my_list['last'] = temp
-                my_list['last']['next'] = None
+                my_list['last'].next = None
             my_list['size'] -= 1
-            return node['info']
+            return node.info
         else:
             return None
     except Exception as exp:
@@ -270,14 +379,18 @@ def delete_element(my_list, pos):
         prev = my_list['first']
         searchpos = 1
         if (pos == 1):
-            my_list['first'] = my_list['first']['next']
+            my_list['first'] = my_list['first'].next
             my_list['size'] -= 1
+            if my_list['first'] is None:
+                my_list['last'] = None
         elif(pos > 1):
             while searchpos < pos:
                 searchpos += 1
                 prev = node
-                node = node['next']
-            prev['next'] = node['next']
+                node = node.next
+            prev.next = node.next
+            if node is my_list['last']:
+                my_list['last'] = prev
             my_list['size'] -= 1
         return my_list
     except Exception as exp:
@@ -300,9 +413,9 @@ def change_info(my_list, pos, newinfo):
         current = my_list['first']
         cont = 1
         while cont < pos:
-            current = current['next']
+            current = current.next
             cont += 1
-        current['info'] = newinfo
+        current.info = newinfo
         return my_list
     except Exception as exp:
         error.reraise(exp, 'singlelinkedlist->changeInfo: ')
@@ -343,17 +456,16 @@ def sub_list(my_list, pos, numelem):
         Exception
     """
     try:
-        sublst = {'first': None,
-                  'last': None,
-                  'size': 0,
-                  }
+        sublst = new_list(my_list.get('cmpfunction'))
+        node = my_list['first']
         cont = 1
-        loc = pos
-        while cont <= numelem:
-            elem = get_element(my_list, loc)
-            add_last(sublst, elem)
-            loc += 1
+        while cont < pos and node is not None:
+            node = node.next
             cont += 1
+        while numelem > 0 and node is not None:
+            add_last(sublst, node.info)
+            node = node.next
+            numelem -= 1
         return sublst
     except Exception as exp:
         error.reraise(exp, 'singlelinkedlist->subList: ')
@@ -370,56 +482,85 @@ def default_sort_criteria(element_1, element_2):
     
 
 def merge_sort(lst: dict, sort_crit: Callable) -> dict:
+    """ Ordena la lista con merge sort de abajo hacia arriba.
+
+    No copia elementos ni crea sublistas: en cada pasada mezcla tramos
+    consecutivos de tamaño 1, 2, 4... cambiando solo los enlaces next de los
+    nodos. Es O(n log n), usa memoria extra O(1) y es estable.
+
+    Args:
+        lst: La lista a ordenar
+        sort_crit: Función que retorna True si el primer elemento debe ir
+            antes que el segundo
+    Returns:
+        La misma lista, ordenada
+    """
     list_size = size(lst)
-    if list_size <= 1:  # Handle empty or single element lists
+    if list_size <= 1:
         return lst
-        
-    if list_size > 1:
-        mid = list_size // 2
-        # Create sublists correctly
-        _left_lt = sub_list(lst, 0, mid)
-        _right_lt = sub_list(lst, mid, list_size - mid)
-        
-        # Sort sublists
-        merge_sort(_left_lt, sort_crit)
-        merge_sort(_right_lt, sort_crit)
-        
-        # Merge process
-        i = j = k = 0
-        _n_left = size(_left_lt)
-        _n_right = size(_right_lt)
-
-        while (i < _n_left) and (j < _n_right):
-            elemi = _left_lt["elements"][i]  # Direct access instead of get_element
-            elemj = _right_lt["elements"][j]  # Direct access instead of get_element
-            if sort_crit(elemj, elemi):
-                lst["elements"][k] = elemj
-                j += 1
-            else:
-                lst["elements"][k] = elemi
-                i += 1
-            k += 1
-
-        while i < _n_left:
-            lst["elements"][k] = _left_lt["elements"][i]  # Direct access
-            i += 1
-            k += 1
-
-        while j < _n_right:
-            lst["elements"][k] = _right_lt["elements"][j]  # Direct access
-            j += 1
-            k += 1
+
+    head = lst["first"]
+    tail = None
+    width = 1
+    while width < list_size:
+        sentinel = SingleNode(None)
+        tail = sentinel
+        current = head
+        while current is not None:
+            left = current
+            right = _split(left, width)
+            current = _split(right, width)
+            tail.next, tail = _merge(left, right, sort_crit)
+        head = sentinel.next
+        width *= 2
+
+    lst["first"] = head
+    lst["last"] = tail
     return lst
 
-    
+
+def _split(node, count):
+    """ Corta la cadena después de count nodos y retorna el resto."""
+    while count > 1 and node is not None:
+        node = node.next
+        count -= 1
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge(left, right, sort_crit):
+    """ Mezcla dos cadenas ordenadas y retorna (primero, último).
+
+    Con elementos equivalentes se toma primero el de la izquierda, para
+    que el ordenamiento sea estable.
+    """
+    sentinel = SingleNode(None)
+    tail = sentinel
+    while left is not None and right is not None:
+        if sort_crit(right.info, left.info):
+            tail.next = right
+            right = right.next
+        else:
+            tail.next = left
+            left = left.next
+        tail = tail.next
+    tail.next = left if left is not None else right
+    while tail.next is not None:
+        tail = tail.next
+    return sentinel.next, tail
+
 
 def selection_sort(lst, sort_criteria: callable) -> dict:
     list_size = size(lst)  # Change variable name to avoid shadowing the function
-    pos1 = 0
-    while pos1 < list_size:
+    # Las posiciones de la lista empiezan en 1
+    pos1 = 1
+    while pos1 <= list_size:
         minimum = pos1    
         pos2 = pos1 + 1
-        while (pos2 < list_size):  # Changed <= to < to avoid index out of range
+        while (pos2 <= list_size):
             if (sort_criteria(get_element(lst, pos2),
                get_element(lst, minimum))):
                 minimum = pos2  
@@ -461,23 +602,7 @@ def sort(lst, lo, hi, sort_crit):
 def quick_sort(lst, sort_crit):
     if size(lst) <= 1:  # Handle empty or single element lists
         return lst
-    sort(lst, 0, size(lst)-1, sort_crit)  # Changed 1 to 0 for starting index, and size to size-1
-    return lst
-
-def shell_sort(lst, sort_crit):
-    n = size(lst)
-    h = 1
-    while h < n/3:   # primer gap. La lista se h-ordena con este tamaño
-        h = 3*h + 1
-    while (h >= 1):
-        for i in range(h, n):
-            j = i
-            while (j >= h) and sort_crit(
-                                lst.get_element(lst, j+1),
-                                lst.get_element(lst, j-h+1)):
-                lst.exchange(lst, j+1, j-h+1)
-                j -= h
-        h //= 3    # h se decrementa en un tercio
+    sort(lst, 1, size(lst), sort_crit)  # Las posiciones empiezan en 1
     return lst
 
 def shell_sort(lst, sort_crit):
@@ -488,10 +613,11 @@ def shell_sort(lst, sort_crit):
     while (h >= 1):
         for i in range(h, n):
             j = i
+            # get_element y exchange usan posiciones desde 1
             while (j >= h) and sort_crit(
-                                get_element(lst, j),  
-                                get_element(lst, j-h)):  
-                exchange(lst, j, j-h)  
+                                get_element(lst, j+1),
+                                get_element(lst, j-h+1)):
+                exchange(lst, j+1, j-h+1)
                 j -= h
         h //= 3
     return lst
@@ -506,27 +632,27 @@ def insertion_sort(lst, sort_crit):
     current = lst["first"]  
 
     while current is not None:
-        next_node = current["next"]  
+        next_node = current.next  
 
         
-        if sorted_head is None or sort_crit(current["info"], sorted_head["info"]):
+        if sorted_head is None or sort_crit(current.info, sorted_head.info):
             
-            current["next"] = sorted_head
+            current.next = sorted_head
             sorted_head = current
             if sorted_tail is None:
                 sorted_tail = current  
         else:
             
             prev = sorted_head
-            while prev["next"] is not None and not sort_crit(current["info"], prev["next"]["info"]):
-                prev = prev["next"]
+            while prev.next is not None and not sort_crit(current.info, prev.next.info):
+                prev = prev.next
 
             
-            current["next"] = prev["next"]
-            prev["next"] = current
+            current.next = prev.next
+            prev.next = current
 
             
-            if current["next"] is None:
+            if current.next is None:
                 sorted_tail = current
 
         current = next_node  
@@ -0,0 +1,82 @@
+from DataStructures.Map import map_flat_probing as mp
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_map = mp.new_map(0, 0.5)
+    some_map = mp.new_map(10, 0.5)
+    for i in range(1, 11):
+        mp.put(some_map, f"7500{i}-10", i)
+    return empty_map, some_map
+
+
+@handle_not_implemented
+def test_new_map():
+    my_map = mp.new_map(10, 0.5)
+    assert mp.size(my_map) == 0
+    assert mp.is_empty(my_map) is True
+    assert len(my_map["keys"]) == my_map["capacity"]
+    assert len(my_map["hashes"]) == my_map["capacity"]
+
+
+@handle_not_implemented
+def test_put_get():
+    empty_map, some_map = setup_tests()
+    mp.put(empty_map, "75009-10", 1)
+    assert mp.get(empty_map, "75009-10") == 1
+    assert mp.get(empty_map, "75009-101") is None
+
+    mp.put(some_map, "75001-10", 100)
+    assert mp.get(some_map, "75001-10") == 100
+    assert mp.size(some_map) == 10
+
+
+@handle_not_implemented
+def test_remove():
+    _, some_map = setup_tests()
+    mp.remove(some_map, "75003-10")
+    assert mp.contains(some_map, "75003-10") is False
+    assert mp.size(some_map) == 9
+    # Las llaves que siguen a la lápida en la secuencia deben seguir visibles
+    for i in (1, 2, 4, 5, 6, 7, 8, 9, 10):
+        assert mp.get(some_map, f"7500{i}-10") == i
+    mp.put(some_map, "75003-10", 3)
+    assert mp.get(some_map, "75003-10") == 3
+    assert mp.size(some_map) == 10
+
+
+@handle_not_implemented
+def test_rehash():
+    empty_map, _ = setup_tests()
+    for i in range(1000):
+        mp.put(empty_map, i, str(i))
+    assert mp.size(empty_map) == 1000
+    assert empty_map["current_factor"] <= empty_map["limit_factor"]
+    assert all(mp.get(empty_map, i) == str(i) for i in range(1000))
+
+
+@handle_not_implemented
+def test_key_set_value_set():
+    _, some_map = setup_tests()
+    mp.remove(some_map, "75005-10")
+    keys = mp.key_set(some_map)
+    values = mp.value_set(some_map)
+    assert keys["size"] == 9
+    assert sorted(values["elements"]) == [1, 2, 3, 4, 6, 7, 8, 9, 10]
+
+
+@handle_not_implemented
+def test_stats():
+    empty_map, _ = setup_tests()
+    for i in range(200):
+        mp.put(empty_map, f"{75000 + i}-10", i)
+    for i in range(0, 200, 4):
+        mp.remove(empty_map, f"{75000 + i}-10")
+    stats = mp.stats(empty_map)
+    assert stats["size"] == 150
+    assert stats["capacity"] == empty_map["capacity"]
+    assert stats["tombstones"] == 50
+    assert stats["rehash_count"] > 0
+    assert 1 <= stats["avg_probe_length"] <= stats["max_probe_length"]
+    occupied = sum(n * c for n, c in stats["cluster_histogram"].items())
+    assert occupied == stats["size"] + stats["tombstones"]
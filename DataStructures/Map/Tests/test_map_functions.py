@@ -0,0 +1,31 @@
+import math
+
+from DataStructures.Map import map_functions as mf
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def trial_division(n):
+    return n > 1 and all(n % i for i in range(2, math.isqrt(n) + 1))
+
+
+@handle_not_implemented
+def test_is_prime():
+    for n in range(-2, 3000):
+        assert mf.is_prime(n) == trial_division(n)
+    # Por encima de la tabla precalculada se usa Miller-Rabin
+    assert mf.is_prime(109345121)
+    assert mf.is_prime(2 ** 61 - 1)
+    assert not mf.is_prime(3215031751)  # pseudoprimo fuerte en bases 2,3,5,7
+    assert not mf.is_prime((2 ** 31 - 1) * (2 ** 31 - 1))
+
+
+@handle_not_implemented
+def test_next_prime():
+    assert mf.next_prime(-5) == 2
+    assert mf.next_prime(0) == 2
+    assert mf.next_prime(1) == 2
+    assert mf.next_prime(2) == 3
+    assert mf.next_prime(13) == 17
+    assert mf.next_prime(131070) == 131071
+    assert mf.next_prime(131071) == 131101
+    assert mf.next_prime(10 ** 9) == 1000000007
@@ -0,0 +1,212 @@
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_map = mp.new_map(0, 0.5)
+    incremental_map = mp.new_map(0, 0.5, rehash_step=4)
+    return empty_map, incremental_map
+
+
+@handle_not_implemented
+def test_put_get():
+    empty_map, _ = setup_tests()
+    mp.put(empty_map, "75009-10", 1)
+    mp.put(empty_map, "75009-101", 2)
+    assert mp.get(empty_map, "75009-10") == 1
+    assert mp.get(empty_map, "75009-101") == 2
+    assert mp.get(empty_map, "75009-1") is None
+    assert mp.size(empty_map) == 2
+
+
+@handle_not_implemented
+def test_rehash_in_place():
+    empty_map, _ = setup_tests()
+    table = empty_map["table"]
+    for i in range(500):
+        returned = mp.put(empty_map, i, i * 2)
+        assert returned is empty_map
+    assert empty_map["table"] is not table
+    assert empty_map["current_factor"] <= empty_map["limit_factor"]
+    assert mp.size(empty_map) == 500
+    assert all(mp.get(empty_map, i) == i * 2 for i in range(500))
+
+
+@handle_not_implemented
+def test_incremental_rehash():
+    _, incremental_map = setup_tests()
+    for i in range(500):
+        mp.put(incremental_map, i, i)
+        # Durante la migración todas las llaves siguen visibles
+        assert mp.contains(incremental_map, i // 2)
+    assert mp.size(incremental_map) == 500
+    assert all(mp.get(incremental_map, i) == i for i in range(500))
+
+    # Actualizar y borrar llaves que pueden estar aún en la tabla anterior
+    mp.rehash(incremental_map)
+    assert incremental_map["migrating"] is not None
+    mp.put(incremental_map, 7, "siete")
+    mp.remove(incremental_map, 8)
+    assert mp.get(incremental_map, 7) == "siete"
+    assert mp.contains(incremental_map, 8) is False
+    assert mp.size(incremental_map) == 499
+    assert mp.key_set(incremental_map)["size"] == 499
+
+    mp.migrate(incremental_map, incremental_map["migrating"]["capacity"])
+    assert incremental_map["migrating"] is None
+    assert mp.size(incremental_map) == 499
+
+
+@handle_not_implemented
+def test_stats():
+    empty_map, _ = setup_tests()
+    for i in range(200):
+        mp.put(empty_map, f"{75000 + i}-10", i)
+    for i in range(0, 200, 4):
+        mp.remove(empty_map, f"{75000 + i}-10")
+    stats = mp.stats(empty_map)
+    assert stats["size"] == 150
+    assert stats["capacity"] == empty_map["capacity"]
+    assert stats["tombstones"] == 50
+    assert stats["rehash_count"] > 0
+    assert 1 <= stats["avg_probe_length"] <= stats["max_probe_length"]
+    occupied = sum(n * c for n, c in stats["cluster_histogram"].items())
+    assert occupied == stats["size"] + stats["tombstones"]
+
+
+@handle_not_implemented
+def test_stats_during_migration():
+    # Las posiciones ya migradas de la tabla anterior no son lápidas
+    _, incremental_map = setup_tests()
+    for i in range(200):
+        mp.put(incremental_map, i, i)
+    mp.migrate(incremental_map, incremental_map["capacity"])
+    mp.rehash(incremental_map)
+    old = incremental_map["migrating"]
+    mp.migrate(incremental_map, old["capacity"] // 2)
+    assert incremental_map["migrating"] is old and old["pos"] > 0
+    stats = mp.stats(incremental_map)
+    assert stats["size"] == 200
+    assert stats["tombstones"] == 0
+    occupied = sum(n * c for n, c in stats["cluster_histogram"].items())
+    assert occupied == stats["size"]
+
+
+@handle_not_implemented
+def test_random_mad_params():
+    seeded_1 = mp.new_map(100, 0.5, seed=42)
+    seeded_2 = mp.new_map(100, 0.5, seed=42)
+    assert seeded_1["scale"] == seeded_2["scale"]
+    assert seeded_1["shift"] == seeded_2["shift"]
+    assert 0 < seeded_1["scale"] < seeded_1["prime"]
+    assert 0 <= seeded_1["shift"] < seeded_1["prime"]
+    for i in range(100):
+        mp.put(seeded_1, i, i)
+        mp.put(seeded_2, i, i)
+    assert mp.key_set(seeded_1)["elements"] == mp.key_set(seeded_2)["elements"]
+
+
+@handle_not_implemented
+def test_hash_func():
+    calls = []
+
+    def stop_code(key):
+        calls.append(key)
+        return int(key.split("-")[0])
+
+    my_map = mp.new_map(10, 0.5, seed=1, hash_func=stop_code)
+    mp.put(my_map, "75009-10", 1)
+    mp.put(my_map, "75009-101", 2)
+    assert mp.get(my_map, "75009-10") == 1
+    assert mp.get(my_map, "75009-101") == 2
+    assert "75009-101" in calls
+
+
+@handle_not_implemented
+def test_from_items_put_all():
+    items = [(f"{75000 + i}-10", i) for i in range(300)]
+    my_map = mp.from_items(items, 0.5)
+    assert mp.size(my_map) == 300
+    assert my_map["rehash_count"] == 0
+    assert my_map["current_factor"] <= my_map["limit_factor"]
+    assert all(mp.get(my_map, k) == v for k, v in items)
+
+    # Un generador con un size_hint corto igual termina bien construido
+    short_hint = mp.from_items((pair for pair in items), 0.5, size_hint=10)
+    assert mp.size(short_hint) == 300
+    assert short_hint["current_factor"] <= short_hint["limit_factor"]
+
+    mp.put_all(my_map, {"75000-10": "nuevo", "nueva": 1})
+    assert mp.get(my_map, "75000-10") == "nuevo"
+    assert mp.size(my_map) == 301
+
+
+@handle_not_implemented
+def test_incremental_rehash_bounded_step():
+    # Con un rehash_step pequeño la migración termina antes del siguiente
+    # rehash, y ningún put mueve más posiciones que el paso calculado
+    my_map = mp.new_map(0, 0.5, rehash_step=1)
+    moved = []
+    original_migrate = mp.migrate
+
+    def recording_migrate(a_map, num_slots):
+        old = a_map["migrating"]
+        before = old["pos"] if old is not None else 0
+        original_migrate(a_map, num_slots)
+        if old is not None:
+            moved.append((old["pos"] - before, old["step"], old["capacity"]))
+        return a_map
+
+    mp.migrate = recording_migrate
+    try:
+        for i in range(3000):
+            mp.put(my_map, i, i)
+    finally:
+        mp.migrate = original_migrate
+    assert my_map["rehash_count"] > 5
+    assert moved
+    for count, step, capacity in moved:
+        assert count <= step
+        # Solo la tabla inicial (muy pequeña) se migra de un solo paso
+        assert count < capacity or capacity < 10
+    assert all(mp.get(my_map, i) == i for i in range(3000))
+
+
+@handle_not_implemented
+def test_iterators():
+    _, incremental_map = setup_tests()
+    for i in range(100):
+        mp.put(incremental_map, i, i * 2)
+    mp.remove(incremental_map, 10)
+    mp.rehash(incremental_map)
+    # Con la migración a medias se recorren las dos tablas
+    assert incremental_map["migrating"] is not None
+    items = dict(mp.iter_items(incremental_map))
+    assert items == {i: i * 2 for i in range(100) if i != 10}
+    assert sorted(mp.iter_keys(incremental_map)) == sorted(items)
+    assert sorted(mp.iter_values(incremental_map)) == sorted(items.values())
+
+
+@handle_not_implemented
+def test_engines():
+    # Los mapas de las otras tablas se usan con las funciones de este módulo
+    for engine, map_type in (("FLAT", "FLAT_PROBING"), ("ROBIN_HOOD", "ROBIN_HOOD")):
+        my_map = mp.new_map(0, 0.5, seed=7, engine=engine)
+        assert my_map["type"] == map_type
+        for i in range(300):
+            mp.put(my_map, i, str(i))
+        mp.remove(my_map, 5)
+        assert mp.size(my_map) == 299
+        assert mp.get(my_map, 10) == "10" and mp.get(my_map, 5) is None
+        assert mp.contains(my_map, 299) and not mp.contains(my_map, 5)
+        assert sorted(mp.key_set(my_map)["elements"]) == [i for i in range(300) if i != 5]
+        assert mp.stats(my_map)["size"] == 299
+        built = mp.from_items({"a": 1, "b": 2}, engine=engine)
+        assert built["type"] == map_type and mp.get(built, "b") == 2
+    assert mp.new_map(0)["type"] == "LINEAR_PROBING"
+    raised = False
+    try:
+        mp.new_map(0, engine="CUCKOO")
+    except ValueError:
+        raised = True
+    assert raised
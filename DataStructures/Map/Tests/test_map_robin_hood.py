@@ -0,0 +1,60 @@
+import random
+
+from DataStructures.Map import map_robin_hood as mp
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_map = mp.new_map(0, 0.5)
+    some_map = mp.new_map(100, 0.7)
+    for i in range(100):
+        mp.put(some_map, f"{75000 + i}-10", i)
+    return empty_map, some_map
+
+
+@handle_not_implemented
+def test_put_get():
+    empty_map, some_map = setup_tests()
+    mp.put(empty_map, "75009-10", 1)
+    assert mp.get(empty_map, "75009-10") == 1
+    assert mp.get(empty_map, "75009-101") is None
+    assert mp.size(some_map) == 100
+    assert all(mp.get(some_map, f"{75000 + i}-10") == i for i in range(100))
+    mp.put(some_map, "75000-10", "nuevo")
+    assert mp.get(some_map, "75000-10") == "nuevo"
+    assert mp.size(some_map) == 100
+
+
+@handle_not_implemented
+def test_remove_backward_shift():
+    _, some_map = setup_tests()
+    for i in range(0, 100, 2):
+        mp.remove(some_map, f"{75000 + i}-10")
+    assert mp.size(some_map) == 50
+    for i in range(100):
+        assert mp.contains(some_map, f"{75000 + i}-10") is (i % 2 == 1)
+    # No quedan lápidas: toda casilla ocupada guarda una llave viva
+    occupied = [k for k in some_map["keys"] if k is not None]
+    assert len(occupied) == 50
+    assert mp.key_set(some_map)["size"] == 50
+
+
+@handle_not_implemented
+def test_churn_keeps_probes_bounded():
+    empty_map, _ = setup_tests()
+    rng = random.Random(7)
+    live = set()
+    for _ in range(20000):
+        key = rng.randrange(2000)
+        if key in live:
+            mp.remove(empty_map, key)
+            live.discard(key)
+        else:
+            mp.put(empty_map, key, key)
+            live.add(key)
+    stats = mp.stats(empty_map)
+    assert stats["size"] == len(live)
+    assert stats["tombstones"] == 0
+    assert stats["avg_probe_length"] < 3
+    assert sum(n * c for n, c in stats["cluster_histogram"].items()) == len(live)
+    assert all(mp.get(empty_map, k) == k for k in live)
@@ -0,0 +1,65 @@
+from DataStructures.Map import map_separate_chaining as mp
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    empty_map = mp.new_map(0, 2)
+    some_map = mp.new_map(100, 4)
+    for i in range(100):
+        mp.put(some_map, f"{75000 + i}-10", i)
+    return empty_map, some_map
+
+
+@handle_not_implemented
+def test_put_get():
+    empty_map, some_map = setup_tests()
+    mp.put(empty_map, "75009-10", 1)
+    mp.put(empty_map, "75009-101", None)
+    assert mp.get(empty_map, "75009-10") == 1
+    assert mp.get(empty_map, "75009-1") is None
+    assert mp.contains(empty_map, "75009-101")
+    assert mp.size(empty_map) == 2
+
+    mp.put(some_map, "75000-10", "nuevo")
+    assert mp.get(some_map, "75000-10") == "nuevo"
+    assert mp.size(some_map) == 100
+    assert all(mp.get(some_map, f"{75000 + i}-10") == i
+               for i in range(1, 100))
+
+
+@handle_not_implemented
+def test_remove():
+    _, some_map = setup_tests()
+    for i in range(0, 100, 3):
+        mp.remove(some_map, f"{75000 + i}-10")
+    mp.remove(some_map, "no-existe")
+    assert mp.size(some_map) == 66
+    for i in range(100):
+        assert mp.contains(some_map, f"{75000 + i}-10") == (i % 3 != 0)
+    assert sorted(mp.value_set(some_map)["elements"]) == \
+        [i for i in range(100) if i % 3]
+
+
+@handle_not_implemented
+def test_rehash_and_stats():
+    empty_map, _ = setup_tests()
+    for i in range(500):
+        mp.put(empty_map, i, i * 2)
+    stats = mp.stats(empty_map)
+    assert stats["size"] == 500
+    assert stats["rehash_count"] > 0
+    assert stats["load_factor"] < empty_map["limit_factor"]
+    assert sum(n * c for n, c in stats["cluster_histogram"].items()) == 500
+    assert sorted(mp.key_set(empty_map)["elements"]) == list(range(500))
+    assert all(mp.get(empty_map, i) == i * 2 for i in range(500))
+
+
+@handle_not_implemented
+def test_iterators():
+    empty_map, some_map = setup_tests()
+    assert list(mp.iter_items(empty_map)) == []
+    mp.remove(some_map, "75005-10")
+    items = dict(mp.iter_items(some_map))
+    assert items == {f"{75000 + i}-10": i for i in range(100) if i != 5}
+    assert sorted(mp.iter_keys(some_map)) == sorted(items)
+    assert sorted(mp.iter_values(some_map)) == sorted(items.values())
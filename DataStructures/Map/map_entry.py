@@ -2,18 +2,21 @@
   Estructura que contiene la información a guardar en una ``entry`` de un Map
 """
 
-def new_map_entry(key, value):
+def new_map_entry(key, value, hash_code=None):
     """ Retorna una pareja llave valor para ser guardada en un Map
 
         :param key: Llave de la pareja
         :type key: any
         :param value: Valor de la pareja
         :type value: any
+        :param hash_code: Hash completo de la llave, guardado para no
+            recalcularlo al comparar llaves ni al hacer rehash
+        :type hash_code: int
 
         :return: Una entrada con la pareja llave-valor
         :rtype: map_entry
     """
-    entry = {'key': key, 'value': value}
+    entry = {'key': key, 'value': value, 'hash': hash_code}
     return entry
 
 
@@ -71,3 +74,16 @@ def get_value(my_entry):
     :rtype: any
     """
     return my_entry['value']
+
+
+def get_hash(my_entry):
+    """
+    Retorna el hash guardado en la entry recibida como parámetro
+
+    :param my_entry: La pareja llave-valor
+    :type my_entry: map_entry
+
+    :return: El hash de la llave, o ``None`` si la entry no lo tiene
+    :rtype: int
+    """
+    return my_entry.get('hash')
@@ -0,0 +1,306 @@
+"""
+    Tabla de simbolos (**mapa**) con manejo de colisiones linear probing,
+    almacenada en arreglos paralelos.
+
+    Ofrece las mismas funciones que :ref:`map_linear_probing<map-linear-probing>`
+    (``new_map``, ``put``, ``get``, ``remove``, ``contains``, ``key_set``,
+    ``value_set``...), pero en lugar de guardar un ``map_entry`` por posición
+    dentro de un ``array_list``, la tabla se compone de tres arreglos
+    preasignados del tamaño de la capacidad:
+
+    - **keys**: Llaves. ``None`` marca una posición nunca usada y ``_TOMBSTONE``
+      una posición liberada por ``remove``.
+    - **values**: Valores asociados a cada llave.
+    - **hashes**: Hash completo de cada llave (``array`` de enteros de 64 bits).
+
+    Así no se crea un diccionario por posición y al recorrer la secuencia de
+    sondeo solo se comparan llaves cuyo hash coincide.
+"""
+
+from array import array
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_functions as mf
+
+# Marca de las posiciones borradas. Es un objeto único, por lo que ninguna
+# llave de usuario puede confundirse con ella.
+_TOMBSTONE = object()
+
+
+def new_map(num_elements, load_factor=0.5, prime=109345121, seed=None,
+            hash_func=None):
+    """ Crea una tabla de simbolos vacía con arreglos paralelos
+
+        :param num_elements: Número de elementos que se espera guardar
+        :type num_elements: int
+        :param load_factor: Factor de carga máximo antes de hacer rehash
+        :type load_factor: float
+        :param prime: Primo usado en la función de hash MAD
+        :type prime: int
+        :param seed: Semilla de los coeficientes aleatorios del MAD, para
+            obtener siempre la misma distribución
+        :type seed: int
+        :param hash_func: Función de hash propia; por defecto ``hash``
+        :type hash_func: function
+
+        :return: El mapa creado
+        :rtype: map_flat_probing
+    """
+    initial = int(num_elements / load_factor)
+    if initial < 1:
+        initial = 1
+    capacity = mf.next_prime(initial)
+    scale, shift = mf.new_mad_params(prime, seed)
+    return {
+        'prime': prime,
+        'capacity': capacity,
+        'scale': scale,
+        'shift': shift,
+        'hash_func': mf.new_hash_func(hash_func),
+        'keys': [None] * capacity,
+        'values': [None] * capacity,
+        'hashes': _new_hashes(capacity),
+        'current_factor': 0,
+        'limit_factor': load_factor,
+        'size': 0,
+        'tombstones': 0,
+        'rehash_count': 0,
+        'type': 'FLAT_PROBING'
+    }
+
+
+def _new_hashes(capacity):
+    return array('q', bytes(8 * capacity))
+
+
+def find_slot(my_map, key, hash_code):
+    """ Busca la posición de ``key`` recorriendo la secuencia de sondeo
+
+        Solo se comparan las llaves cuyo hash guardado es igual a
+        ``hash_code``.
+
+        :param my_map: El mapa
+        :type my_map: map_flat_probing
+        :param key: La llave buscada
+        :type key: any
+        :param hash_code: Hash completo de la llave
+        :type hash_code: int
+
+        :return: ``(True, pos)`` si la llave está en ``pos``; ``(False, pos)``
+            con la primera posición disponible si no está, o ``(False, -1)``
+            si la tabla no tiene posiciones disponibles.
+        :rtype: tuple
+    """
+    keys = my_map['keys']
+    hashes = my_map['hashes']
+    capacity = my_map['capacity']
+    pos = mf.compress(my_map, hash_code)
+    first_avail = -1
+    for _ in range(capacity):
+        slot_key = keys[pos]
+        if slot_key is None:
+            if first_avail < 0:
+                first_avail = pos
+            return False, first_avail
+        if slot_key is _TOMBSTONE:
+            if first_avail < 0:
+                first_avail = pos
+        elif hashes[pos] == hash_code and (slot_key is key or slot_key == key):
+            return True, pos
+        pos += 1
+        if pos == capacity:
+            pos = 0
+    return False, first_avail
+
+
+def put(my_map, key, value):
+    """ Agrega la pareja ``key``-``value`` al mapa o reemplaza el valor
+        si la llave ya existe.
+
+        :return: El mapa
+        :rtype: map_flat_probing
+    """
+    hash_code = my_map['hash_func'](key)
+    found, pos = find_slot(my_map, key, hash_code)
+    if found:
+        my_map['values'][pos] = value
+        return my_map
+    if pos < 0:
+        rehash(my_map)
+        found, pos = find_slot(my_map, key, hash_code)
+    if my_map['keys'][pos] is _TOMBSTONE:
+        my_map['tombstones'] -= 1
+    my_map['keys'][pos] = key
+    my_map['values'][pos] = value
+    my_map['hashes'][pos] = hash_code
+    my_map['size'] += 1
+    my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    used = my_map['size'] + my_map['tombstones']
+    if used > my_map['limit_factor'] * my_map['capacity']:
+        rehash(my_map)
+    return my_map
+
+
+def get(my_map, key):
+    """ Retorna el valor asociado a ``key`` o ``None`` si no existe"""
+    found, pos = find_slot(my_map, key, my_map['hash_func'](key))
+    if found:
+        return my_map['values'][pos]
+    return None
+
+
+def contains(my_map, key):
+    """ Informa si la llave ``key`` está en el mapa"""
+    found, _ = find_slot(my_map, key, my_map['hash_func'](key))
+    return found
+
+
+def remove(my_map, key):
+    """ Elimina la pareja asociada a ``key``, dejando una lápida en su lugar
+
+        :return: El mapa
+        :rtype: map_flat_probing
+    """
+    found, pos = find_slot(my_map, key, my_map['hash_func'](key))
+    if found:
+        my_map['keys'][pos] = _TOMBSTONE
+        my_map['values'][pos] = None
+        my_map['size'] -= 1
+        my_map['tombstones'] += 1
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    return my_map
+
+
+def size(my_map):
+    return my_map['size']
+
+
+def is_empty(my_map):
+    return my_map['size'] == 0
+
+
+def key_set(my_map):
+    """ Retorna un ``array_list`` con todas las llaves del mapa"""
+    keys = lt.new_list("ARRAY_LIST")
+    keys['elements'] = list(iter_keys(my_map))
+    keys['size'] = len(keys['elements'])
+    return keys
+
+
+def value_set(my_map):
+    """ Retorna un ``array_list`` con todos los valores del mapa"""
+    values = lt.new_list("ARRAY_LIST")
+    values['elements'] = list(iter_values(my_map))
+    values['size'] = len(values['elements'])
+    return values
+
+
+def iter_items(my_map):
+    """ Recorre las parejas ``(llave, valor)`` del mapa sin construir una
+        lista intermedia. El mapa no se debe modificar mientras se recorre.
+    """
+    for k, v in zip(my_map['keys'], my_map['values']):
+        if k is not None and k is not _TOMBSTONE:
+            yield k, v
+
+
+def iter_keys(my_map):
+    """ Recorre las llaves del mapa (ver :func:`iter_items`)"""
+    for k in my_map['keys']:
+        if k is not None and k is not _TOMBSTONE:
+            yield k
+
+
+def iter_values(my_map):
+    """ Recorre los valores del mapa (ver :func:`iter_items`)"""
+    for _, v in iter_items(my_map):
+        yield v
+
+
+def rehash(my_map):
+    """ Reconstruye la tabla sobre el mismo mapa
+
+        Si las llaves vivas superan el factor de carga la capacidad se
+        duplica (al siguiente primo); si lo que sobra son lápidas, se
+        reconstruye con la misma capacidad. Las llaves se reubican con el
+        hash guardado, sin volver a calcular ``hash``.
+
+        :return: El mismo mapa, con la tabla nueva
+        :rtype: map_flat_probing
+    """
+    capacity = my_map['capacity']
+    if my_map['size'] >= my_map['limit_factor'] * capacity:
+        capacity = mf.next_prime(2 * capacity)
+    old_keys = my_map['keys']
+    old_values = my_map['values']
+    old_hashes = my_map['hashes']
+
+    keys = [None] * capacity
+    values = [None] * capacity
+    hashes = _new_hashes(capacity)
+    my_map['capacity'] = capacity
+    for i in range(len(old_keys)):
+        k = old_keys[i]
+        if k is None or k is _TOMBSTONE:
+            continue
+        hash_code = old_hashes[i]
+        pos = mf.compress(my_map, hash_code)
+        while keys[pos] is not None:
+            pos += 1
+            if pos == capacity:
+                pos = 0
+        keys[pos] = k
+        values[pos] = old_values[i]
+        hashes[pos] = hash_code
+
+    my_map['keys'] = keys
+    my_map['values'] = values
+    my_map['hashes'] = hashes
+    my_map['tombstones'] = 0
+    my_map['current_factor'] = my_map['size'] / capacity
+    my_map['rehash_count'] += 1
+    return my_map
+
+
+def stats(my_map):
+    """ Retorna estadísticas de la distribución de las llaves en la tabla
+
+        Se calcula recorriendo los arreglos con el hash guardado de cada
+        llave, sin volver a calcular ``hash``. La longitud de sondeo de una
+        llave es el número de posiciones que revisa un ``get`` exitoso.
+        Tiene las mismas llaves que ``stats`` en
+        :ref:`map_linear_probing<map-linear-probing>` y en ``map_robin_hood``,
+        para poder comparar las tablas.
+
+        :param my_map: El mapa a examinar
+        :type my_map: map_flat_probing
+
+        :return: Diccionario con ``size``, ``capacity``, ``load_factor``,
+            ``avg_probe_length``, ``max_probe_length``, ``tombstones``,
+            ``rehash_count`` y ``cluster_histogram`` (longitud de cluster ->
+            número de clusters; las lápidas cuentan como ocupadas).
+        :rtype: dict
+    """
+    keys = my_map['keys']
+    hashes = my_map['hashes']
+    capacity = my_map['capacity']
+    total = 0
+    longest = 0
+    for pos in range(capacity):
+        k = keys[pos]
+        if k is None or k is _TOMBSTONE:
+            continue
+        probe = (pos - mf.compress(my_map, hashes[pos])) % capacity + 1
+        total += probe
+        if probe > longest:
+            longest = probe
+    histogram = mf.cluster_histogram([k is not None for k in keys])
+    return {
+        'size': my_map['size'],
+        'capacity': capacity,
+        'load_factor': my_map['size'] / capacity,
+        'avg_probe_length': total / my_map['size'] if my_map['size'] else 0,
+        'max_probe_length': longest,
+        'tombstones': my_map['tombstones'],
+        'rehash_count': my_map['rehash_count'],
+        'cluster_histogram': histogram
+    }
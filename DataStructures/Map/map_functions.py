@@ -1,31 +1,77 @@
 import math
+import random
+from bisect import bisect_left, bisect_right
+from itertools import groupby
 
 """
     Funciones auxiliares para el manejo de tablas de simbolos (**mapas**)
 """
 
+# Límite de la tabla de primos precalculada. Cubre las capacidades de los
+# mapas que se crean en los laboratorios (cada vértice crea uno) sin tener
+# que buscar primos número por número.
+_SIEVE_LIMIT = 1 << 17
+
+# Bases de Miller-Rabin con las que la prueba es determinística para
+# cualquier n < 3.3 * 10**24.
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _sieve(limit):
+    # Criba de Eratóstenes: retorna la lista ordenada de primos < limit
+    flags = bytearray([1]) * limit
+    flags[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return [i for i in range(limit) if flags[i]]
+
+
+_PRIMES = _sieve(_SIEVE_LIMIT)
+
+
+def _miller_rabin(n):
+    # Prueba de Miller-Rabin con las bases de _MR_BASES, para n impar > 37
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
 def is_prime(n):
     """ Valida si un número es primo o no
 
+        Los números menores a ``2**17`` se buscan en la tabla de primos
+        precalculada; los mayores se validan con Miller-Rabin.
+
         :param n: Número a validar
         :type n: int
 
         :return: True si es primo, False en caso contrario
     """
-    # Corner cases
-    if(n <= 1):
-        return False
-    if(n <= 3):
-        return True
-
-    if(n % 2 == 0 or n % 3 == 0):
+    if n < _SIEVE_LIMIT:
+        if n < 2:
+            return False
+        i = bisect_left(_PRIMES, n)
+        return _PRIMES[i] == n
+    if n % 2 == 0:
         return False
-
-    for i in range(5, int(math.sqrt(n) + 1), 6):
-        if(n % i == 0 or n % (i + 2) == 0):
+    for p in _MR_BASES:
+        if n % p == 0:
             return False
-
-    return True
+    return _miller_rabin(n)
 
 def next_prime(n):
     """ Encuentra el siguiente número primo mayor a n
@@ -35,20 +81,13 @@ def next_prime(n):
 
         :return: El siguiente número primo mayor a n
     """
-    found = False
-    next_p = 1
-    # Base case
-    if (n <= 1):
-        next_p = 2
-        found = True
-    next_p = int(n)
-    # Loop continuously until is_prime returns
-    # True for a number greater than n
-    while(not found):
-        next_p = next_p + 1
-        if is_prime(next_p):
-            found = True
-    return int(next_p)
+    n = int(n)
+    if n < _PRIMES[-1]:
+        return _PRIMES[bisect_right(_PRIMES, n)]
+    next_p = n + 1 if n % 2 == 0 else n + 2
+    while not is_prime(next_p):
+        next_p += 2
+    return next_p
 
 def hash_value(table, key):
 
@@ -61,6 +100,9 @@ def hash_value(table, key):
         p es un primo mayor a M,
         a y b enteros aleatoreos dentro del intervalo [0,p-1], con a > 0
 
+        Si la tabla tiene una función de hash propia (``hash_func``) se usa
+        en lugar de ``hash``.
+
         :param table: Tabla de hash
         :type table: map
         :param key: Llave a la que se le calculará el hash
@@ -70,11 +112,87 @@ def hash_value(table, key):
         :rtype int
     """
 
-    h = (hash(key))
+    return compress(table, table.get('hash_func', hash)(key))
+
+def new_mad_params(prime, seed=None):
+    """ Escoge los coeficientes aleatorios ``a`` (scale) y ``b`` (shift) del
+        método MAD, con 0 < a < p y 0 <= b < p.
+
+        :param prime: El primo ``p`` de la tabla
+        :type prime: int
+        :param seed: Semilla para obtener siempre los mismos coeficientes
+            (por ejemplo en pruebas). Si es ``None`` se usan coeficientes
+            distintos en cada llamado.
+        :type seed: int
+
+        :return: La pareja ``(scale, shift)``
+        :rtype: tuple
+    """
+    # Sin semilla se usa el generador del módulo: crear un Random nuevo lo
+    # siembra desde el sistema operativo, y eso domina el costo de new_map.
+    rng = random if seed is None else random.Random(seed)
+    scale = rng.randint(1, prime - 1)
+    shift = rng.randint(0, prime - 1)
+    return scale, shift
+
+def new_hash_func(hash_func=None):
+    """ Retorna la función que calcula el hash completo de las llaves
+
+        :param hash_func: Función de hash del usuario, o ``None`` para usar
+            ``hash``. Su resultado se pasa por ``hash`` para dejarlo en el
+            rango de enteros de 64 bits que guardan las tablas.
+        :type hash_func: function
+
+        :return: La función de hash a guardar en la tabla
+        :rtype: function
+    """
+    if hash_func is None:
+        return hash
+
+    def user_hash(key):
+        return hash(hash_func(key))
+    return user_hash
+
+def compress(table, hash_code):
+    """
+        Aplica la compresión MAD a un hash ya calculado, para obtener la
+        posición de la llave en la tabla.
+
+        :param table: Tabla de hash
+        :type table: map
+        :param hash_code: Hash completo de la llave (resultado de ``hash``)
+        :type hash_code: int
+
+        :return: Posición en la tabla
+        :rtype int
+    """
     a = table['scale']
     b = table['shift']
     p = table['prime']
     m = table['capacity']
 
-    value = int((abs(a*h + b) % p) % m)
-    return value
\ No newline at end of file
+    value = int((abs(a*hash_code + b) % p) % m)
+    return value
+
+
+def cluster_histogram(occupied):
+    """ Cuenta los clusters de una tabla de hash con direccionamiento abierto
+
+        Un cluster es una secuencia de posiciones ocupadas consecutivas. La
+        tabla es circular, así que un cluster que llega a la última posición
+        continúa en la primera.
+
+        :param occupied: Un booleano por posición de la tabla, ``True`` si
+            la posición no está libre
+        :type occupied: list
+
+        :return: Diccionario longitud del cluster -> número de clusters
+        :rtype: dict
+    """
+    runs = [sum(1 for _ in group) for flag, group in groupby(occupied) if flag]
+    if len(runs) > 1 and occupied[0] and occupied[-1]:
+        runs[0] += runs.pop()
+    histogram = {}
+    for run in runs:
+        histogram[run] = histogram.get(run, 0) + 1
+    return histogram
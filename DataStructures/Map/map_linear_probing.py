@@ -2,48 +2,184 @@ import random
 from DataStructures.List import array_list as lt
 from DataStructures.Map import map_entry as me
 from DataStructures.Map import map_functions as mf
+from DataStructures.Map import map_flat_probing
+from DataStructures.Map import map_robin_hood
 
 __EMPTY__ = me.new_map_entry("__EMPTY__", "__EMPTY__")
+# Entrada compartida por todas las posiciones libres. Nunca se modifica:
+# al ocupar una posición se reemplaza por una entrada nueva.
+__NONE__ = me.new_map_entry(None, None)
 
-def new_map(num_elements, load_factor = 0.5, prime=109345121):
+# Otras tablas de direccionamiento abierto que se pueden crear con
+# ``new_map(..., engine=...)``. Las funciones de este módulo reconocen sus
+# mapas por ``my_map['type']`` y les delegan la operación.
+_ENGINES = {
+    'FLAT': map_flat_probing,
+    'ROBIN_HOOD': map_robin_hood,
+}
+_BACKENDS = {
+    'FLAT_PROBING': map_flat_probing,
+    'ROBIN_HOOD': map_robin_hood,
+}
+_TYPE = 'LINEAR_PROBING'
+
+def new_map(num_elements, load_factor = 0.5, prime=109345121, rehash_step=0,
+            seed=None, hash_func=None, engine='LINEAR'):
+    """ Crea un mapa vacío con manejo de colisiones linear probing.
+
+        ``rehash_step`` escoge cómo crece la tabla: con 0 el rehash migra
+        todas las entradas de una vez; con un valor positivo la tabla nueva
+        se llena de forma incremental, moviendo a lo sumo ``rehash_step``
+        posiciones de la tabla anterior en cada ``put``.
+
+        Los coeficientes ``scale`` y ``shift`` del método MAD se escogen al
+        azar (``seed`` los hace reproducibles). ``hash_func`` permite usar
+        una función de hash propia en lugar de ``hash``.
+
+        ``engine`` escoge la tabla: ``'LINEAR'`` (la de este módulo),
+        ``'FLAT'`` (``map_flat_probing``) o ``'ROBIN_HOOD'``
+        (``map_robin_hood``). Los mapas de las otras tablas se usan con las
+        mismas funciones de este módulo; ``rehash_step`` solo aplica a
+        ``'LINEAR'``.
+    """
+    if engine != 'LINEAR':
+        if engine not in _ENGINES:
+            raise ValueError(f"Tabla de hash desconocida: {engine!r}")
+        return _ENGINES[engine].new_map(num_elements, load_factor, prime,
+                                        seed=seed, hash_func=hash_func)
     initial = int(num_elements / load_factor)
     if initial < 1:
         initial = 1
     capacity = mf.next_prime(initial)
-    table = lt.new_list("ARRAY_LIST")
-    for _ in range(capacity):
-        lt.add_last(table, me.new_map_entry(None, None))
+    scale, shift = mf.new_mad_params(prime, seed)
     return {
         'prime': prime,
         'capacity': capacity,
-        'scale': 1, 
-        'shift': 0,  
-        'table': table,
+        'scale': scale,
+        'shift': shift,
+        'hash_func': mf.new_hash_func(hash_func),
+        'table': new_table(capacity),
         'current_factor': 0,
         'limit_factor': load_factor,
-        'size': 0
+        'size': 0,
+        'rehash_step': rehash_step,
+        'migrating': None,
+        'rehash_count': 0,
+        'type': _TYPE
     }
 
+def new_table(capacity):
+    table = lt.new_list("ARRAY_LIST")
+    table['elements'] = [__NONE__] * capacity
+    table['size'] = capacity
+    return table
+
 def put(my_map, key, value):
-    hash_val = mf.hash_value(my_map, key)
-    found, pos = find_slot(my_map, key, hash_val)
+    if my_map['type'] != _TYPE:
+        return _BACKENDS[my_map['type']].put(my_map, key, value)
+    old = my_map['migrating']
+    if old is not None:
+        migrate(my_map, old['step'])
+        old = my_map['migrating']
+
+    hash_code = my_map['hash_func'](key)
+    found, pos = _find(my_map, key, hash_code)
 
     if found:
         entry = lt.get_element(my_map['table'], pos)
         me.set_value(entry, value)
         lt.change_info(my_map['table'], pos, entry)
     else:
-        new_entry = me.new_map_entry(key, value)
+        if old is not None:
+            # La llave puede estar aún en la tabla anterior: se saca de ahí
+            # para que viva en una sola de las dos tablas
+            old_found, old_pos = _find(old, key, hash_code)
+            if old_found:
+                lt.change_info(old['table'], old_pos, __EMPTY__)
+                my_map['size'] -= 1
+        new_entry = me.new_map_entry(key, value, hash_code)
         lt.change_info(my_map['table'], pos, new_entry)
         my_map['size'] += 1
         my_map['current_factor'] = my_map['size'] / my_map['capacity']
 
     if my_map['current_factor'] > my_map['limit_factor']:
-        my_map = rehash(my_map)
+        rehash(my_map)
+
+    return my_map
+
+def _find(my_map, key, hash_code):
+    return find_slot(my_map, key, mf.compress(my_map, hash_code), hash_code)
+
+def from_items(items, load_factor=0.5, size_hint=None, prime=109345121,
+               seed=None, hash_func=None, engine='LINEAR'):
+    """ Crea un mapa con las parejas ``(llave, valor)`` de ``items``.
+
+        La tabla se crea una sola vez con la capacidad necesaria para todos
+        los elementos (``size_hint`` si se conoce y ``items`` no tiene
+        ``len``) y luego se llena con :func:`put_all`. ``engine`` es el de
+        :func:`new_map`.
+    """
+    if isinstance(items, dict):
+        items = items.items()
+    if size_hint is None:
+        items = _sized(items)
+        size_hint = len(items)
+    my_map = new_map(size_hint, load_factor, prime, seed=seed,
+                     hash_func=hash_func, engine=engine)
+    return put_all(my_map, items, size_hint)
+
+def put_all(my_map, items, size_hint=None):
+    """ Agrega al mapa todas las parejas ``(llave, valor)`` de ``items``.
 
+        Antes de insertar se hace, a lo sumo, un rehash para que quepan
+        todos los elementos; después cada pareja se ubica directamente en
+        la tabla, sin recalcular el factor de carga por elemento. Si
+        ``size_hint`` se queda corto la tabla igual crece cuando hace falta.
+    """
+    if isinstance(items, dict):
+        items = items.items()
+    if size_hint is None:
+        items = _sized(items)
+        size_hint = len(items)
+    if my_map['type'] != _TYPE:
+        backend = _BACKENDS[my_map['type']]
+        for key, value in items:
+            backend.put(my_map, key, value)
+        return my_map
+    if my_map['migrating'] is not None:
+        migrate(my_map, my_map['migrating']['capacity'])
+    needed = int((my_map['size'] + size_hint) / my_map['limit_factor'])
+    if needed > my_map['capacity']:
+        rehash(my_map, mf.next_prime(needed))
+        migrate(my_map, my_map['capacity'])
+
+    hash_func = my_map['hash_func']
+    table = my_map['table']
+    limit = int(my_map['limit_factor'] * my_map['capacity'])
+    for key, value in items:
+        hash_code = hash_func(key)
+        found, pos = _find(my_map, key, hash_code)
+        if found:
+            me.set_value(lt.get_element(table, pos), value)
+            continue
+        lt.change_info(table, pos, me.new_map_entry(key, value, hash_code))
+        my_map['size'] += 1
+        if my_map['size'] > limit:
+            rehash(my_map)
+            migrate(my_map, my_map['capacity'])
+            table = my_map['table']
+            limit = int(my_map['limit_factor'] * my_map['capacity'])
+    my_map['current_factor'] = my_map['size'] / my_map['capacity']
     return my_map
 
-def find_slot(my_map, key, hash_value):
+def _sized(items):
+    if hasattr(items, '__len__'):
+        return items
+    return list(items)
+
+def find_slot(my_map, key, hash_value, hash_code=None):
+    if hash_code is None:
+        hash_code = my_map['hash_func'](key)
     first_avail = None
     found = False
     occupied = False
@@ -61,8 +197,8 @@ def find_slot(my_map, key, hash_value):
                 first_avail = hash_value
             if entry_key is None:
                 found = True
-        elif key == entry_key:
-            # Encontramos la clave
+        elif me.get_hash(entry) == hash_code and key == entry_key:
+            # Encontramos la clave (solo se comparan llaves con el mismo hash)
             first_avail = hash_value
             found = True
             occupied = True
@@ -93,24 +229,43 @@ def default_compare(key, entry):
     return -1
 
 def contains(my_map, key):
-    hash_val = mf.hash_value(my_map, key)
-    found, _ = find_slot(my_map, key, hash_val)
+    if my_map['type'] != _TYPE:
+        return _BACKENDS[my_map['type']].contains(my_map, key)
+    hash_code = my_map['hash_func'](key)
+    found, _ = _find(my_map, key, hash_code)
+    old = my_map['migrating']
+    if not found and old is not None:
+        found, _ = _find(old, key, hash_code)
     return found
 
 def remove(my_map, key):
-    hash_val = mf.hash_value(my_map, key)
-    found, pos = find_slot(my_map, key, hash_val)
+    if my_map['type'] != _TYPE:
+        return _BACKENDS[my_map['type']].remove(my_map, key)
+    hash_code = my_map['hash_func'](key)
+    found, pos = _find(my_map, key, hash_code)
+    table = my_map['table']
+    old = my_map['migrating']
+    if not found and old is not None:
+        found, pos = _find(old, key, hash_code)
+        table = old['table']
     if found:
-        lt.change_info(my_map['table'], pos, __EMPTY__)
+        lt.change_info(table, pos, __EMPTY__)
         my_map['size'] -= 1
         my_map['current_factor'] = my_map['size'] / my_map['capacity']
     return my_map
 
 def get(my_map, key):
-    hash_val = mf.hash_value(my_map, key)
-    found, pos = find_slot(my_map, key, hash_val)
+    if my_map['type'] != _TYPE:
+        return _BACKENDS[my_map['type']].get(my_map, key)
+    hash_code = my_map['hash_func'](key)
+    found, pos = _find(my_map, key, hash_code)
     if found:
         return me.get_value(lt.get_element(my_map['table'], pos))
+    old = my_map['migrating']
+    if old is not None:
+        found, pos = _find(old, key, hash_code)
+        if found:
+            return me.get_value(lt.get_element(old['table'], pos))
     return None
 
 def size(my_map):
@@ -121,25 +276,169 @@ def is_empty(my_map):
 
 def key_set(my_map):
     keys = lt.new_list("ARRAY_LIST")
-    for i in range(my_map['capacity']):
-        entry = lt.get_element(my_map['table'], i)
-        if me.get_key(entry) not in [None, "__EMPTY__"]:
-            lt.add_last(keys, me.get_key(entry))
+    keys['elements'] = list(iter_keys(my_map))
+    keys['size'] = len(keys['elements'])
     return keys
 
 def value_set(my_map):
     values = lt.new_list("ARRAY_LIST")
-    for i in range(my_map['capacity']):
-        entry = lt.get_element(my_map['table'], i)
-        if me.get_key(entry) not in [None, "__EMPTY__"]:
-            lt.add_last(values, me.get_value(entry))
+    values['elements'] = list(iter_values(my_map))
+    values['size'] = len(values['elements'])
     return values
 
-def rehash(my_map):
-    new_capacity = mf.next_prime(2 * my_map['capacity'])
-    new_table = new_map(new_capacity, my_map['limit_factor'], my_map['prime'])
-    for i in range(my_map['capacity']):
-        entry = lt.get_element(my_map['table'], i)
-        if me.get_key(entry) not in [None, "__EMPTY__"]:
-            new_table = put(new_table, me.get_key(entry), me.get_value(entry))
-    return new_table
+def iter_items(my_map):
+    """ Recorre las parejas ``(llave, valor)`` del mapa sin construir una
+        lista intermedia.
+
+        Durante un rehash incremental recorre también la tabla anterior.
+        El mapa no se debe modificar mientras se recorre.
+    """
+    if my_map['type'] != _TYPE:
+        yield from _BACKENDS[my_map['type']].iter_items(my_map)
+        return
+    for table in _tables(my_map):
+        for entry in table['elements']:
+            key = entry['key']
+            if key is not None and key != "__EMPTY__":
+                yield key, entry['value']
+
+def iter_keys(my_map):
+    """ Recorre las llaves del mapa (ver :func:`iter_items`)"""
+    for key, _ in iter_items(my_map):
+        yield key
+
+def iter_values(my_map):
+    """ Recorre los valores del mapa (ver :func:`iter_items`)"""
+    for _, value in iter_items(my_map):
+        yield value
+
+def _tables(my_map):
+    if my_map['migrating'] is None:
+        return (my_map['table'],)
+    return (my_map['table'], my_map['migrating']['table'])
+
+def rehash(my_map, new_capacity=None):
+    """ Duplica la capacidad del mapa (al siguiente primo) sobre el mismo
+        diccionario: se cambian la tabla, la capacidad y el factor de carga,
+        de modo que quien tenga una referencia al mapa sigue usando la tabla
+        nueva. Con ``new_capacity`` se usa esa capacidad en lugar del doble.
+
+        Si ``rehash_step`` es 0 todas las entradas se migran de inmediato.
+        Si no, la tabla anterior queda en ``my_map['migrating']`` y ``put``
+        la va vaciando con :func:`migrate`. Cada ``put`` mueve al menos
+        ``rehash_step`` posiciones, y más si hace falta para que la
+        migración termine antes de que la tabla nueva llegue a su factor de
+        carga; así ningún ``put`` tiene que migrar la tabla entera.
+    """
+    if my_map['type'] != _TYPE:
+        return _BACKENDS[my_map['type']].rehash(my_map)
+    if my_map['migrating'] is not None:
+        # No se mantienen más de dos tablas: se termina la migración en curso
+        migrate(my_map, my_map['migrating']['capacity'])
+    old = {
+        'prime': my_map['prime'],
+        'capacity': my_map['capacity'],
+        'scale': my_map['scale'],
+        'shift': my_map['shift'],
+        'hash_func': my_map['hash_func'],
+        'table': my_map['table'],
+        'pos': 0,
+        'step': my_map['capacity']
+    }
+    if new_capacity is None:
+        new_capacity = mf.next_prime(2 * my_map['capacity'])
+    # Inserciones que faltan para el siguiente rehash: la migración debe
+    # terminar en a lo sumo ese número de put
+    headroom = max(int(my_map['limit_factor'] * new_capacity) - my_map['size'], 1)
+    old['step'] = max(my_map['rehash_step'], -(-old['capacity'] // headroom))
+    my_map['table'] = new_table(new_capacity)
+    my_map['capacity'] = new_capacity
+    my_map['current_factor'] = my_map['size'] / new_capacity
+    my_map['migrating'] = old
+    my_map['rehash_count'] += 1
+    if my_map['rehash_step'] <= 0:
+        migrate(my_map, old['capacity'])
+    return my_map
+
+def migrate(my_map, num_slots):
+    """ Mueve a la tabla actual las entradas de, a lo sumo, ``num_slots``
+        posiciones de la tabla anterior, ubicándolas con el hash guardado en
+        cada entrada. Cuando la tabla anterior queda vacía se descarta.
+    """
+    old = my_map['migrating']
+    if old is None:
+        return my_map
+    old_table = old['table']
+    table = my_map['table']
+    end = min(old['pos'] + num_slots, old['capacity'])
+    for i in range(old['pos'], end):
+        entry = lt.get_element(old_table, i)
+        key = me.get_key(entry)
+        if key not in [None, "__EMPTY__"]:
+            _, pos = _find(my_map, key, me.get_hash(entry))
+            lt.change_info(table, pos, entry)
+            lt.change_info(old_table, i, __EMPTY__)
+    old['pos'] = end
+    if end >= old['capacity']:
+        my_map['migrating'] = None
+    return my_map
+
+def stats(my_map):
+    """ Retorna estadísticas de la distribución de las llaves en la tabla,
+        para ajustar la capacidad y el factor de carga.
+
+        Se calcula recorriendo la tabla (y la tabla anterior, si hay un
+        rehash incremental en curso) con el hash guardado en cada entrada,
+        sin volver a calcular ``hash`` ni buscar ninguna llave. La longitud
+        de sondeo de una llave es el número de posiciones que revisa un
+        ``get`` exitoso.
+
+        Retorna un diccionario con ``size``, ``capacity``, ``load_factor``,
+        ``avg_probe_length``, ``max_probe_length``, ``tombstones``,
+        ``rehash_count`` y ``cluster_histogram`` (longitud de cluster ->
+        número de clusters; las lápidas cuentan como ocupadas, pues
+        alargan el sondeo igual que una llave).
+    """
+    if my_map['type'] != _TYPE:
+        return _BACKENDS[my_map['type']].stats(my_map)
+    total = 0
+    longest = 0
+    tombstones = 0
+    histogram = {}
+    # En la tabla anterior las posiciones antes de ``pos`` ya se migraron:
+    # quedan con ``__EMPTY__`` pero no son lápidas de la tabla, así que no
+    # se cuentan.
+    views = [(my_map, 0)]
+    if my_map['migrating'] is not None:
+        views.append((my_map['migrating'], my_map['migrating']['pos']))
+    for view, start in views:
+        elements = view['table']['elements']
+        capacity = view['capacity']
+        for pos in range(start, capacity):
+            entry = elements[pos]
+            key = me.get_key(entry)
+            if key is None:
+                continue
+            if key == "__EMPTY__":
+                tombstones += 1
+                continue
+            home = mf.compress(view, me.get_hash(entry))
+            probe = (pos - home) % capacity + 1
+            total += probe
+            if probe > longest:
+                longest = probe
+        clusters = mf.cluster_histogram(
+            [False] * start
+            + [me.get_key(entry) is not None for entry in elements[start:]])
+        for length, count in clusters.items():
+            histogram[length] = histogram.get(length, 0) + count
+    return {
+        'size': my_map['size'],
+        'capacity': my_map['capacity'],
+        'load_factor': my_map['size'] / my_map['capacity'],
+        'avg_probe_length': total / my_map['size'] if my_map['size'] else 0,
+        'max_probe_length': longest,
+        'tombstones': tombstones,
+        'rehash_count': my_map['rehash_count'],
+        'cluster_histogram': histogram
+    }
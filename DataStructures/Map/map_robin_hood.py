@@ -0,0 +1,292 @@
+"""
+    Tabla de simbolos (**mapa**) con direccionamiento abierto Robin Hood y
+    borrado por desplazamiento hacia atrás (*backward shift deletion*).
+
+    Ofrece las mismas funciones que :ref:`map_linear_probing<map-linear-probing>`.
+    Como en ``map_flat_probing``, la tabla se guarda en arreglos paralelos
+    (llaves, valores y hashes), más un arreglo ``dists`` con la distancia de
+    cada llave a su posición inicial:
+
+    - Al insertar, una llave que ya se alejó más de su posición inicial que
+      la que ocupa la casilla le quita el lugar, y se sigue insertando la
+      llave desplazada. Así las distancias quedan parejas.
+    - Una búsqueda termina en cuanto encuentra una casilla vacía o una
+      llave más cercana a su origen que la distancia recorrida.
+    - ``remove`` no deja lápidas: corre una posición hacia atrás las llaves
+      siguientes del mismo cluster, de modo que después de muchos borrados
+      las secuencias de sondeo no crecen.
+
+    :func:`stats` permite verificar la longitud de sondeo de la tabla.
+"""
+
+from array import array
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_functions as mf
+
+
+def new_map(num_elements, load_factor=0.5, prime=109345121, seed=None,
+            hash_func=None):
+    """ Crea una tabla de simbolos Robin Hood vacía
+
+        :param num_elements: Número de elementos que se espera guardar
+        :type num_elements: int
+        :param load_factor: Factor de carga máximo antes de hacer rehash
+        :type load_factor: float
+        :param prime: Primo usado en la función de hash MAD
+        :type prime: int
+        :param seed: Semilla de los coeficientes aleatorios del MAD, para
+            obtener siempre la misma distribución
+        :type seed: int
+        :param hash_func: Función de hash propia; por defecto ``hash``
+        :type hash_func: function
+
+        :return: El mapa creado
+        :rtype: map_robin_hood
+    """
+    initial = int(num_elements / load_factor)
+    if initial < 1:
+        initial = 1
+    capacity = mf.next_prime(initial)
+    scale, shift = mf.new_mad_params(prime, seed)
+    return {
+        'prime': prime,
+        'capacity': capacity,
+        'scale': scale,
+        'shift': shift,
+        'hash_func': mf.new_hash_func(hash_func),
+        'keys': [None] * capacity,
+        'values': [None] * capacity,
+        'hashes': array('q', bytes(8 * capacity)),
+        'dists': array('l', bytes(array('l').itemsize * capacity)),
+        'current_factor': 0,
+        'limit_factor': load_factor,
+        'size': 0,
+        'rehash_count': 0,
+        'type': 'ROBIN_HOOD'
+    }
+
+
+def find_slot(my_map, key, hash_code):
+    """ Busca la posición de ``key``
+
+        :return: La posición de la llave, o -1 si no está en el mapa
+        :rtype: int
+    """
+    keys = my_map['keys']
+    hashes = my_map['hashes']
+    dists = my_map['dists']
+    capacity = my_map['capacity']
+    pos = mf.compress(my_map, hash_code)
+    dist = 0
+    while True:
+        slot_key = keys[pos]
+        if slot_key is None or dists[pos] < dist:
+            return -1
+        if hashes[pos] == hash_code and (slot_key is key or slot_key == key):
+            return pos
+        pos += 1
+        if pos == capacity:
+            pos = 0
+        dist += 1
+
+
+def _insert(my_map, key, value, hash_code):
+    # Inserta una llave que no está en el mapa, robando la casilla a las
+    # llaves que están más cerca de su posición inicial.
+    keys = my_map['keys']
+    values = my_map['values']
+    hashes = my_map['hashes']
+    dists = my_map['dists']
+    capacity = my_map['capacity']
+    pos = mf.compress(my_map, hash_code)
+    dist = 0
+    while keys[pos] is not None:
+        if dists[pos] < dist:
+            keys[pos], key = key, keys[pos]
+            values[pos], value = value, values[pos]
+            hashes[pos], hash_code = hash_code, hashes[pos]
+            dists[pos], dist = dist, dists[pos]
+        pos += 1
+        if pos == capacity:
+            pos = 0
+        dist += 1
+    keys[pos] = key
+    values[pos] = value
+    hashes[pos] = hash_code
+    dists[pos] = dist
+
+
+def put(my_map, key, value):
+    """ Agrega la pareja ``key``-``value`` al mapa o reemplaza el valor
+        si la llave ya existe.
+
+        :return: El mapa
+        :rtype: map_robin_hood
+    """
+    hash_code = my_map['hash_func'](key)
+    pos = find_slot(my_map, key, hash_code)
+    if pos >= 0:
+        my_map['values'][pos] = value
+        return my_map
+    if my_map['size'] + 1 > my_map['limit_factor'] * my_map['capacity']:
+        rehash(my_map)
+    _insert(my_map, key, value, hash_code)
+    my_map['size'] += 1
+    my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    return my_map
+
+
+def get(my_map, key):
+    """ Retorna el valor asociado a ``key`` o ``None`` si no existe"""
+    pos = find_slot(my_map, key, my_map['hash_func'](key))
+    if pos >= 0:
+        return my_map['values'][pos]
+    return None
+
+
+def contains(my_map, key):
+    """ Informa si la llave ``key`` está en el mapa"""
+    return find_slot(my_map, key, my_map['hash_func'](key)) >= 0
+
+
+def remove(my_map, key):
+    """ Elimina la pareja asociada a ``key``
+
+        Las llaves siguientes del cluster que no están en su posición
+        inicial se corren una casilla hacia atrás.
+
+        :return: El mapa
+        :rtype: map_robin_hood
+    """
+    pos = find_slot(my_map, key, my_map['hash_func'](key))
+    if pos < 0:
+        return my_map
+    keys = my_map['keys']
+    values = my_map['values']
+    hashes = my_map['hashes']
+    dists = my_map['dists']
+    capacity = my_map['capacity']
+    nxt = pos + 1 if pos + 1 < capacity else 0
+    while keys[nxt] is not None and dists[nxt] > 0:
+        keys[pos] = keys[nxt]
+        values[pos] = values[nxt]
+        hashes[pos] = hashes[nxt]
+        dists[pos] = dists[nxt] - 1
+        pos = nxt
+        nxt = pos + 1 if pos + 1 < capacity else 0
+    keys[pos] = None
+    values[pos] = None
+    dists[pos] = 0
+    my_map['size'] -= 1
+    my_map['current_factor'] = my_map['size'] / capacity
+    return my_map
+
+
+def size(my_map):
+    return my_map['size']
+
+
+def is_empty(my_map):
+    return my_map['size'] == 0
+
+
+def key_set(my_map):
+    """ Retorna un ``array_list`` con todas las llaves del mapa"""
+    keys = lt.new_list("ARRAY_LIST")
+    keys['elements'] = list(iter_keys(my_map))
+    keys['size'] = len(keys['elements'])
+    return keys
+
+
+def value_set(my_map):
+    """ Retorna un ``array_list`` con todos los valores del mapa"""
+    values = lt.new_list("ARRAY_LIST")
+    values['elements'] = list(iter_values(my_map))
+    values['size'] = len(values['elements'])
+    return values
+
+
+def iter_items(my_map):
+    """ Recorre las parejas ``(llave, valor)`` del mapa sin construir una
+        lista intermedia. El mapa no se debe modificar mientras se recorre.
+    """
+    for k, v in zip(my_map['keys'], my_map['values']):
+        if k is not None:
+            yield k, v
+
+
+def iter_keys(my_map):
+    """ Recorre las llaves del mapa (ver :func:`iter_items`)"""
+    for k in my_map['keys']:
+        if k is not None:
+            yield k
+
+
+def iter_values(my_map):
+    """ Recorre los valores del mapa (ver :func:`iter_items`)"""
+    for _, v in iter_items(my_map):
+        yield v
+
+
+def rehash(my_map):
+    """ Duplica la capacidad de la tabla (al siguiente primo) sobre el mismo
+        mapa, reubicando las llaves con su hash guardado.
+
+        :return: El mismo mapa, con la tabla nueva
+        :rtype: map_robin_hood
+    """
+    old_keys = my_map['keys']
+    old_values = my_map['values']
+    old_hashes = my_map['hashes']
+    capacity = mf.next_prime(2 * my_map['capacity'])
+    my_map['capacity'] = capacity
+    my_map['keys'] = [None] * capacity
+    my_map['values'] = [None] * capacity
+    my_map['hashes'] = array('q', bytes(8 * capacity))
+    my_map['dists'] = array('l', bytes(array('l').itemsize * capacity))
+    for i in range(len(old_keys)):
+        if old_keys[i] is not None:
+            _insert(my_map, old_keys[i], old_values[i], old_hashes[i])
+    my_map['current_factor'] = my_map['size'] / capacity
+    my_map['rehash_count'] += 1
+    return my_map
+
+
+def stats(my_map):
+    """ Retorna estadísticas de la distribución de las llaves en la tabla
+
+        Se calcula recorriendo la tabla, sin buscar ninguna llave. La
+        longitud de sondeo de una llave es el número de casillas que revisa
+        un ``get`` exitoso (su distancia más uno).
+
+        :param my_map: El mapa a examinar
+        :type my_map: map_robin_hood
+
+        :return: Diccionario con ``size``, ``capacity``, ``load_factor``,
+            ``avg_probe_length``, ``max_probe_length``, ``tombstones``
+            (siempre 0), ``rehash_count`` y ``cluster_histogram``
+            (longitud de cluster -> número de clusters).
+        :rtype: dict
+    """
+    keys = my_map['keys']
+    dists = my_map['dists']
+    capacity = my_map['capacity']
+    total = 0
+    longest = 0
+    for pos in range(capacity):
+        if keys[pos] is not None:
+            probe = dists[pos] + 1
+            total += probe
+            if probe > longest:
+                longest = probe
+    histogram = mf.cluster_histogram([k is not None for k in keys])
+    return {
+        'size': my_map['size'],
+        'capacity': capacity,
+        'load_factor': my_map['size'] / capacity,
+        'avg_probe_length': total / my_map['size'] if my_map['size'] else 0,
+        'max_probe_length': longest,
+        'tombstones': 0,
+        'rehash_count': my_map['rehash_count'],
+        'cluster_histogram': histogram
+    }
@@ -1,44 +1,69 @@
-import random
+"""
+    Tabla de simbolos (**mapa**) con manejo de colisiones separate chaining.
+
+    Cada posición de la tabla es un bucket: una lista de Python con tuplas
+    ``(hash, llave, valor)``. Las búsquedas recorren el bucket directamente,
+    comparando primero el hash guardado, así que su costo es lineal en la
+    longitud de la cadena y no crean objetos por cada llave revisada.
+"""
+
 from DataStructures.List import array_list as lt
-from DataStructures.List import single_linked_list as sll
-from DataStructures.Map import map_entry as me
 from DataStructures.Map import map_functions as mf
 
 
-def new_map(num_elements, load_factor, prime=109345121):
-    capacity = mf.next_prime(int(num_elements / load_factor))
-    table = lt.new_list('ARRAY_LIST')
-    for _ in range(capacity):
-        lt.add_last(table, sll.new_list())
+def new_map(num_elements, load_factor, prime=109345121, seed=None,
+            hash_func=None):
+    """ Crea un mapa vacío con manejo de colisiones separate chaining.
 
+        Los coeficientes ``scale`` y ``shift`` del método MAD se escogen al
+        azar (``seed`` los hace reproducibles). ``hash_func`` permite usar
+        una función de hash propia en lugar de ``hash``.
+    """
+    capacity = mf.next_prime(int(num_elements / load_factor))
+    scale, shift = mf.new_mad_params(prime, seed)
     map_table = {
         'prime': prime,
         'capacity': capacity,
-        'scale': 1,
-        'shift': 0,
-        'table': table,
+        'scale': scale,
+        'shift': shift,
+        'hash_func': mf.new_hash_func(hash_func),
+        'table': new_table(capacity),
         'current_factor': 0,
         'limit_factor': load_factor,
-        'size': 0
+        'size': 0,
+        'rehash_count': 0
     }
     return map_table
 
 
+def new_table(capacity):
+    table = lt.new_list('ARRAY_LIST')
+    table['elements'] = [[] for _ in range(capacity)]
+    table['size'] = capacity
+    return table
+
+
+def _bucket(my_map, hash_code):
+    return my_map['table']['elements'][mf.compress(my_map, hash_code)]
+
+
+def _find(bucket, key, hash_code):
+    # Posición de la llave dentro del bucket, o -1 si no está
+    for i, (entry_hash, entry_key, _) in enumerate(bucket):
+        if entry_hash == hash_code and (entry_key is key or entry_key == key):
+            return i
+    return -1
+
+
 def put(my_map, key, value):
-    pos = mf.hash_value(my_map, key)
-    bucket = lt.get_element(my_map['table'], pos)
-    found = False
-
-    for i in range(sll.size(bucket)):
-        entry = sll.get_element(bucket, i)
-        if me.get_key(entry) == key:
-            me.set_value(entry, value)
-            found = True
-            break
-
-    if not found:
-        entry = me.new_map_entry(key, value)
-        sll.add_last(bucket, entry)
+    hash_code = my_map['hash_func'](key)
+    bucket = _bucket(my_map, hash_code)
+    i = _find(bucket, key, hash_code)
+
+    if i >= 0:
+        bucket[i] = (hash_code, key, value)
+    else:
+        bucket.append((hash_code, key, value))
         my_map['size'] += 1
         my_map['current_factor'] = my_map['size'] / my_map['capacity']
 
@@ -48,33 +73,93 @@ def put(my_map, key, value):
     return my_map
 
 
+def from_items(items, load_factor, size_hint=None, prime=109345121,
+               seed=None, hash_func=None):
+    """ Crea un mapa con las parejas ``(llave, valor)`` de ``items``.
+
+        La tabla se crea una sola vez con la capacidad necesaria para todos
+        los elementos (``size_hint`` si se conoce y ``items`` no tiene
+        ``len``) y luego se llena con :func:`put_all`.
+    """
+    if isinstance(items, dict):
+        items = items.items()
+    if size_hint is None:
+        items = _sized(items)
+        size_hint = len(items)
+    my_map = new_map(size_hint, load_factor, prime, seed=seed,
+                     hash_func=hash_func)
+    return put_all(my_map, items, size_hint)
+
+
+def put_all(my_map, items, size_hint=None):
+    """ Agrega al mapa todas las parejas ``(llave, valor)`` de ``items``.
+
+        Antes de insertar se hace, a lo sumo, un rehash para que quepan
+        todos los elementos; después cada pareja va directo a su bucket,
+        sin recalcular el factor de carga por elemento. Si ``size_hint`` se
+        queda corto la tabla igual crece cuando hace falta.
+    """
+    if isinstance(items, dict):
+        items = items.items()
+    if size_hint is None:
+        items = _sized(items)
+        size_hint = len(items)
+    needed = int((my_map['size'] + size_hint) / my_map['limit_factor'])
+    if needed >= my_map['capacity']:
+        rehash(my_map, mf.next_prime(needed))
+
+    hash_func = my_map['hash_func']
+    buckets = my_map['table']['elements']
+    limit = my_map['limit_factor'] * my_map['capacity']
+    for key, value in items:
+        hash_code = hash_func(key)
+        bucket = buckets[mf.compress(my_map, hash_code)]
+        i = _find(bucket, key, hash_code)
+        if i >= 0:
+            bucket[i] = (hash_code, key, value)
+            continue
+        bucket.append((hash_code, key, value))
+        my_map['size'] += 1
+        if my_map['size'] >= limit:
+            rehash(my_map)
+            buckets = my_map['table']['elements']
+            limit = my_map['limit_factor'] * my_map['capacity']
+    my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    return my_map
+
+
+def _sized(items):
+    if hasattr(items, '__len__'):
+        return items
+    return list(items)
+
+
 def contains(my_map, key):
-    return get(my_map, key) is not None
+    hash_code = my_map['hash_func'](key)
+    return _find(_bucket(my_map, hash_code), key, hash_code) >= 0
 
 
 def remove(my_map, key):
-    pos = mf.hash_value(my_map, key)
-    bucket = lt.get_element(my_map['table'], pos)
-
-    for i in range(sll.size(bucket)):
-        entry = sll.get_element(bucket, i)
-        if me.get_key(entry) == key:
-            sll.delete_element(bucket, i + 1)
-            my_map['size'] -= 1
-            my_map['current_factor'] = my_map['size'] / my_map['capacity']
-            break
+    hash_code = my_map['hash_func'](key)
+    bucket = _bucket(my_map, hash_code)
+    i = _find(bucket, key, hash_code)
+    if i >= 0:
+        # El orden dentro del bucket no importa: se mueve la última tupla
+        # al hueco para no correr el resto de la lista.
+        last = bucket.pop()
+        if i < len(bucket):
+            bucket[i] = last
+        my_map['size'] -= 1
+        my_map['current_factor'] = my_map['size'] / my_map['capacity']
 
     return my_map
 
 
 def get(my_map, key):
-    pos = mf.hash_value(my_map, key)
-    bucket = lt.get_element(my_map['table'], pos)
-
-    for i in range(sll.size(bucket)):
-        entry = sll.get_element(bucket, i)
-        if me.get_key(entry) == key:
-            return me.get_value(entry)
+    hash_code = my_map['hash_func'](key)
+    for entry_hash, entry_key, value in _bucket(my_map, hash_code):
+        if entry_hash == hash_code and (entry_key is key or entry_key == key):
+            return value
     return None
 
 
@@ -88,48 +173,92 @@ def is_empty(my_map):
 
 def key_set(my_map):
     keys = lt.new_list('ARRAY_LIST')
-    for i in range(my_map['capacity']):
-        bucket = lt.get_element(my_map['table'], i)
-        for j in range(sll.size(bucket)):
-            entry = sll.get_element(bucket, j)
-            lt.add_last(keys, me.get_key(entry))
+    keys['elements'] = list(iter_keys(my_map))
+    keys['size'] = len(keys['elements'])
     return keys
 
 
 def value_set(my_map):
     values = lt.new_list('ARRAY_LIST')
-    for i in range(my_map['capacity']):
-        bucket = lt.get_element(my_map['table'], i)
-        for j in range(sll.size(bucket)):
-            entry = sll.get_element(bucket, j)
-            lt.add_last(values, me.get_value(entry))
+    values['elements'] = list(iter_values(my_map))
+    values['size'] = len(values['elements'])
     return values
 
 
-def rehash(my_map):
-    new_capacity = mf.next_prime(my_map['capacity'] * 2)
-
-    new_table = lt.new_list('ARRAY_LIST')
-    for _ in range(new_capacity):
-        lt.add_last(new_table, sll.new_list())
-
-    for i in range(my_map['capacity']):
-        bucket = lt.get_element(my_map['table'], i)
-        for j in range(sll.size(bucket)):
-            entry = sll.get_element(bucket, j)
-            key = me.get_key(entry)
-            value = me.get_value(entry)
-            pos = mf.hash_value({
-                'capacity': new_capacity,
-                'prime': my_map['prime'],
-                'scale': my_map['scale'],
-                'shift': my_map['shift']
-            }, key)
-            new_bucket = lt.get_element(new_table, pos)
-            sll.add_last(new_bucket, me.new_map_entry(key, value))
-
-    my_map['table'] = new_table
+def iter_items(my_map):
+    """ Recorre las parejas ``(llave, valor)`` del mapa sin construir una
+        lista intermedia. El mapa no se debe modificar mientras se recorre.
+    """
+    for bucket in my_map['table']['elements']:
+        for _, key, value in bucket:
+            yield key, value
+
+
+def iter_keys(my_map):
+    """ Recorre las llaves del mapa (ver :func:`iter_items`)"""
+    for bucket in my_map['table']['elements']:
+        for entry in bucket:
+            yield entry[1]
+
+
+def iter_values(my_map):
+    """ Recorre los valores del mapa (ver :func:`iter_items`)"""
+    for bucket in my_map['table']['elements']:
+        for entry in bucket:
+            yield entry[2]
+
+
+def rehash(my_map, new_capacity=None):
+    if new_capacity is None:
+        new_capacity = mf.next_prime(my_map['capacity'] * 2)
+
+    old_buckets = my_map['table']['elements']
+    my_map['table'] = new_table(new_capacity)
     my_map['capacity'] = new_capacity
+    buckets = my_map['table']['elements']
+    for bucket in old_buckets:
+        for entry in bucket:
+            # Se reutiliza la misma tupla y su hash guardado
+            buckets[mf.compress(my_map, entry[0])].append(entry)
+
     my_map['current_factor'] = my_map['size'] / my_map['capacity']
+    my_map['rehash_count'] += 1
 
     return my_map
+
+
+def stats(my_map):
+    """ Retorna estadísticas de la distribución de las llaves en la tabla,
+        para ajustar la capacidad y el factor de carga.
+
+        Solo se consulta el tamaño de cada bucket. La longitud de sondeo de
+        una llave es su posición dentro de la cadena (las llaves revisadas
+        por un ``get`` exitoso), así que el promedio es comparable con el
+        de ``map_linear_probing``; el máximo es la cadena más larga.
+
+        Retorna un diccionario con ``size``, ``capacity``, ``load_factor``,
+        ``avg_probe_length``, ``max_probe_length``, ``tombstones`` (siempre
+        0), ``rehash_count`` y ``cluster_histogram`` (longitud de cadena ->
+        número de buckets con esa longitud, sin contar los vacíos).
+    """
+    total = 0
+    longest = 0
+    histogram = {}
+    for bucket in my_map['table']['elements']:
+        length = len(bucket)
+        if length == 0:
+            continue
+        total += length * (length + 1) // 2
+        if length > longest:
+            longest = length
+        histogram[length] = histogram.get(length, 0) + 1
+    return {
+        'size': my_map['size'],
+        'capacity': my_map['capacity'],
+        'load_factor': my_map['size'] / my_map['capacity'],
+        'avg_probe_length': total / my_map['size'] if my_map['size'] else 0,
+        'max_probe_length': longest,
+        'tombstones': 0,
+        'rehash_count': my_map['rehash_count'],
+        'cluster_histogram': histogram
+    }
@@ -12,6 +12,20 @@ from DataStructures.List import arraylist as arlt
 
 # import error handler
 from DataStructures.Utils import error
+from DataStructures.Utils.slotted import Slotted
+
+
+class HeapEntry(Slotted):
+    """HeapEntry is an element of the heap. Its fields can be read as
+    attributes or with subscripts (``entry["key"]``), like the dict entries
+    it replaces.
+    """
+
+    __slots__ = ("key", "value")
+
+    def __init__(self, key: Any, value: Any) -> None:
+        self.key = key
+        self.value = value
 
 
 def dflt_heap_elm_cmp(id1: Any, id2: Any) -> int:
@@ -101,10 +115,7 @@ def insert(heap: dict, key: Any, value: Any) -> None:
     """
     try:
         # Create entry with key and value
-        entry = {
-            "key": key,
-            "value": value
-        }
+        entry = HeapEntry(key, value)
         # Add entry to the heap
         arlt.add_last(heap["elements"], entry)
         # Update size
@@ -150,16 +161,14 @@ def remove(heap: dict) -> Any:
 
         # Get the first element (minimum)
         first_element = arlt.get_element(heap["elements"], 0)
-        # Get the last element
-        last_element = arlt.get_element(heap["elements"], heap["size"] - 1)
-        # Replace the first element with the last
-        arlt.update(heap["elements"], 0, last_element)
-        # Remove the last element
-        arlt.update(heap["elements"], heap["size"] - 1, None)
+        # Remove the last element and move it to the top
+        last_element = arlt.remove_last(heap["elements"])
         # Update size
         heap["size"] -= 1
-        # Maintain heap property
-        _sink(heap, 0)
+        if heap["size"] > 0:
+            arlt.update(heap["elements"], 0, last_element)
+            # Maintain heap property
+            _sink(heap, 0)
         # Return the key of the removed element
         return first_element["key"]
     except Exception as exp:
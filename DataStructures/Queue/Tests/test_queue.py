@@ -77,3 +77,37 @@ def test_size():
 
     queue.dequeue(my_queue)
     assert queue.size(my_queue) == 2
+
+@handle_not_implemented
+def test_engines():
+    # Todas las estructuras de la cola respetan el orden FIFO
+    for module in ("RING_BUFFER", "ARRAY_LIST", "SINGLE_LINKED"):
+        my_queue = queue.new_queue(module=module)
+        assert my_queue["type"] == module
+        for i in range(20):
+            queue.enqueue(my_queue, i)
+        assert [queue.dequeue(my_queue) for _ in range(5)] == [0, 1, 2, 3, 4]
+        queue.enqueue(my_queue, 20)
+        assert queue.peek(my_queue) == 5
+        assert queue.size(my_queue) == 16
+        assert [queue.dequeue(my_queue) for _ in range(16)] == list(range(5, 21))
+        assert queue.is_empty(my_queue) is True
+
+@handle_not_implemented
+def test_ring_buffer_wraps_and_grows():
+    # Los índices dan la vuelta al buffer y al crecer se conserva el orden
+    my_queue = queue.new_queue()
+    assert my_queue["type"] == "RING_BUFFER"
+    expected = []
+    next_value = 0
+    for _ in range(50):
+        for _ in range(3):
+            queue.enqueue(my_queue, next_value)
+            expected.append(next_value)
+            next_value += 1
+        assert queue.dequeue(my_queue) == expected.pop(0)
+    assert queue.size(my_queue) == len(expected) == 100
+    assert my_queue["capacity"] >= 100
+    assert [queue.dequeue(my_queue) for _ in range(100)] == expected
+    assert queue.peek(my_queue) is None
+    assert all(slot is None for slot in my_queue["elements"])
@@ -4,15 +4,68 @@ import os
 # Agrega el directorio raíz del proyecto al PYTHONPATH
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from DataStructures.List import array_list as slt
+import csv
+
+from DataStructures.List import array_list as alt
+from DataStructures.List import single_linked_list as slt
+from DataStructures.Queue import ring_buffer as rb
 from DataStructures.Utils import error
 
-def new_queue(cmpfunction=None, module='SINGLE_LINKED', key=None, filename=None, delim=','):
+"""
+  Este módulo implementa el tipo abstracto de datos cola (Queue).
+
+  La estructura que guarda los elementos se escoge con el parámetro
+  ``module`` de :func:`new_queue`:
+
+  - ``RING_BUFFER`` (por defecto): buffer circular de ``ring_buffer``;
+    ``enqueue`` y ``dequeue`` cuestan O(1).
+  - ``ARRAY_LIST``: ``array_list``; ``dequeue`` corre todos los elementos
+    y cuesta O(n).
+  - ``SINGLE_LINKED``: ``single_linked_list``.
+
+  Cada cola guarda su tipo en ``queue['type']`` y las demás funciones del
+  módulo buscan en ``_ENGINES`` las operaciones de ese tipo.
+"""
+
+_ENGINES = {
+    'RING_BUFFER': {
+        'new': lambda cmpfunction, key: rb.new_queue(cmpfunction, key),
+        'enqueue': rb.enqueue,
+        'dequeue': rb.dequeue,
+        'peek': rb.peek,
+        'is_empty': rb.is_empty,
+        'size': rb.size,
+    },
+    'ARRAY_LIST': {
+        'new': lambda cmpfunction, key: alt.new_list(cmpfunction, 'ARRAY_LIST', key),
+        'enqueue': alt.add_last,
+        'dequeue': alt.remove_first,
+        'peek': alt.first_element,
+        'is_empty': alt.is_empty,
+        'size': alt.size,
+    },
+    'SINGLE_LINKED': {
+        'new': lambda cmpfunction, key: slt.new_list(cmpfunction, 'SINGLE_LINKED', key),
+        'enqueue': slt.add_last,
+        'dequeue': slt.remove_first,
+        'peek': slt.first_element,
+        'is_empty': slt.is_empty,
+        'size': slt.size,
+    },
+}
+
+
+def _engine(queue):
+    return _ENGINES[queue['type']]
+
+
+def new_queue(cmpfunction=None, module='RING_BUFFER', key=None, filename=None, delim=','):
     """ Crea una cola vacía.
 
     Args:
         cmpfunction: Función de comparación (opcional)
-        module: Indica el tipo de estructura de datos a utilizar para implementar la cola
+        module: Estructura que guarda los elementos: ``RING_BUFFER``,
+            ``ARRAY_LIST`` o ``SINGLE_LINKED``
         key: Clave para la lista (opcional)
         filename: Nombre del archivo (opcional)
         delim: Delimitador para el archivo CSV (opcional)
@@ -22,12 +75,17 @@ def new_queue(cmpfunction=None, module='SINGLE_LINKED', key=None, filename=None,
         Exception
     """
     try:
-        return slt.new_list(cmpfunction, module, key, filename, delim)
+        queue = _ENGINES[module]['new'](cmpfunction, key)
+        if filename is not None:
+            with open(filename, encoding="utf-8") as input_file:
+                for line in csv.DictReader(input_file, delimiter=delim):
+                    enqueue(queue, line)
+        return queue
     except Exception as exp:
         error.reraise(exp, 'TADQueue->newQueue: ')
 
 def enqueue(queue, element):
-    """Agrega el elemento element en el tope de la pila
+    """Agrega el elemento element al final de la cola
     Args:
         queue: La cola donde se insertará el elemento
         element:  El elemento a insertar
@@ -38,7 +96,7 @@ def enqueue(queue, element):
         Exception
     """
     try:
-        slt.add_last(queue, element)
+        _engine(queue)['enqueue'](queue, element)
         return queue
     except Exception as ex:
         error.reraise(ex, 'enqueue ')
@@ -54,7 +112,7 @@ def dequeue(queue):
         Exception
     """
     try:
-        return slt.remove_first(queue)
+        return _engine(queue)['dequeue'](queue)
     except Exception as exp:
         error.reraise(exp, 'TADQueue->dequeue: ')
 
@@ -69,7 +127,7 @@ def peek(queue):
         Exception
     """
     try:
-        return slt.first_element(queue)
+        return _engine(queue)['peek'](queue)
     except Exception as exp:
         error.reraise(exp, 'TADQueue->peek: ')
 
@@ -84,7 +142,7 @@ def is_empty(queue):
         Exception
     """
     try:
-        return slt.is_empty(queue)
+        return _engine(queue)['is_empty'](queue)
     except Exception as exp:
         error.reraise(exp, 'TADQueue->isEmpty: ')
 
@@ -100,6 +158,6 @@ def size(queue):
         Exception
     """
     try:
-        return slt.size(queue)
+        return _engine(queue)['size'](queue)
     except Exception as exp:
         error.reraise(exp, 'TADQueue->size: ')
\ No newline at end of file
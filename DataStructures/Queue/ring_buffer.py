@@ -0,0 +1,128 @@
+"""
+  Este módulo implementa una cola (Queue) sobre un buffer circular.
+
+  Los elementos se guardan en una lista de Python de tamaño fijo
+  (``capacity``). ``head`` es la posición del primer elemento y el siguiente
+  elemento a encolar va en ``(head + size) % capacity``, de modo que
+  ``enqueue`` y ``dequeue`` solo mueven índices: no se corre ningún
+  elemento, a diferencia de ``remove_first`` en ``array_list``, que saca la
+  posición 0 de la lista y cuesta O(n).
+
+  Cuando el buffer se llena, su capacidad se duplica y los elementos se
+  copian en orden al inicio del buffer nuevo, así que el costo amortizado de
+  ``enqueue`` es O(1).
+"""
+
+_MIN_CAPACITY = 8
+
+
+def new_queue(cmpfunction=None, key=None, capacity=_MIN_CAPACITY):
+    """Crea una cola vacía sobre un buffer circular.
+
+    Args:
+        cmpfunction: Función de comparación (opcional)
+        key: Clave de los elementos (opcional)
+        capacity: Capacidad inicial del buffer. Crece sola si se llena.
+    Returns:
+        Un diccionario que representa la cola
+    """
+    capacity = max(int(capacity), 1)
+    return {'elements': [None] * capacity,
+            'head': 0,
+            'size': 0,
+            'capacity': capacity,
+            'type': 'RING_BUFFER',
+            'cmpfunction': cmpfunction,
+            'key': key}
+
+
+def enqueue(queue, element):
+    """Agrega ``element`` al final de la cola.
+
+    Args:
+        queue: La cola donde se insertará el elemento
+        element: El elemento a insertar
+    Returns:
+        La cola modificada
+    """
+    if queue['size'] == queue['capacity']:
+        _grow(queue)
+    pos = queue['head'] + queue['size']
+    if pos >= queue['capacity']:
+        pos -= queue['capacity']
+    queue['elements'][pos] = element
+    queue['size'] += 1
+    return queue
+
+
+def dequeue(queue):
+    """Retorna el primer elemento de la cola y lo elimina.
+
+    Args:
+        queue: La cola donde se eliminará el elemento
+    Returns:
+        El primer elemento de la cola
+    Raises:
+        IndexError: Si la cola está vacía
+    """
+    if queue['size'] == 0:
+        raise IndexError('dequeue de una cola vacía')
+    elements = queue['elements']
+    head = queue['head']
+    element = elements[head]
+    # Se libera la referencia para no retener el elemento en el buffer
+    elements[head] = None
+    head += 1
+    queue['head'] = head if head < queue['capacity'] else 0
+    queue['size'] -= 1
+    return element
+
+
+def peek(queue):
+    """Retorna el primer elemento de la cola sin eliminarlo.
+
+    Args:
+        queue: La cola a examinar
+    Returns:
+        El primer elemento, o ``None`` si la cola está vacía
+    """
+    if queue['size'] == 0:
+        return None
+    return queue['elements'][queue['head']]
+
+
+def is_empty(queue):
+    """Informa si la cola es vacía."""
+    return queue['size'] == 0
+
+
+def size(queue):
+    """Informa el número de elementos en la cola."""
+    return queue['size']
+
+
+def iterator(queue):
+    """Recorre los elementos de la cola del primero al último, sin
+    sacarlos. La cola no se debe modificar mientras se recorre.
+    """
+    elements = queue['elements']
+    capacity = queue['capacity']
+    pos = queue['head']
+    for _ in range(queue['size']):
+        yield elements[pos]
+        pos += 1
+        if pos == capacity:
+            pos = 0
+
+
+def _grow(queue):
+    # Duplica la capacidad dejando los elementos en orden desde la
+    # posición 0 del buffer nuevo.
+    elements = queue['elements']
+    head = queue['head']
+    capacity = queue['capacity']
+    new_capacity = max(2 * capacity, _MIN_CAPACITY)
+    queue['elements'] = (elements[head:] + elements[:head]
+                         + [None] * (new_capacity - capacity))
+    queue['head'] = 0
+    queue['capacity'] = new_capacity
@@ -77,3 +77,38 @@ def test_size():
 
     stack.pop(my_stack)
     assert stack.size(my_stack) == 2
+
+@handle_not_implemented
+def test_engines():
+    # Todas las estructuras de la pila respetan el orden LIFO
+    for module in ("ARRAY_LIST", "SINGLE_LINKED"):
+        my_stack = stack.new_stack(module=module)
+        assert my_stack["type"] == module
+        for i in range(20):
+            stack.push(my_stack, i)
+        assert [stack.pop(my_stack) for _ in range(5)] == [19, 18, 17, 16, 15]
+        stack.push(my_stack, 99)
+        assert stack.top(my_stack) == 99
+        assert stack.size(my_stack) == 16
+        assert [stack.pop(my_stack) for _ in range(16)] == [99] + list(range(14, -1, -1))
+        assert stack.is_empty(my_stack) is True
+
+@handle_not_implemented
+def test_default_engine():
+    # Por defecto la pila es un array_list cuyo tope es el último elemento
+    my_stack = stack.new_stack()
+    assert my_stack["type"] == "ARRAY_LIST"
+    for i in range(10):
+        stack.push(my_stack, i)
+    assert my_stack["elements"] == list(range(10))
+    assert stack.pop(my_stack) == 9
+    assert my_stack["elements"] == list(range(9))
+    for _ in range(9):
+        stack.pop(my_stack)
+    assert stack.is_empty(my_stack) is True
+    raised = False
+    try:
+        stack.pop(my_stack)
+    except Exception:
+        raised = True
+    assert raised
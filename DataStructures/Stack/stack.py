@@ -29,20 +29,57 @@ from DataStructures.Utils import config
 from DataStructures.Utils import error as error
 from DataStructures.List import list as lt
 assert config
+import csv
+from DataStructures.List import array_list as alt
 from DataStructures.List import single_linked_list as slt
 
 """
-  Este módulo implementa el tipo abstracto de datos pila
-  (Stack) sobre una lista encadenada.
-"""
+  Este módulo implementa el tipo abstracto de datos pila (Stack).
+
+  La estructura que guarda los elementos se escoge con el parámetro
+  ``module`` de :func:`new_stack`:
 
+  - ``ARRAY_LIST`` (por defecto): ``array_list``; el tope es el último
+    elemento del arreglo, así que ``push`` y ``pop`` cuestan O(1)
+    amortizado.
+  - ``SINGLE_LINKED``: ``single_linked_list``; ``pop`` recorre la cadena
+    para encontrar el nuevo tope y cuesta O(n).
 
-def new_stack(cmpfunction=None, module='SINGLE_LINKED', key=None, filename=None, delim=','):
+  Cada pila guarda su tipo en ``stack['type']`` y las demás funciones del
+  módulo buscan en ``_ENGINES`` las operaciones de ese tipo.
+"""
+
+_ENGINES = {
+    'ARRAY_LIST': {
+        'new': lambda cmpfunction, key: alt.new_list(cmpfunction, 'ARRAY_LIST', key),
+        'push': alt.add_last,
+        'pop': alt.remove_last,
+        'top': alt.last_element,
+        'is_empty': alt.is_empty,
+        'size': alt.size,
+    },
+    'SINGLE_LINKED': {
+        'new': lambda cmpfunction, key: slt.new_list(cmpfunction, 'SINGLE_LINKED', key),
+        'push': slt.add_last,
+        'pop': slt.remove_last,
+        'top': slt.last_element,
+        'is_empty': slt.is_empty,
+        'size': slt.size,
+    },
+}
+
+
+def _engine(stack):
+    return _ENGINES[stack['type']]
+
+
+def new_stack(cmpfunction=None, module='ARRAY_LIST', key=None, filename=None, delim=','):
     """ Crea una pila vacía.
 
     Args:
         cmpfunction: Función de comparación (opcional)
-        module: Indica el tipo de estructura de datos a utilizar para implementar la pila
+        module: Estructura que guarda los elementos: ``ARRAY_LIST`` o
+            ``SINGLE_LINKED``
         key: Clave para la lista (opcional)
         filename: Nombre del archivo (opcional)
         delim: Delimitador para el archivo CSV (opcional)
@@ -52,7 +89,12 @@ def new_stack(cmpfunction=None, module='SINGLE_LINKED', key=None, filename=None,
         Exception
     """
     try:
-        return slt.new_list(cmpfunction, module, key, filename, delim)
+        stack = _ENGINES[module]['new'](cmpfunction, key)
+        if filename is not None:
+            with open(filename, encoding="utf-8") as input_file:
+                for line in csv.DictReader(input_file, delimiter=delim):
+                    push(stack, line)
+        return stack
     except Exception as exp:
         error.reraise(exp, 'TADStack->newStack: ')
 
@@ -71,7 +113,7 @@ def push(stack, element):
         Exception
     """
     try:
-        slt.add_last(stack, element)
+        _engine(stack)['push'](stack, element)
         return stack
     except Exception as exp:
         error.reraise(exp, 'TADStack->Push: ')
@@ -90,8 +132,8 @@ def pop(stack):
         Exception
     """
     try:
-        if stack is not None and not slt.is_empty(stack):
-            return slt.remove_last(stack)
+        if stack is not None and not _engine(stack)['is_empty'](stack):
+            return _engine(stack)['pop'](stack)
         else:
             raise Exception
     except Exception as exp:
@@ -111,7 +153,7 @@ def is_empty(stack):
         Exception
     """
     try:
-        return slt.is_empty(stack)
+        return _engine(stack)['is_empty'](stack)
     except Exception as exp:
         error.reraise(exp, 'TADStack->isEmpty: ')
 
@@ -129,7 +171,7 @@ def top(stack):
         Exception
     """
     try:
-        return slt.last_element(stack)
+        return _engine(stack)['top'](stack)
     except Exception as exp:
         error.reraise(exp, 'TADStack->top: ')
 
@@ -146,6 +188,6 @@ def size(stack):
         Exception
     """
     try:
-        return slt.size(stack)
+        return _engine(stack)['size'](stack)
     except Exception as exp:
         error.reraise(exp, 'TADStack->size: ')
\ No newline at end of file
@@ -594,3 +594,127 @@ def test_values():
     keys_size = bst.keys(seven_bst, 20, 60)["size"]
     values_size = bst.values(seven_bst, 20, 60)["size"]
     assert keys_size == values_size, "keys y values deben tener el mismo tamaño para el mismo rango"
+
+
+def to_list(lst):
+    result = []
+    node = lst["first"]
+    while node is not None:
+        result.append(node["info"])
+        node = node["next"]
+    return result
+
+
+def check_sizes(node):
+    if node is None:
+        return 0
+    size = 1 + check_sizes(node["left"]) + check_sizes(node["right"])
+    assert node["size"] == size
+    return size
+
+
+@handle_not_implemented
+def test_sorted_input_without_recursion():
+    # 2000 llaves ordenadas forman una cadena más profunda que el límite
+    # de recursión por defecto
+    tree = setup_tests()
+    for i in range(2000):
+        bst.put(tree, i, i)
+    assert bst.size(tree) == 2000
+    assert bst.height(tree) == 2000
+    assert bst.get(tree, 1999) == 1999
+    assert to_list(bst.keys(tree, 10, 19)) == list(range(10, 20))
+    assert bst.key_set(tree)["size"] == 2000
+    bst.remove(tree, 1000)
+    bst.delete_min(tree)
+    bst.delete_max(tree)
+    assert bst.size(tree) == 1997
+    assert bst.get_min(tree) == 1
+    assert bst.get_max(tree) == 1998
+
+
+@handle_not_implemented
+def test_random_put_remove():
+    import random
+    rnd = random.Random(11)
+    tree = setup_tests()
+    expected = {}
+    for _ in range(2000):
+        k = rnd.randrange(300)
+        if rnd.random() < 0.6:
+            bst.put(tree, k, -k)
+            expected[k] = -k
+        else:
+            bst.remove(tree, k)
+            expected.pop(k, None)
+    check_sizes(tree["root"])
+    assert bst.size(tree) == len(expected)
+    assert to_list(bst.key_set(tree)) == sorted(expected)
+    assert to_list(bst.value_set(tree)) == [expected[k] for k in sorted(expected)]
+    assert to_list(bst.keys(tree, 100, 199)) == \
+        [k for k in sorted(expected) if 100 <= k <= 199]
+
+
+@handle_not_implemented
+def test_order_statistics():
+    seven_bst = setup_seven_nodes()
+    keys = [10, 20, 30, 40, 50, 60, 70]
+    for i, k in enumerate(keys):
+        assert bst.select(seven_bst, i) == k
+        assert bst.rank(seven_bst, k) == i
+    assert bst.select(seven_bst, 7) is None
+    assert bst.rank(seven_bst, 35) == 3
+    assert bst.rank(seven_bst, 99) == 7
+    assert bst.floor(seven_bst, 35) == 30
+    assert bst.floor(seven_bst, 5) is None
+    assert bst.ceiling(seven_bst, 35) == 40
+    assert bst.ceiling(seven_bst, 75) is None
+    assert bst.count_range(seven_bst, 20, 60) == 5
+    assert bst.count_range(seven_bst, 15, 45) == 3
+    assert bst.count_range(seven_bst, 45, 15) == 0
+
+
+@handle_not_implemented
+def test_iter_range():
+    seven_bst = setup_seven_nodes()
+    assert list(bst.iter_range(seven_bst, 20, 55)) == \
+        [(20, 20), (30, 30), (40, 40), (50, 50)]
+    assert [k for k, _ in bst.iter_range(seven_bst, 20, 55, reverse=True)] == \
+        [50, 40, 30, 20]
+    assert [k for k, _ in bst.iter_range(seven_bst, hi=30)] == [10, 20, 30]
+    assert [k for k, _ in bst.iter_range(seven_bst, lo=65, reverse=True)] == [70]
+    assert list(bst.iter_range(seven_bst, 41, 49)) == []
+    assert list(bst.iter_range(setup_tests(), 1, 10)) == []
+
+    # Se puede detener sin recorrer el resto
+    pages = bst.iter_range(seven_bst)
+    assert next(pages) == (10, 10)
+    assert next(pages) == (20, 20)
+
+
+@handle_not_implemented
+def test_from_sorted_and_rebalance():
+    items = [(i, str(i)) for i in range(1000)]
+    tree = bst.from_sorted(items)
+    check_sizes(tree["root"])
+    assert bst.size(tree) == 1000
+    assert bst.height(tree) == 10
+    assert bst.get(tree, 777) == "777"
+    assert bst.select(tree, 500) == 500
+
+    assert bst.size(bst.from_sorted([])) == 0
+    assert bst.get(bst.from_sorted([(1, "a"), (1, "b")]), 1) == "b"
+    try:
+        bst.from_sorted([(2, 2), (1, 1)])
+        assert False, "from_sorted debe rechazar llaves desordenadas"
+    except ValueError:
+        pass
+
+    chain = setup_tests()
+    for i in range(500):
+        bst.put(chain, i, i)
+    pairs = list(bst.iter_range(chain))
+    bst.rebalance(chain)
+    check_sizes(chain["root"])
+    assert bst.height(chain) == 9
+    assert list(bst.iter_range(chain)) == pairs
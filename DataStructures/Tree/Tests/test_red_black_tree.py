@@ -0,0 +1,105 @@
+import math
+import random
+
+from DataStructures.Tree import red_black_tree as rbt
+from DataStructures.Tree import rbt_node
+from DataStructures.List import single_linked_list as sllt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests(n=0, shuffle=False):
+    tree = rbt.new_map()
+    codes = list(range(n))
+    if shuffle:
+        random.Random(7).shuffle(codes)
+    for code in codes:
+        rbt.put(tree, code, str(code))
+    return tree
+
+
+def to_list(lst):
+    return list(sllt.iterator(lst))
+
+
+def check_invariants(tree):
+    # Retorna el número de nodos negros de cualquier camino raíz-hoja
+    def walk(node, lo, hi):
+        if node is None:
+            return 1
+        assert lo is None or node["key"] > lo
+        assert hi is None or node["key"] < hi
+        assert not rbt_node.is_red(node["right"]), "enlace rojo a la derecha"
+        assert not (rbt_node.is_red(node) and rbt_node.is_red(node["left"]))
+        left = walk(node["left"], lo, node["key"])
+        right = walk(node["right"], node["key"], hi)
+        assert left == right, "caminos con distinto número de negros"
+        size = 1 + rbt._size(node["left"]) + rbt._size(node["right"])
+        assert node["size"] == size
+        return left + (0 if rbt_node.is_red(node) else 1)
+
+    assert not rbt_node.is_red(tree["root"])
+    walk(tree["root"], None, None)
+
+
+@handle_not_implemented
+def test_put_get_sorted_input():
+    tree = setup_tests(1000)
+    check_invariants(tree)
+    assert rbt.size(tree) == 1000
+    assert rbt.height(tree) <= 2 * math.log2(1001)
+    assert all(rbt.get(tree, i) == str(i) for i in range(1000))
+    assert rbt.get(tree, 1000) is None
+
+    rbt.put(tree, 5, "cinco")
+    assert rbt.get(tree, 5) == "cinco"
+    assert rbt.size(tree) == 1000
+
+
+@handle_not_implemented
+def test_empty_tree():
+    tree = setup_tests()
+    assert rbt.is_empty(tree)
+    assert rbt.height(tree) == 0
+    assert rbt.get_min(tree) is None
+    assert rbt.get_max(tree) is None
+    assert rbt.remove(tree, 1) is tree
+    assert sllt.size(rbt.keys(tree, 0, 10)) == 0
+
+
+@handle_not_implemented
+def test_remove():
+    tree = setup_tests(300, shuffle=True)
+    order = list(range(300))
+    random.Random(3).shuffle(order)
+    for i, key in enumerate(order[:200]):
+        rbt.remove(tree, key)
+        if i % 20 == 0:
+            check_invariants(tree)
+    rbt.remove(tree, 1000)
+    check_invariants(tree)
+    remaining = sorted(order[200:])
+    assert rbt.size(tree) == 100
+    assert to_list(rbt.key_set(tree)) == remaining
+    assert all(not rbt.contains(tree, k) for k in order[:200])
+
+
+@handle_not_implemented
+def test_min_max():
+    tree = setup_tests(50, shuffle=True)
+    assert rbt.get_min(tree) == 0
+    assert rbt.get_max(tree) == 49
+    rbt.delete_min(tree)
+    rbt.delete_max(tree)
+    check_invariants(tree)
+    assert rbt.get_min(tree) == 1
+    assert rbt.get_max(tree) == 48
+    assert rbt.size(tree) == 48
+
+
+@handle_not_implemented
+def test_keys_values_range():
+    tree = setup_tests(100, shuffle=True)
+    assert to_list(rbt.keys(tree, 10, 20)) == list(range(10, 21))
+    assert to_list(rbt.values(tree, 95, 200)) == [str(i) for i in range(95, 100)]
+    assert to_list(rbt.keys(tree, 200, 300)) == []
+    assert to_list(rbt.value_set(tree)) == [str(i) for i in range(100)]
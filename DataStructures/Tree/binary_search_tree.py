@@ -47,7 +47,70 @@ def new_map(cmp_func=dflt_tree_node_cmp) -> dict:
             _new_bst["cmp_func"] = dflt_tree_node_cmp
         return _new_bst
     except Exception as exp:
-        error.reraise("bst", "new_tree()", exp)
+        error.reraise(exp, "bst:new_map()")
+
+
+def from_sorted(items, cmp_func=dflt_tree_node_cmp) -> dict:
+    """Crea un BST balanceado con las parejas ``(llave, valor)`` de
+    ``items``, que deben venir ordenadas por llave.
+
+    El árbol se arma en O(n), tomando como raíz de cada subárbol el
+    elemento del medio, y su altura es ``ceil(log2(n + 1))``. Si una llave
+    se repite seguida se conserva el último valor, como con :func:`put`.
+
+    Args:
+        items: Iterable de parejas ``(llave, valor)`` en orden ascendente.
+        cmp_func (Callable): Función de comparación de las llaves.
+
+    Returns:
+        dict: El árbol creado.
+
+    Raises:
+        ValueError: Si las llaves no están en orden ascendente.
+    """
+    tree = new_map(cmp_func)
+    nodes = []
+    for k, v in items:
+        if nodes:
+            _cmp = tree["cmp_func"](k, nodes[-1].key)
+            if _cmp < 0:
+                raise ValueError("bst:from_sorted(): las llaves no están ordenadas")
+            if _cmp == 0:
+                nodes[-1].value = v
+                continue
+        nodes.append(new_node(k, v))
+    tree["root"] = _link_balanced(nodes, 0, len(nodes) - 1)
+    return tree
+
+
+def rebalance(tree: dict) -> dict:
+    """Reorganiza el BST para que quede balanceado, en tiempo lineal.
+
+    Los nodos se recorren en orden y se vuelven a enlazar con
+    el mismo procedimiento de :func:`from_sorted`, sin crear nodos nuevos.
+
+    Returns:
+        dict: El mismo árbol, balanceado.
+    """
+    try:
+        nodes = list(_inorder(tree["root"]))
+        tree["root"] = _link_balanced(nodes, 0, len(nodes) - 1)
+        return tree
+    except Exception as exp:
+        error.reraise(exp, "bst:rebalance()")
+
+
+def _link_balanced(nodes: list, lo: int, hi: int) -> dict:
+    """Enlaza ``nodes[lo..hi]`` (ordenados) como un subárbol balanceado y
+    retorna su raíz. La profundidad de la recursión es log2(n)."""
+    if lo > hi:
+        return None
+    mid = (lo + hi) // 2
+    node = nodes[mid]
+    node.left = _link_balanced(nodes, lo, mid - 1)
+    node.right = _link_balanced(nodes, mid + 1, hi)
+    node.size = hi - lo + 1
+    return node
 
 
 def put(tree: dict, k: Any, v: Any) -> dict:
@@ -59,131 +122,131 @@ def put(tree: dict, k: Any, v: Any) -> dict:
         v (Any): Valor del nodo.
     """
     try:
-        _root = tree["root"]
-        _cmp = tree["cmp_func"]
-        _root = _put(_root, k, v, _cmp)
-        tree["root"] = _root
+        tree["root"] = _put(tree["root"], k, v, tree["cmp_func"])
         return tree
     except Exception as exp:
-        error.reraise("bst", "put()", exp)
+        error.reraise(exp, "bst:put()")
 
 
 def _put(node: dict, k: Any, v: Any, cmp_func: Callable) -> dict:
-    """Función recursiva para insertar un nodo en el BST."""
-    try:
-        if node is None:
-            node = new_node(k, v)
+    """Inserta la pareja bajando desde ``node`` sin recursión.
+
+    Si la llave ya existe solo se reemplaza el valor. Si es nueva, se
+    cuelga una hoja y se suma 1 al tamaño de los nodos del camino.
+
+    Returns:
+        dict: La raíz del subárbol.
+    """
+    if node is None:
+        return new_node(k, v)
+    path = []
+    current = node
+    while True:
+        _cmp = cmp_func(k, current.key)
+        if _cmp == 0:
+            current.value = v
+            return node
+        path.append(current)
+        if _cmp < 0:
+            if current.left is None:
+                current.left = new_node(k, v)
+                break
+            current = current.left
         else:
-            _cmp = cmp_func(k, node["key"])
-            if _cmp < 0:
-                node["left"] = _put(node["left"], k, v, cmp_func)
-            elif _cmp > 0:
-                node["right"] = _put(node["right"], k, v, cmp_func)
-            else:
-                node["value"] = v
-        _left_n = _size(node["left"])
-        _right_n = _size(node["right"])
-        node["size"] = _left_n + _right_n + 1
-        return node
-    except Exception as exp:
-        error.reraise("bst", "_put()", exp)
+            if current.right is None:
+                current.right = new_node(k, v)
+                break
+            current = current.right
+    for ancestor in path:
+        ancestor.size += 1
+    return node
 
 
 def get(tree: dict, k: Any) -> dict:
     """Recupera un nodo del BST."""
     try:
-        _root = tree["root"]
-        _cmp = tree["cmp_func"]
-        result = _get(_root, k, _cmp)
-        return result["value"] if result is not None else None
+        result = _get(tree["root"], k, tree["cmp_func"])
+        return result.value if result is not None else None
     except Exception as exp:
-        error.reraise("bst", "get()", exp)
+        error.reraise(exp, "bst:get()")
 
 
 def _get(node: dict, k: Any, cmp_func: Callable) -> dict:
-    """Función recursiva para buscar un nodo en el BST."""
-    try:
-        _node = None
-        if node is not None:
-            _cmp = cmp_func(k, node["key"])
-            if _cmp == 0:
-                _node = node
-            elif _cmp < 0:
-                _node = _get(node["left"], k, cmp_func)
-            elif _cmp > 0:
-                _node = _get(node["right"], k, cmp_func)
-        return _node
-    except Exception as exp:
-        error.reraise("bst", "_get()", exp)
+    """Busca el nodo con la llave ``k`` bajando desde ``node``."""
+    while node is not None:
+        _cmp = cmp_func(k, node.key)
+        if _cmp == 0:
+            return node
+        node = node.left if _cmp < 0 else node.right
+    return None
 
 
 def remove(tree: dict, k: Any) -> dict:
     """Elimina un nodo del BST."""
     try:
-        _root = tree["root"]
-        _cmp = tree["cmp_func"]
-        tree["root"] = _remove(_root, k, _cmp)
+        tree["root"] = _remove(tree["root"], k, tree["cmp_func"])
         return tree
     except Exception as exp:
-        error.reraise("bst", "remove()", exp)
+        error.reraise(exp, "bst:remove()")
 
 
 def _remove(node: dict, k: Any, cmp_func: Callable) -> dict:
-    """Función recursiva para eliminar un nodo del BST."""
-    try:
-        if node is None:
-            return None
-        elif node is not None:
-            _cmp = cmp_func(k, node["key"])
-            if _cmp == 0:
-                if node["right"] is None:
-                    return node["left"]
-                elif node["left"] is None:
-                    return node["right"]
-                else:
-                    _node = node
-                    node = _min(node["right"])
-                    node["right"] = _delete_min(_node["right"])
-                    node["left"] = _node["left"]
-            elif _cmp < 0:
-                node["left"] = _remove(node["left"], k, cmp_func)
-            elif _cmp > 0:
-                node["right"] = _remove(node["right"], k, cmp_func)
-        _left_n = _size(node["left"])
-        _right_n = _size(node["right"])
-        node["size"] = _left_n + _right_n + 1
+    """Elimina la llave ``k`` del subárbol de ``node`` sin recursión.
+
+    Si el nodo tiene dos hijos, su sucesor (el mínimo del subárbol derecho)
+    toma su lugar.
+
+    Returns:
+        dict: La raíz del subárbol.
+    """
+    path = []
+    current = node
+    while current is not None:
+        _cmp = cmp_func(k, current.key)
+        if _cmp == 0:
+            break
+        path.append(current)
+        current = current.left if _cmp < 0 else current.right
+    if current is None:
         return node
-    except Exception as exp:
-        error.reraise("bst", "_remove()", exp)
+
+    if current.left is None:
+        replacement = current.right
+    elif current.right is None:
+        replacement = current.left
+    else:
+        # Se desprende el sucesor de su lugar, restando 1 a los tamaños de
+        # los nodos entre current.right y el padre del sucesor.
+        parent = current
+        replacement = current.right
+        while replacement.left is not None:
+            parent = replacement
+            replacement.size -= 1
+            replacement = replacement.left
+        if parent is not current:
+            parent.left = replacement.right
+            replacement.right = current.right
+        replacement.left = current.left
+        replacement.size = current.size - 1
+
+    for ancestor in path:
+        ancestor.size -= 1
+    if not path:
+        return replacement
+    parent = path[-1]
+    if parent.left is current:
+        parent.left = replacement
+    else:
+        parent.right = replacement
+    return node
 
 
 def contains(tree: dict, k: Any) -> bool:
     """Verifica si existe un nodo con la llave dada en el BST."""
     try:
-        _root = tree["root"]
-        _cmp = tree["cmp_func"]
-        _found = False
-        return _contains(_root, k, _cmp, _found)
+        return _get(tree["root"], k, tree["cmp_func"]) is not None
     except Exception as exp:
-        error.reraise("bst", "contains()", exp)
-
-
-def _contains(node: dict, k: Any, cmp_func: Callable, found: bool) -> bool:
-    """Función recursiva para verificar la existencia de un nodo en el BST."""
-    try:
-        if node is None:
-            return found
-        if node is not None:
-            _cmp = cmp_func(k, node["key"])
-            if _cmp == 0:
-                found = True
-            elif _cmp < 0:
-                found = _contains(node["left"], k, cmp_func, found)
-            elif _cmp > 0:
-                found = _contains(node["right"], k, cmp_func, found)
-        return found
-    except Exception as exp:
-        error.reraise("bst", "_contains()", exp)
+        error.reraise(exp, "bst:contains()")
 
 
 def size(tree: dict) -> int:
@@ -191,14 +254,14 @@ def size(tree: dict) -> int:
     try:
         return _size(tree["root"])
     except Exception as exp:
-        error.reraise("bst", "size()", exp)
+        error.reraise(exp, "bst:size()")
 
 
 def _size(node: dict) -> int:
-    """Función recursiva para contar el tamaño del BST."""
+    """Retorna el tamaño guardado en el nodo (0 si es ``None``)."""
     if node is None:
         return 0
-    return node["size"]
+    return node.size
 
 
 def is_empty(tree: dict) -> bool:
@@ -206,7 +269,7 @@ def is_empty(tree: dict) -> bool:
     try:
         return tree["root"] is None
     except Exception as exp:
-        error.reraise("bst", "is_empty()", exp)
+        error.reraise(exp, "bst:is_empty()")
 
 
 def get_min(tree: dict) -> dict:
@@ -214,45 +277,39 @@ def get_min(tree: dict) -> dict:
     try:
         _min_node = _min(tree["root"])
         if _min_node is not None:
-            return _min_node["key"]
+            return _min_node.key
         return None
     except Exception as exp:
-        error.reraise("bst", "min()", exp)
+        error.reraise(exp, "bst:min()")
 
 
 def _min(node: dict) -> dict:
-    """Función recursiva para obtener el nodo con la llave mínima."""
-    try:
-        if node is None:
-            return None
-        elif node["left"] is None:
-            return node
-        else:
-            return _min(node["left"])
-    except Exception as exp:
-        error.reraise("bst", "_min()", exp)
+    """Retorna el nodo con la llave mínima del subárbol."""
+    while node is not None and node.left is not None:
+        node = node.left
+    return node
 
 
 def delete_min(tree: dict) -> dict:
     """Elimina el nodo con la llave mínima del BST."""
     try:
-        return _delete_min(tree["root"])
+        tree["root"] = _delete_min(tree["root"])
+        return tree
     except Exception as exp:
-        error.reraise("bst", "delete_min()", exp)
+        error.reraise(exp, "bst:delete_min()")
 
 
 def _delete_min(node: dict) -> dict:
-    """Función recursiva para eliminar el nodo con la llave mínima."""
-    try:
-        if node is not None:
-            if node["left"] is None:
-                return node["right"]
-            else:
-                node["left"] = _delete_min(node["left"])
-            node["size"] = _size(node["left"]) + _size(node["right"]) + 1
-        return node
-    except Exception as exp:
-        error.reraise("bst", "_delete_min()", exp)
+    """Elimina el mínimo del subárbol de ``node`` y retorna su raíz."""
+    if node is None or node.left is None:
+        return None if node is None else node.right
+    parent = node
+    while parent.left.left is not None:
+        parent.size -= 1
+        parent = parent.left
+    parent.size -= 1
+    parent.left = parent.left.right
+    return node
 
 
 def get_max(tree: dict) -> dict:
@@ -260,110 +317,255 @@ def get_max(tree: dict) -> dict:
     try:
         _max_node = _max(tree["root"])
         if _max_node is not None:
-            return _max_node["key"]
+            return _max_node.key
         return None
     except Exception as exp:
-        error.reraise("bst", "max()", exp)
+        error.reraise(exp, "bst:max()")
 
 
 def _max(node: dict) -> dict:
-    """Función recursiva para obtener el nodo con la llave máxima."""
-    try:
-        if node is None:
-            return None
-        elif node["right"] is None:
-            return node
-        else:
-            return _max(node["right"])
-    except Exception as exp:
-        error.reraise("bst", "_max()", exp)
+    """Retorna el nodo con la llave máxima del subárbol."""
+    while node is not None and node.right is not None:
+        node = node.right
+    return node
 
 
 def delete_max(tree: dict) -> dict:
     """Elimina el nodo con la llave máxima del BST."""
     try:
-        return _delete_max(tree["root"])
+        tree["root"] = _delete_max(tree["root"])
+        return tree
     except Exception as exp:
-        error.reraise("bst", "delete_max()", exp)
+        error.reraise(exp, "bst:delete_max()")
 
 
 def _delete_max(node: dict) -> dict:
-    """Función recursiva para eliminar el nodo con la llave máxima."""
+    """Elimina el máximo del subárbol de ``node`` y retorna su raíz."""
+    if node is None or node.right is None:
+        return None if node is None else node.left
+    parent = node
+    while parent.right.right is not None:
+        parent.size -= 1
+        parent = parent.right
+    parent.size -= 1
+    parent.right = parent.right.left
+    return node
+
+
+def floor(tree: dict, k: Any) -> Any:
+    """Retorna la mayor llave del BST menor o igual a ``k``, o ``None`` si
+    no existe."""
+    try:
+        cmp_func = tree["cmp_func"]
+        node = tree["root"]
+        best = None
+        while node is not None:
+            _cmp = cmp_func(k, node.key)
+            if _cmp == 0:
+                return node.key
+            if _cmp < 0:
+                node = node.left
+            else:
+                best = node
+                node = node.right
+        return best.key if best is not None else None
+    except Exception as exp:
+        error.reraise(exp, "bst:floor()")
+
+
+def ceiling(tree: dict, k: Any) -> Any:
+    """Retorna la menor llave del BST mayor o igual a ``k``, o ``None`` si
+    no existe."""
+    try:
+        cmp_func = tree["cmp_func"]
+        node = tree["root"]
+        best = None
+        while node is not None:
+            _cmp = cmp_func(k, node.key)
+            if _cmp == 0:
+                return node.key
+            if _cmp > 0:
+                node = node.right
+            else:
+                best = node
+                node = node.left
+        return best.key if best is not None else None
+    except Exception as exp:
+        error.reraise(exp, "bst:ceiling()")
+
+
+def select(tree: dict, pos: int) -> Any:
+    """Retorna la llave de posición ``pos`` en el orden del BST.
+
+    Las posiciones empiezan en 0 (la llave mínima). Se usa el tamaño
+    guardado en cada nodo, así que el costo es proporcional a la altura.
+
+    Returns:
+        Any: La llave, o ``None`` si ``pos`` está fuera de ``[0, size)``.
+    """
+    try:
+        node = tree["root"]
+        if pos < 0 or pos >= _size(node):
+            return None
+        while node is not None:
+            left_n = _size(node.left)
+            if pos < left_n:
+                node = node.left
+            elif pos > left_n:
+                pos -= left_n + 1
+                node = node.right
+            else:
+                return node.key
+        return None
+    except Exception as exp:
+        error.reraise(exp, "bst:select()")
+
+
+def rank(tree: dict, k: Any) -> int:
+    """Retorna el número de llaves del BST estrictamente menores a ``k``.
+
+    Si ``k`` está en el árbol es su posición en :func:`select`.
+    """
+    try:
+        cmp_func = tree["cmp_func"]
+        node = tree["root"]
+        smaller = 0
+        while node is not None:
+            _cmp = cmp_func(k, node.key)
+            if _cmp < 0:
+                node = node.left
+            elif _cmp > 0:
+                smaller += _size(node.left) + 1
+                node = node.right
+            else:
+                return smaller + _size(node.left)
+        return smaller
+    except Exception as exp:
+        error.reraise(exp, "bst:rank()")
+
+
+def count_range(tree: dict, lo: Any, hi: Any) -> int:
+    """Retorna cuántas llaves del BST están en el rango ``[lo, hi]``, sin
+    recorrerlas: se calcula con :func:`rank`."""
     try:
-        # Implementación pendiente
-        pass
+        if tree["cmp_func"](lo, hi) > 0:
+            return 0
+        count = rank(tree, hi) - rank(tree, lo)
+        if contains(tree, hi):
+            count += 1
+        return count
     except Exception as exp:
-        error.reraise("bst", "_delete_max()", exp)
+        error.reraise(exp, "bst:count_range()")
 
 
 def height(tree: dict) -> int:
-    """Retorna la altura del BST."""
+    """Retorna la altura del BST: el número de nodos del camino más largo
+    desde la raíz (0 para un árbol vacío)."""
     try:
         return _height(tree["root"])
     except Exception as exp:
-        error.reraise("bst", "height()", exp)
+        error.reraise(exp, "bst:height()")
 
 
 def _height(node: dict) -> int:
-    try:
-        if node is None:
-            return -1
-        else:
-            left_h = _height(node["left"])
-            right_h = _height(node["right"])
-            return max(left_h, right_h) + 1
-    except Exception as exp:
-        error.reraise("bst", "_height()", exp)
+    """Cuenta los niveles del subárbol recorriéndolo por niveles."""
+    levels = 0
+    level = [node] if node is not None else []
+    while level:
+        levels += 1
+        next_level = []
+        for current in level:
+            if current.left is not None:
+                next_level.append(current.left)
+            if current.right is not None:
+                next_level.append(current.right)
+        level = next_level
+    return levels
 
 
 def keys(tree: dict, lo, hi) -> dict:
+    """Retorna una lista con las llaves en el rango ``[lo, hi]`` en orden."""
     try:
         keys_lt = sllt.new_list(cmpfunction = tree["cmp_func"])
-        _keys(tree["root"], keys_lt, tree["cmp_func"], lo, hi)
+        for node in _inorder(tree["root"], tree["cmp_func"], lo, hi):
+            sllt.add_last(keys_lt, node.key)
         return keys_lt
     except Exception as exp:
-        error.reraise("bst", "keys()", exp)
+        error.reraise(exp, "bst:keys()")
+
 
 def key_set(tree: dict) -> dict:
+    """Retorna una lista con todas las llaves del BST en orden."""
     keys_lt = sllt.new_list(cmpfunction = tree["cmp_func"])
-    height = _height(tree["root"])
-    _keys(tree["root"], keys_lt, tree["cmp_func"], 0, height)
+    for node in _inorder(tree["root"]):
+        sllt.add_last(keys_lt, node.key)
     return keys_lt
 
 
-def _keys(node: dict, keys_lt: dict, cmp_func: Callable, lo: Any, hi: Any ) -> None:
-    if node is None:
-        return
-    if cmp_func(lo, node["key"]) < 0:
-        _keys(node["left"], keys_lt, cmp_func, lo, hi)
-    if cmp_func(lo, node["key"]) <= 0 and cmp_func(hi, node["key"]) >= 0:
-        sllt.add_last(keys_lt, node["key"])
-    if cmp_func(hi, node["key"]) > 0:
-        _keys(node["right"], keys_lt, cmp_func, lo, hi)
-
-
 def values(tree: dict, lo: Any, hi: Any ) -> dict:
     """Retorna una lista de valores del BST."""
     try:
         values_lt = sllt.new_list(cmpfunction = tree["cmp_func"])
-        _values(tree["root"], values_lt, tree["cmp_func"], lo, hi)
+        for node in _inorder(tree["root"], tree["cmp_func"], lo, hi):
+            sllt.add_last(values_lt, node.value)
         return values_lt
     except Exception as exp:
-        error.reraise("bst", "values()", exp)
-        
+        error.reraise(exp, "bst:values()")
+
+
 def value_set(tree: dict) -> dict:
+    """Retorna una lista con todos los valores del BST, en el orden de las
+    llaves."""
     values_lt = sllt.new_list(cmpfunction = tree["cmp_func"])
-    height = _height(tree["root"])
-    _values(tree["root"], values_lt, tree["cmp_func"], 0, height)
+    for node in _inorder(tree["root"]):
+        sllt.add_last(values_lt, node.value)
     return values_lt
 
 
-def _values(node: dict, values_lt: dict, cmp_func: Callable, lo: Any, hi: Any) -> None:
-    if node is None:
-        return
-    if cmp_func(lo, node["key"]) < 0:
-        _values(node["left"], values_lt, cmp_func, lo, hi)
-    if cmp_func(lo, node["key"]) <= 0 and cmp_func(hi, node["key"]) >= 0:
-        sllt.add_last(values_lt, node["value"])
-    if cmp_func(hi, node["key"]) > 0:
-        _values(node["right"], values_lt, cmp_func, lo, hi)
\ No newline at end of file
+def iter_range(tree: dict, lo: Any = None, hi: Any = None,
+               reverse: bool = False):
+    """Recorre las parejas ``(llave, valor)`` con llaves en ``[lo, hi]``.
+
+    Es un generador: cada pareja se produce cuando se pide, con una pila
+    del tamaño de la altura del árbol, así que el primer resultado sale de
+    inmediato y el recorrido se puede detener en cualquier momento. Un
+    límite en ``None`` no acota ese lado del rango.
+
+    Args:
+        tree (dict): Árbol a recorrer.
+        lo (Any): Llave mínima del rango.
+        hi (Any): Llave máxima del rango.
+        reverse (bool): Si es ``True`` se recorre de mayor a menor.
+    """
+    for node in _inorder(tree["root"], tree["cmp_func"], lo, hi, reverse):
+        yield node.key, node.value
+
+
+def _inorder(node: dict, cmp_func: Callable = None, lo: Any = None,
+             hi: Any = None, reverse: bool = False):
+    """Recorre en orden los nodos del subárbol con una pila explícita.
+
+    Si se da ``cmp_func`` solo se visitan los nodos con llaves en
+    ``[lo, hi]`` (``None`` no acota), sin bajar a los subárboles que
+    quedan fuera del rango. Con ``reverse`` el orden es descendente.
+    """
+    if cmp_func is None:
+        lo = hi = None
+    # first/last: lado por el que se empieza y límite de ese lado
+    first, last = ("right", "left") if reverse else ("left", "right")
+    start, stop = (hi, lo) if reverse else (lo, hi)
+    sign = -1 if reverse else 1
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            if start is not None and sign * cmp_func(start, node.key) >= 0:
+                # Todo el subárbol de ese lado queda antes del rango
+                break
+            node = getattr(node, first)
+        node = stack.pop()
+        if stop is not None and sign * cmp_func(stop, node.key) < 0:
+            return
+        if start is None or sign * cmp_func(start, node.key) <= 0:
+            yield node
+        node = getattr(node, last)
@@ -2,6 +2,25 @@
 Estructura que contiene la información a guardar en un ``nodo`` de un árbol binario
 """
 
+from DataStructures.Utils.slotted import Slotted
+
+
+class BSTNode(Slotted):
+    """
+    Nodo de un árbol binario. Sus campos se leen como atributos
+    (``node.left``) o como en un diccionario (``node["left"]``).
+    """
+
+    __slots__ = ("key", "value", "size", "left", "right")
+    type = "BST"
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.size = 1
+        self.left = None
+        self.right = None
+
 
 def new_node(key, value):
     """
@@ -23,15 +42,7 @@ def new_node(key, value):
     :returns: Nodo creado
     :rtype: bst_node
     """
-    node = {
-        "key": key,
-        "value": value,
-        "size": 1,
-        "left": None,
-        "right": None,
-        "type": "BST",
-    }
-    return node
+    return BSTNode(key, value)
 
 
 def get_value(my_node):
@@ -46,7 +57,7 @@ def get_value(my_node):
     """
     value = None
     if my_node is not None:
-        value = my_node["value"]
+        value = my_node.value
     return value
 
 
@@ -62,5 +73,5 @@ def get_key(my_node):
     """
     key = None
     if my_node is not None:
-        key = my_node["key"]
+        key = my_node.key
     return key
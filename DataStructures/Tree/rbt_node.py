@@ -0,0 +1,97 @@
+"""
+Estructura que contiene la información a guardar en un ``nodo`` de un árbol rojo-negro
+"""
+
+from DataStructures.Utils.slotted import Slotted
+
+RED = 0
+BLACK = 1
+
+
+class RBTNode(Slotted):
+    """
+    Nodo de un árbol rojo-negro. Sus campos se leen como atributos
+    (``node.left``) o como en un diccionario (``node["left"]``).
+    """
+
+    __slots__ = ("key", "value", "size", "left", "right", "color")
+    type = "RBT"
+
+    def __init__(self, key, value, color):
+        self.key = key
+        self.value = value
+        self.size = 1
+        self.left = None
+        self.right = None
+        self.color = color
+
+
+def new_node(key, value, color=RED):
+    """
+    Crea una nueva entrada (de tipo :ref:`rbt_node<rbt-node>`) de un árbol rojo-negro con una llave y un valor dados.
+
+    Se crea un nodo con los siguientes atributos:
+    - **key**: Llave del nodo
+    - **value**: Valor del nodo
+    - **size**: Tamaño del nodo. Inicializado en 1
+    - **left**: Hijo izquierdo del nodo. Inicializado en ``None``
+    - **right**: Hijo derecho del nodo. Inicializado en ``None``
+    - **color**: Color del enlace que llega al nodo (``RED`` o ``BLACK``). Inicializado en ``RED``
+    - **type**: Tipo de árbol. Inicializado en "RBT"
+
+    :param key: Llave del nodo
+    :type key: any
+    :param value: Valor del nodo
+    :type value: any
+    :param color: Color del nodo
+    :type color: int
+
+    :returns: Nodo creado
+    :rtype: rbt_node
+    """
+    return RBTNode(key, value, color)
+
+
+def is_red(my_node):
+    """
+    Informa si un nodo es rojo. Un nodo ``None`` se considera negro.
+
+    :param my_node: El nodo a revisar
+    :type my_node: rbt_node
+
+    :returns: ``True`` si el nodo es rojo
+    :rtype: bool
+    """
+    return my_node is not None and my_node.color == RED
+
+
+def get_value(my_node):
+    """
+    Obtiene el valor ``value`` de un nodo recibido.
+
+    :param my_node: El nodo con la información
+    :type my_node: rbt_node
+
+    :returns: El valor almacenado en el nodo
+    :rtype: any
+    """
+    value = None
+    if my_node is not None:
+        value = my_node.value
+    return value
+
+
+def get_key(my_node):
+    """
+    Obtiene la llave ``key`` de un nodo recibido.
+
+    :param my_node: El nodo con la información
+    :type my_node: rbt_node
+
+    :returns: La llave almacenada en el nodo
+    :rtype: any
+    """
+    key = None
+    if my_node is not None:
+        key = my_node.key
+    return key
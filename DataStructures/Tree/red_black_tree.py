@@ -0,0 +1,399 @@
+"""
+Module to handle a left-leaning red-black tree (rbt) data structure.
+
+Ofrece las mismas funciones que ``binary_search_tree`` (``new_map``, ``put``,
+``get``, ``remove``, ``get_min``, ``get_max``, ``keys``, ``values``,
+``height``...), pero el árbol se mantiene balanceado: su altura es a lo sumo
+``2 log2(n + 1)`` aunque las llaves lleguen ordenadas.
+
+This code is based on the implementation proposed by the following authors/books:
+    #. Algorithms, 4th Edition, Robert Sedgewick and Kevin Wayne.
+"""
+
+from typing import Any, Callable
+
+from DataStructures.List import single_linked_list as sllt
+from DataStructures.Utils import error
+
+from .rbt_node import new_node, is_red, RED, BLACK
+
+
+def dflt_tree_node_cmp(key1: Any, key2: Any) -> int:
+    """Función de comparación por defecto para los nodos del RBT.
+
+    Returns:
+        int: -1 si key1 < key2, 0 si key1 == key2, 1 si key1 > key2
+    """
+    if key1 == key2:
+        return 0
+    elif key1 < key2:
+        return -1
+    else:
+        return 1
+
+
+def new_map(cmp_func=dflt_tree_node_cmp) -> dict:
+    """Crea un nuevo árbol rojo-negro (RBT) vacío.
+
+    Returns:
+        dict: Diccionario que representa el RBT.
+    """
+    try:
+        return dict(
+            root=None,
+            cmp_func=cmp_func if cmp_func is not None else dflt_tree_node_cmp,
+            _type="RBT"
+        )
+    except Exception as exp:
+        error.reraise(exp, "rbt:new_map()")
+
+
+# ---------------------------------------------------------------------------
+# Operaciones de balanceo
+# ---------------------------------------------------------------------------
+
+def _size(node: dict) -> int:
+    if node is None:
+        return 0
+    return node.size
+
+
+def _rotate_left(node: dict) -> dict:
+    """Convierte un enlace rojo a la derecha en uno a la izquierda."""
+    x = node.right
+    node.right = x.left
+    x.left = node
+    x.color = node.color
+    node.color = RED
+    x.size = node.size
+    node.size = _size(node.left) + _size(node.right) + 1
+    return x
+
+
+def _rotate_right(node: dict) -> dict:
+    """Convierte un enlace rojo a la izquierda en uno a la derecha."""
+    x = node.left
+    node.left = x.right
+    x.right = node
+    x.color = node.color
+    node.color = RED
+    x.size = node.size
+    node.size = _size(node.left) + _size(node.right) + 1
+    return x
+
+
+def _flip_colors(node: dict) -> None:
+    """Invierte el color de un nodo y de sus dos hijos."""
+    node.color = 1 - node.color
+    node.left.color = 1 - node.left.color
+    node.right.color = 1 - node.right.color
+
+
+def _move_red_left(node: dict) -> dict:
+    # El hijo izquierdo y su hijo izquierdo son negros: se presta un nodo
+    # del hermano derecho para que el camino a la izquierda tenga un rojo.
+    _flip_colors(node)
+    if is_red(node.right.left):
+        node.right = _rotate_right(node.right)
+        node = _rotate_left(node)
+        _flip_colors(node)
+    return node
+
+
+def _move_red_right(node: dict) -> dict:
+    _flip_colors(node)
+    if is_red(node.left.left):
+        node = _rotate_right(node)
+        _flip_colors(node)
+    return node
+
+
+def _balance(node: dict) -> dict:
+    """Restablece las invariantes del árbol al subir por el camino."""
+    if is_red(node.right) and not is_red(node.left):
+        node = _rotate_left(node)
+    if is_red(node.left) and is_red(node.left.left):
+        node = _rotate_right(node)
+    if is_red(node.left) and is_red(node.right):
+        _flip_colors(node)
+    node.size = _size(node.left) + _size(node.right) + 1
+    return node
+
+
+# ---------------------------------------------------------------------------
+# Inserción, búsqueda y borrado
+# ---------------------------------------------------------------------------
+
+def put(tree: dict, k: Any, v: Any) -> dict:
+    """Agrega una pareja llave-valor al RBT, o reemplaza el valor si la
+    llave ya existe.
+
+    Args:
+        tree (dict): Árbol en el que se inserta.
+        k (Any): Llave del nodo.
+        v (Any): Valor del nodo.
+
+    Returns:
+        dict: El árbol.
+    """
+    try:
+        tree["root"] = _put(tree["root"], k, v, tree["cmp_func"])
+        tree["root"].color = BLACK
+        return tree
+    except Exception as exp:
+        error.reraise(exp, "rbt:put()")
+
+
+def _put(node: dict, k: Any, v: Any, cmp_func: Callable) -> dict:
+    if node is None:
+        return new_node(k, v, RED)
+    _cmp = cmp_func(k, node.key)
+    if _cmp < 0:
+        node.left = _put(node.left, k, v, cmp_func)
+    elif _cmp > 0:
+        node.right = _put(node.right, k, v, cmp_func)
+    else:
+        node.value = v
+    return _balance(node)
+
+
+def _get_node(tree: dict, k: Any) -> dict:
+    node = tree["root"]
+    cmp_func = tree["cmp_func"]
+    while node is not None:
+        _cmp = cmp_func(k, node.key)
+        if _cmp == 0:
+            return node
+        node = node.left if _cmp < 0 else node.right
+    return None
+
+
+def get(tree: dict, k: Any) -> Any:
+    """Retorna el valor asociado a la llave ``k``, o ``None`` si no está."""
+    try:
+        node = _get_node(tree, k)
+        return node.value if node is not None else None
+    except Exception as exp:
+        error.reraise(exp, "rbt:get()")
+
+
+def contains(tree: dict, k: Any) -> bool:
+    """Verifica si existe un nodo con la llave dada en el RBT."""
+    try:
+        return _get_node(tree, k) is not None
+    except Exception as exp:
+        error.reraise(exp, "rbt:contains()")
+
+
+def remove(tree: dict, k: Any) -> dict:
+    """Elimina la pareja asociada a la llave ``k``, si existe.
+
+    Returns:
+        dict: El árbol.
+    """
+    try:
+        if _get_node(tree, k) is None:
+            return tree
+        root = tree["root"]
+        if not is_red(root.left) and not is_red(root.right):
+            root.color = RED
+        tree["root"] = _remove(root, k, tree["cmp_func"])
+        if tree["root"] is not None:
+            tree["root"].color = BLACK
+        return tree
+    except Exception as exp:
+        error.reraise(exp, "rbt:remove()")
+
+
+def _remove(node: dict, k: Any, cmp_func: Callable) -> dict:
+    # La llave está en el subárbol de ``node``
+    if cmp_func(k, node.key) < 0:
+        if not is_red(node.left) and not is_red(node.left.left):
+            node = _move_red_left(node)
+        node.left = _remove(node.left, k, cmp_func)
+    else:
+        if is_red(node.left):
+            node = _rotate_right(node)
+        if cmp_func(k, node.key) == 0 and node.right is None:
+            return None
+        if not is_red(node.right) and not is_red(node.right.left):
+            node = _move_red_right(node)
+        if cmp_func(k, node.key) == 0:
+            successor = _min(node.right)
+            node.key = successor.key
+            node.value = successor.value
+            node.right = _delete_min(node.right)
+        else:
+            node.right = _remove(node.right, k, cmp_func)
+    return _balance(node)
+
+
+def size(tree: dict) -> int:
+    """Retorna el número de parejas del RBT."""
+    return _size(tree["root"])
+
+
+def is_empty(tree: dict) -> bool:
+    """Verifica si el RBT está vacío."""
+    return tree["root"] is None
+
+
+# ---------------------------------------------------------------------------
+# Mínimo y máximo
+# ---------------------------------------------------------------------------
+
+def _min(node: dict) -> dict:
+    while node is not None and node.left is not None:
+        node = node.left
+    return node
+
+
+def _max(node: dict) -> dict:
+    while node is not None and node.right is not None:
+        node = node.right
+    return node
+
+
+def get_min(tree: dict) -> Any:
+    """Retorna la llave mínima del RBT, o ``None`` si está vacío."""
+    node = _min(tree["root"])
+    return node.key if node is not None else None
+
+
+def get_max(tree: dict) -> Any:
+    """Retorna la llave máxima del RBT, o ``None`` si está vacío."""
+    node = _max(tree["root"])
+    return node.key if node is not None else None
+
+
+def delete_min(tree: dict) -> dict:
+    """Elimina la pareja con la llave mínima del RBT."""
+    try:
+        root = tree["root"]
+        if root is None:
+            return tree
+        if not is_red(root.left) and not is_red(root.right):
+            root.color = RED
+        tree["root"] = _delete_min(root)
+        if tree["root"] is not None:
+            tree["root"].color = BLACK
+        return tree
+    except Exception as exp:
+        error.reraise(exp, "rbt:delete_min()")
+
+
+def _delete_min(node: dict) -> dict:
+    if node.left is None:
+        return None
+    if not is_red(node.left) and not is_red(node.left.left):
+        node = _move_red_left(node)
+    node.left = _delete_min(node.left)
+    return _balance(node)
+
+
+def delete_max(tree: dict) -> dict:
+    """Elimina la pareja con la llave máxima del RBT."""
+    try:
+        root = tree["root"]
+        if root is None:
+            return tree
+        if not is_red(root.left) and not is_red(root.right):
+            root.color = RED
+        tree["root"] = _delete_max(root)
+        if tree["root"] is not None:
+            tree["root"].color = BLACK
+        return tree
+    except Exception as exp:
+        error.reraise(exp, "rbt:delete_max()")
+
+
+def _delete_max(node: dict) -> dict:
+    if is_red(node.left):
+        node = _rotate_right(node)
+    if node.right is None:
+        return None
+    if not is_red(node.right) and not is_red(node.right.left):
+        node = _move_red_right(node)
+    node.right = _delete_max(node.right)
+    return _balance(node)
+
+
+# ---------------------------------------------------------------------------
+# Altura y recorridos
+# ---------------------------------------------------------------------------
+
+def height(tree: dict) -> int:
+    """Retorna la altura del RBT: el número de nodos del camino más largo
+    desde la raíz (0 para un árbol vacío)."""
+    return _height(tree["root"])
+
+
+def _height(node: dict) -> int:
+    if node is None:
+        return 0
+    return max(_height(node.left), _height(node.right)) + 1
+
+
+def keys(tree: dict, lo: Any, hi: Any) -> dict:
+    """Retorna una lista con las llaves en el rango ``[lo, hi]`` en orden.
+
+    Solo se visitan los subárboles que pueden tener llaves del rango, así
+    que el costo es O(log n + k), con k el número de llaves retornadas.
+    """
+    try:
+        keys_lt = sllt.new_list(cmpfunction=tree["cmp_func"])
+        _range(tree["root"], tree["cmp_func"], lo, hi,
+               lambda node: sllt.add_last(keys_lt, node.key))
+        return keys_lt
+    except Exception as exp:
+        error.reraise(exp, "rbt:keys()")
+
+
+def values(tree: dict, lo: Any, hi: Any) -> dict:
+    """Retorna una lista con los valores de las llaves en ``[lo, hi]``,
+    en el orden de las llaves."""
+    try:
+        values_lt = sllt.new_list(cmpfunction=tree["cmp_func"])
+        _range(tree["root"], tree["cmp_func"], lo, hi,
+               lambda node: sllt.add_last(values_lt, node.value))
+        return values_lt
+    except Exception as exp:
+        error.reraise(exp, "rbt:values()")
+
+
+def _range(node: dict, cmp_func: Callable, lo: Any, hi: Any,
+           visit: Callable) -> None:
+    if node is None:
+        return
+    cmp_lo = cmp_func(lo, node.key)
+    cmp_hi = cmp_func(hi, node.key)
+    if cmp_lo < 0:
+        _range(node.left, cmp_func, lo, hi, visit)
+    if cmp_lo <= 0 and cmp_hi >= 0:
+        visit(node)
+    if cmp_hi > 0:
+        _range(node.right, cmp_func, lo, hi, visit)
+
+
+def key_set(tree: dict) -> dict:
+    """Retorna una lista con todas las llaves del RBT en orden."""
+    keys_lt = sllt.new_list(cmpfunction=tree["cmp_func"])
+    _inorder(tree["root"], lambda node: sllt.add_last(keys_lt, node.key))
+    return keys_lt
+
+
+def value_set(tree: dict) -> dict:
+    """Retorna una lista con todos los valores del RBT, en el orden de las
+    llaves."""
+    values_lt = sllt.new_list(cmpfunction=tree["cmp_func"])
+    _inorder(tree["root"],
+             lambda node: sllt.add_last(values_lt, node.value))
+    return values_lt
+
+
+def _inorder(node: dict, visit: Callable) -> None:
+    if node is None:
+        return
+    _inorder(node.left, visit)
+    visit(node)
+    _inorder(node.right, visit)
@@ -0,0 +1,41 @@
+"""
+  Base para los nodos de las estructuras de datos (nodos de listas
+  encadenadas, de árboles y entradas de montículos).
+
+  Un diccionario por nodo ocupa más de 100 bytes aunque solo guarde un par de
+  campos. Los nodos que heredan de :class:`Slotted` declaran sus campos en
+  ``__slots__``, de modo que cada instancia solo reserva espacio para ellos.
+
+  Para no romper el código que trata los nodos como diccionarios, los campos
+  también se pueden leer y escribir con subíndices (``node["next"]``). Dentro
+  de las estructuras se usa el acceso por atributo (``node.next``), que es
+  más rápido.
+"""
+
+
+class Slotted:
+    """
+    Clase base de los nodos con ``__slots__`` que se pueden usar como
+    diccionarios.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __setitem__(self, field, value):
+        try:
+            setattr(self, field, value)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __contains__(self, field):
+        return hasattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field, default)
+